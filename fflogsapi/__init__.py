@@ -13,14 +13,22 @@ The entire API should be accessible through the client. If you want typing, feel
 names from the relevant subpackages.
 '''
 
+from .batch import FFLogsQueryBatch
 from .client import FFLogsClient
 from .constants import TIMESTAMP_PRECISION, EventType, FightDifficulty, PartySize
+from .ratelimit import FFLogsRateLimiter
 from .util.gql_enums import GQLEnum
 
 __all__ = [
     # client.py
     'FFLogsClient',
 
+    # batch.py
+    'FFLogsQueryBatch',
+
+    # ratelimit.py
+    'FFLogsRateLimiter',
+
     # constants.py
     'FightDifficulty',
     'PartySize',
@@ -0,0 +1,55 @@
+'''
+Asynchronous (asyncio) variant of the FF Logs API client.
+
+The asynchronous client requires ``aiohttp``, which can be installed with the ``async`` extra:
+
+```shell
+pip install fflogsapi[async]
+```
+'''
+
+from .batch import AsyncFFLogsQueryBatch
+from .character import AsyncFFLogsCharacter
+from .client import AsyncFFLogsClient
+from .fight import AsyncFFLogsFight
+from .guild import AsyncFFLogsGuild
+from .page import AsyncFFLogsPage, AsyncFFLogsPaginationIterator
+from .report import AsyncFFLogsReport
+from .user import AsyncFFLogsUser
+from .world import (AsyncFFLogsEncounter, AsyncFFLogsExpansion, AsyncFFLogsRegion,
+                    AsyncFFLogsServer, AsyncFFLogsSubregion, AsyncFFLogsZone,)
+
+__all__ = [
+    # client.py
+    'AsyncFFLogsClient',
+
+    # batch.py
+    'AsyncFFLogsQueryBatch',
+
+    # report.py
+    'AsyncFFLogsReport',
+
+    # fight.py
+    'AsyncFFLogsFight',
+
+    # character.py
+    'AsyncFFLogsCharacter',
+
+    # user.py
+    'AsyncFFLogsUser',
+
+    # guild.py
+    'AsyncFFLogsGuild',
+
+    # world.py
+    'AsyncFFLogsEncounter',
+    'AsyncFFLogsExpansion',
+    'AsyncFFLogsZone',
+    'AsyncFFLogsRegion',
+    'AsyncFFLogsSubregion',
+    'AsyncFFLogsServer',
+
+    # page.py
+    'AsyncFFLogsPage',
+    'AsyncFFLogsPaginationIterator',
+]
@@ -0,0 +1,51 @@
+import asyncio
+
+from gql.transport.exceptions import TransportQueryError
+
+from ..batch import BaseFFLogsQueryBatch, FFLogsBatchedQuery
+from ..util.batching import merge_queries, split_result
+
+
+class AsyncFFLogsQueryBatch(BaseFFLogsQueryBatch):
+    '''
+    Asynchronous version of :class:`fflogsapi.batch.FFLogsQueryBatch`.
+
+    Chunks of merged queries are executed concurrently. Use
+    :func:`fflogsapi.aio.AsyncFFLogsClient.batch` to create query batches.
+    '''
+
+    async def __aenter__(self) -> 'AsyncFFLogsQueryBatch':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.execute()
+
+    async def _execute_chunk(self, chunk: list[FFLogsBatchedQuery]) -> None:
+        '''
+        INTERNAL
+        Execute a chunk of queries in a single request.
+        '''
+        if len(chunk) > 1:
+            try:
+                result = await self._client._execute(merge_queries([b.query for b in chunk]))
+            except TransportQueryError:
+                # a GraphQL error in one of the queries, find out which one below
+                pass
+            else:
+                for batched, query_result in zip(chunk, split_result(result, len(chunk))):
+                    self._store(batched, query_result)
+                return
+
+        for batched in chunk:
+            self._store(batched, await self._client._execute(batched.query))
+
+    async def execute(self) -> None:
+        '''
+        Execute all queries in the batch that have not been executed yet.
+
+        This is done automatically when leaving the batch's ``async with`` block.
+        '''
+        await self._client.connect()
+        await asyncio.gather(*[self._execute_chunk(chunk) for chunk in self._pending_chunks()])
+        self._finish()
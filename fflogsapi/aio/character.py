@@ -0,0 +1,264 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..characters.queries import Q_CHARACTER_DATA
+from ..data import (FFJob, FFLogsAllStarsRanking, FFLogsEncounterRankings, FFLogsFightRank,
+                    FFLogsZoneEncounterRanking, FFLogsZoneRanking,)
+from ..util.decorators import async_fetch_data
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+    from .guild import AsyncFFLogsGuild
+    from .world import AsyncFFLogsServer, AsyncFFLogsZone
+
+
+class AsyncFFLogsCharacter:
+    '''
+    Asynchronous representation of a character on FFLogs.
+
+    Unlike :class:`fflogsapi.characters.FFLogsCharacter`, the ID of the character must be known
+    when instantiating it. Use :func:`AsyncFFLogsClient.get_character` to find characters by
+    other filters.
+
+    See :class:`fflogsapi.characters.FFLogsCharacter` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['characterData', 'character']
+
+    id: int = -1
+    ''' The ID of the character '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self.filters = {'id': id}
+        self._client = client
+        self._data = {'id': id}
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a character
+        '''
+        filters = construct_filter_string(self.filters)
+        return Q_CHARACTER_DATA.format(
+            filters=filters,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a character
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('lodestoneID')
+    async def lodestone_id(self) -> int:
+        '''
+        Returns:
+            The character's Lodestone ID.
+        '''
+        return self._data['lodestoneID']
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The character's name.
+        '''
+        return self._data['name']
+
+    async def server(self) -> 'AsyncFFLogsServer':
+        '''
+        Returns:
+            The character's server.
+        '''
+        from .world import AsyncFFLogsServer
+        server_id = (await self._query_data('server{ id }'))['server']['id']
+        return AsyncFFLogsServer(id=server_id, client=self._client)
+
+    @async_fetch_data('guildRank')
+    async def fc_rank(self) -> str:
+        '''
+        Returns:
+            The character's FC rank.
+        '''
+        return self._data['guildRank']
+
+    async def guilds(self) -> list['AsyncFFLogsGuild']:
+        '''
+        Returns:
+            A list of guilds the character is in.
+        '''
+        from .guild import AsyncFFLogsGuild
+        guilds = (await self._query_data('guilds{ id }'))['guilds']
+        return [AsyncFFLogsGuild(id=guild['id'], client=self._client) for guild in guilds]
+
+    async def game_data(self, filters: dict = {}) -> dict:
+        '''
+        Args:
+            filters: Filter game data to a specific `specID` or force an update by the API with
+                     `forceUpdate`.
+        Returns:
+            The character's game data.
+        '''
+        filters = construct_filter_string(filters)
+        if filters:
+            filters = f'({filters})'
+
+        result = await self._query_data(f'gameData{filters}')
+        return result['gameData']
+
+    @async_fetch_data('hidden')
+    async def hidden(self) -> bool:
+        '''
+        Returns:
+            True if the rankings are hidden, False otherwise.
+        '''
+        return self._data['hidden']
+
+    async def encounter_rankings(self, filters: dict[str, Any] = {}) -> FFLogsEncounterRankings:
+        '''
+        Get this character's rankings for a specific encounter. `encounterID` is mandatory.
+
+        Args:
+            filters: Key-value filters to filter the rankings by. E.g. job name, encounter ID, etc.
+        Returns:
+            The character's filtered ranking data.
+        '''
+        filters = construct_filter_string(filters)
+        if filters:
+            filters = f'({filters})'
+
+        result = (await self._query_data(f'encounterRankings{filters}'))['encounterRankings']
+        from .guild import AsyncFFLogsGuild
+        from .report import AsyncFFLogsReport
+        from .world import AsyncFFLogsZone
+        jobs = await self._client.jobs_by_slug()
+        ranks = []
+        for rank in result['ranks']:
+            report = AsyncFFLogsReport(code=rank['report']['code'], client=self._client)
+            fight = await report.fight(id=rank['report']['fightID'])
+
+            guild = None
+            if rank['guild']['id']:
+                guild = AsyncFFLogsGuild(id=rank['guild']['id'], client=self._client)
+
+            job = jobs[rank['spec']]
+            best_job = jobs[rank['bestSpec']]
+
+            ranks.append(FFLogsFightRank(
+                locked_in=rank['lockedIn'],
+                bracket_data=str(rank['bracketData']),
+                fight=fight,
+                guild=guild,
+                job=job,
+                best_job=best_job,
+                rank_percent=rank['rankPercent'],
+                rank_total_parses=rank['rankTotalParses'],
+                historical_percent=rank['historicalPercent'],
+                historical_total_parses=rank['historicalTotalParses'],
+                today_percent=rank['todayPercent'],
+                today_total_parses=rank['todayTotalParses'],
+                adps=rank.get('aDPS'),
+                rdps=rank.get('rDPS'),
+                ndps=rank.get('nDPS'),
+                pdps=rank.get('pDPS'),
+            ))
+
+        return FFLogsEncounterRankings(
+            zone=AsyncFFLogsZone(id=result['zone'], client=self._client),
+            difficulty=result['difficulty'],
+            metric=result['metric'],
+            best_amount=result['bestAmount'],
+            median_performance=result['medianPerformance'],
+            average_performance=result['averagePerformance'],
+            kills=result['totalKills'],
+            fastest_kill=result['fastestKill'],
+            ranks=ranks,
+        )
+
+    async def _make_all_stars_ranking(
+            self,
+            data: dict,
+            zone: 'AsyncFFLogsZone' = None,
+            job: Optional[FFJob] = None,
+    ) -> FFLogsAllStarsRanking:
+        '''
+        Turn JSON data into an all-stars ranking dataclass
+        '''
+        jobs = await self._client.jobs_by_slug()
+        if not job and 'spec' in data:
+            job = jobs[data['spec']]
+
+        partitions = await zone.partitions()
+        return FFLogsAllStarsRanking(
+            job=job,
+            partition=next(filter(lambda p: p.id == data['partition'], partitions)),
+            points=data['points'],
+            possible_points=data['possiblePoints'],
+            rank=data['rank'],
+            region_rank=data['regionRank'],
+            server_rank=data['serverRank'],
+            rank_percent=data['rankPercent'],
+            total=data['total']
+        )
+
+    async def zone_rankings(self, filters: dict[str, Any] = {}) -> FFLogsZoneRanking:
+        '''
+        Get this character's rankings for a zone (boss).
+
+        Args:
+            filters: Key-value filters to filter the rankings by. E.g. job name, zone ID, etc.
+        Returns:
+            The character's filtered ranking data.
+        '''
+        filters = construct_filter_string(filters)
+        if filters:
+            filters = f'({filters})'
+
+        result = (await self._query_data(f'zoneRankings{filters}'))['zoneRankings']
+        from .world import AsyncFFLogsEncounter, AsyncFFLogsZone
+        zone = AsyncFFLogsZone(id=result['zone'], client=self._client)
+        jobs = await self._client.jobs_by_slug()
+        encounters = []
+        for rank in result['rankings']:
+            # KeyError is from the job lookups on null rankings
+            # StopIteration is from the allstars ranking construction
+            try:
+                encounter = AsyncFFLogsEncounter(id=rank['encounter']['id'], client=self._client)
+                job = jobs[rank['spec']]
+                best_job = jobs[rank['bestSpec']]
+
+                encounters.append(FFLogsZoneEncounterRanking(
+                    locked_in=rank['lockedIn'],
+                    encounter=encounter,
+                    rank_percent=rank['rankPercent'],
+                    median_percent=rank['medianPercent'],
+                    best_amount=rank['bestAmount'],
+                    fastest_kill=rank['fastestKill'],
+                    kills=rank['totalKills'],
+                    job=job,
+                    best_job=best_job,
+                    all_stars=await self._make_all_stars_ranking(
+                        rank['allStars'],
+                        zone=zone,
+                        job=job,
+                    ),
+                ))
+            except (KeyError, StopIteration):
+                continue
+
+        return FFLogsZoneRanking(
+            zone=zone,
+            encounter_ranks=encounters,
+            metric=result['metric'],
+            difficulty=result['difficulty'],
+            best_performance_avg=result['bestPerformanceAverage'],
+            median_performance_avg=result['medianPerformanceAverage'],
+            all_stars=[
+                await self._make_all_stars_ranking(alls, zone=zone)
+                for alls in result['allStars']
+            ],
+        )
@@ -0,0 +1,377 @@
+'''
+The asyncio client implementation that allows concurrent communication with the FF Logs API.
+'''
+
+import asyncio
+from functools import wraps
+from typing import Any, Iterable, Optional, Union
+
+from gql import Client as GQLClient
+from gql import gql
+from gql.transport.aiohttp import AIOHTTPTransport
+
+from ..cache import CacheBackend
+from ..client import BaseFFLogsClient
+from ..ratelimit import FFLogsRateLimiter, is_low_priority
+from ..user_auth import UserModeAuthMixin
+from ..world.snapshot import FFLogsWorldSnapshot
+from .batch import AsyncFFLogsQueryBatch
+from .client_extensions import (AsyncCharactersMixin, AsyncGameDataMixin, AsyncGuildsMixin,
+                                AsyncReportsMixin, AsyncWorldMixin,)
+
+
+def async_ensure_token(func):
+    '''
+    Ensures the given coroutine has a valid OAuth token.
+
+    Concurrent coroutines that fail with the same stale token will only refresh it once.
+    '''
+    @wraps(func)
+    async def ensured(*args, **kwargs):
+        self = args[0]
+        if not self.token:
+            await self._async_refresh_token(stale_token=self.token)
+
+        token = self.token
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            await self._async_refresh_token(stale_token=token)
+            return await func(*args, **kwargs)
+    return ensured
+
+
+class AsyncFFLogsClient(
+    UserModeAuthMixin,
+    AsyncReportsMixin,
+    AsyncCharactersMixin,
+    AsyncGuildsMixin,
+    AsyncWorldMixin,
+    AsyncGameDataMixin,
+    BaseFFLogsClient,
+):
+    '''
+    An asyncio client capable of communicating with the FF Logs V2 GraphQL API.
+
+    The asynchronous client mirrors :class:`fflogsapi.FFLogsClient`, but all methods that
+    communicate with the API are coroutines. This allows many queries, e.g. for hundreds of fights,
+    to be executed concurrently over a single event loop and HTTP session. All queries share the
+    client's query cache, and concurrent executions of an identical query are only sent to the API
+    once.
+
+    The client should be used as an asynchronous context manager, or be closed with
+    :func:`close` when you are done using it:
+
+    .. code-block:: python
+
+        async with AsyncFFLogsClient(CLIENT_ID, CLIENT_SECRET) as client:
+            report = client.get_report('rGARYmQwTKbahXz9')
+            names = await asyncio.gather(*[f.name() for f in await report.fights()])
+
+    Args:
+        max_concurrency: The maximum amount of requests that can be in flight at the same time.
+
+    For the remaining arguments, see :class:`fflogsapi.FFLogsClient`.
+
+    Raises:
+        ValueError if the provided client mode is invalid.
+    '''
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        mode: str = 'client',
+        enable_caching: bool = True,
+        cache_directory: str = './fflogs-querycache',
+        cache_expiry: int = 86400,
+        cache_override: str = '',
+        ignore_cache_expiry: bool = False,
+        clean_cache: bool = True,
+        cache_backend: Optional[CacheBackend] = None,
+        copy_results: bool = True,
+        world_snapshot: Optional[Union[str, FFLogsWorldSnapshot]] = None,
+        rate_limiter: Optional[FFLogsRateLimiter] = None,
+        max_concurrency: int = 16,
+    ) -> None:
+        super().__init__(
+            client_id=client_id,
+            client_secret=client_secret,
+            mode=mode,
+            enable_caching=enable_caching,
+            cache_directory=cache_directory,
+            cache_expiry=cache_expiry,
+            cache_override=cache_override,
+            ignore_cache_expiry=ignore_cache_expiry,
+            clean_cache=clean_cache,
+            cache_backend=cache_backend,
+            copy_results=copy_results,
+            world_snapshot=world_snapshot,
+            rate_limiter=rate_limiter,
+        )
+
+        self.max_concurrency = max_concurrency
+        self._transport = AIOHTTPTransport(url=self._endpoint)
+        self._gql_client = GQLClient(transport=self._transport, fetch_schema_from_transport=True)
+        self._session = None
+        self._in_flight = {}
+
+        # asyncio primitives are bound to the running event loop, so they are created on connect
+        self._connect_lock = None
+        self._token_lock = None
+        self._rate_limit_lock = None
+        self._request_semaphore = None
+
+    async def __aenter__(self) -> 'AsyncFFLogsClient':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        '''
+        Open the HTTP session used to communicate with the FF Logs API.
+
+        This is done automatically on the first query, so you usually do not need to call this.
+        '''
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+            self._token_lock = asyncio.Lock()
+            self._rate_limit_lock = asyncio.Lock()
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._connect_lock:
+            if self._session is None:
+                self._session = await self._open_session()
+
+    @async_ensure_token
+    async def _open_session(self) -> Any:
+        '''
+        INTERNAL
+        Open the GraphQL session. The schema is fetched when connecting, which must be authorized.
+        '''
+        self._transport.headers = self._auth_headers()
+        return await self._gql_client.connect_async()
+
+    async def close(self) -> None:
+        '''
+        Close the OAuth and HTTP sessions with the FF Logs API
+        '''
+        self.oauth_session.close()
+        if self._session is not None:
+            await self._gql_client.close_async()
+            self._session = None
+
+    async def _async_refresh_token(self, stale_token: dict) -> None:
+        '''
+        INTERNAL
+        Fetch a new OAuth token, unless another coroutine already replaced the stale token.
+        '''
+        async with self._token_lock:
+            if self.token and self.token is not stale_token:
+                return
+            # fetching the token is blocking, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._refresh_token)
+
+    async def _execute(self, query: str) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Execute a query against the API, bypassing the query cache. If the client has a rate
+        limiter, this waits until the query fits the point budget.
+        '''
+        if self.rate_limiter is not None:
+            await self._schedule_request()
+        return await self._send(query)
+
+    async def _schedule_request(self) -> None:
+        '''
+        INTERNAL
+        Wait until the rate limiter allows another request.
+        '''
+        await self._sync_rate_limiter()
+        while True:
+            delay = self.rate_limiter.reserve(low_priority=is_low_priority())
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+            await self._sync_rate_limiter()
+
+    async def _sync_rate_limiter(self) -> None:
+        '''
+        INTERNAL
+        Read the point usage from the API into the rate limiter, if it is due.
+        '''
+        # concurrent requests would otherwise all read the point usage at once
+        async with self._rate_limit_lock:
+            if self.rate_limiter.needs_sync():
+                self._update_rate_limiter(await self._send(self.Q_RATE_LIMIT_USAGE))
+
+    @async_ensure_token
+    async def _send(self, query: str) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Send a query to the API.
+        '''
+        async with self._request_semaphore:
+            return await self._session.execute(
+                gql(query),
+                extra_args={'headers': self._auth_headers()},
+            )
+
+    async def _fetch(self, query: str) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Execute a query against the API and store its result in the query cache.
+
+        Returns:
+            The frozen result of the query.
+        '''
+        return self._cache_store(query, await self._execute(query))
+
+    async def q(self, query: str, ignore_cache: bool = False) -> dict[str, Any]:
+        '''
+        Executes a raw GraphQL query against the FFLogs API.
+
+        See :func:`fflogsapi.FFLogsClient.q` for details on caching behavior. In addition,
+        if an identical query is already being executed by another coroutine, the result of that
+        execution is shared instead of sending the query again.
+
+        Args:
+            query: The GraphQL query to execute.
+            ignore_cache: Whether or not to ignore cached results, forcing a query to be executed
+                          against the API.
+
+        Returns:
+            The result of the query as a dictionary. The result is read-only if the client
+            does not copy results.
+        '''
+        if not ignore_cache:
+            # cached and snapshot results do not need a connection to the API
+            cached_result = self._cache_lookup(query)
+            if cached_result is not None:
+                return self._deliver(cached_result)
+
+        await self.connect()
+
+        if ignore_cache:
+            return self._deliver(await self._fetch(query))
+
+        if query not in self._in_flight:
+            task = asyncio.ensure_future(self._fetch(query))
+            task.add_done_callback(lambda _: self._in_flight.pop(query, None))
+            self._in_flight[query] = task
+
+        # shield the shared execution from the cancellation of any single waiting coroutine
+        result = await asyncio.shield(self._in_flight[query])
+        return self._deliver(result)
+
+    async def execute_many(
+        self,
+        queries: Iterable[str],
+        max_workers: Optional[int] = None,
+        ignore_cache: bool = False,
+    ) -> list[dict[str, Any]]:
+        '''
+        Execute independent raw GraphQL queries concurrently, see :func:`q`.
+
+        See :func:`fflogsapi.FFLogsClient.execute_many` for details.
+
+        Args:
+            queries: The GraphQL queries to execute.
+            max_workers: The maximum amount of queries to execute at the same time. Only
+                         limited by the client's ``max_concurrency`` if None.
+            ignore_cache: Whether or not to ignore cached results, forcing the queries to be
+                          executed against the API.
+        Returns:
+            The results of the queries, in the same order as the queries.
+        '''
+        if max_workers is None:
+            return list(await asyncio.gather(*(self.q(query, ignore_cache) for query in queries)))
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def limited_q(query: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.q(query, ignore_cache)
+
+        return list(await asyncio.gather(*(limited_q(query) for query in queries)))
+
+    def batch(self, max_size: int = 25, ignore_cache: bool = False) -> AsyncFFLogsQueryBatch:
+        '''
+        Collect multiple queries and execute them in as few requests to the API as possible.
+
+        See :func:`fflogsapi.FFLogsClient.batch` for details. The batch is executed when leaving
+        its ``async with`` block, or by awaiting :func:`AsyncFFLogsQueryBatch.execute`:
+
+        .. code-block:: python
+
+            async with client.batch() as batch:
+                for fight in await report.fights():
+                    batch.fetch(fight, 'name', 'kill', 'startTime', 'endTime')
+
+        Args:
+            max_size: The maximum amount of queries to merge into a single request.
+            ignore_cache: Whether or not to ignore cached results of the batched queries.
+        Returns:
+            A new query batch.
+        '''
+        return AsyncFFLogsQueryBatch(client=self, max_size=max_size, ignore_cache=ignore_cache)
+
+    async def rate_limit_allowance(self) -> int:
+        '''
+        Fetches the amount of points the API client is allowed to spend each hour.
+
+        Returns:
+            The total point allowance of the API client.
+        '''
+        result = await self.q(
+            self.Q_RATE_LIMIT.format(innerQuery='limitPerHour'),
+            ignore_cache=True,
+        )
+        return result['rateLimitData']['limitPerHour']
+
+    async def rate_limit_reset_time(self) -> int:
+        '''
+        Fetches the amount of seconds remaining until the point allowance resets for
+        the current API client.
+
+        Returns:
+            Seconds left until points reset.
+        '''
+        result = await self.q(
+            self.Q_RATE_LIMIT.format(innerQuery='pointsResetIn'),
+            ignore_cache=True,
+        )
+        return result['rateLimitData']['pointsResetIn']
+
+    async def rate_limit_spent(self) -> float:
+        '''
+        Fetches the amount of points that have been spent by the API client the past hour.
+
+        Returns:
+            The amount of points spent.
+        '''
+        result = await self.q(
+            self.Q_RATE_LIMIT.format(innerQuery='pointsSpentThisHour'),
+            ignore_cache=True,
+        )
+        return result['rateLimitData']['pointsSpentThisHour']
+
+    async def rate_limit_remaining(self) -> float:
+        '''
+        Get the amount of points the API client has left this hour.
+
+        See :func:`fflogsapi.FFLogsClient.rate_limit_remaining`.
+
+        Returns:
+            The amount of points left until the allowance resets.
+        '''
+        if self.rate_limiter is not None:
+            await self.connect()
+            await self._sync_rate_limiter()
+            return self.rate_limiter.remaining()
+
+        usage = (await self.q(self.Q_RATE_LIMIT_USAGE, ignore_cache=True))['rateLimitData']
+        return max(usage['limitPerHour'] - usage['pointsSpentThisHour'], 0)
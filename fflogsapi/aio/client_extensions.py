@@ -0,0 +1,559 @@
+'''
+Client extensions for the asynchronous client, mirroring those of the synchronous client.
+'''
+
+from typing import Mapping, Optional, Union
+
+from ..characters.queries import Q_CHARACTER_DATA
+from ..data import FFAbility, FFGrandCompany, FFItem, FFJob, FFMap
+from ..game.client_extensions import GameDataMixin
+from ..game.queries import Q_ABILITY, Q_GRAND_COMPANIES, Q_ITEM, Q_JOBS, Q_MAP
+from ..game.registry import GAME_DATA
+from ..guilds.queries import Q_GUILD
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+from ..world.queries import Q_EXPANSION_LIST, Q_REGION_LIST, Q_SERVER, Q_ZONE_LIST
+from .character import AsyncFFLogsCharacter
+from .guild import AsyncFFLogsGuild
+from .pages import (AsyncFFLogsAbilityPaginationIterator, AsyncFFLogsGuildPaginationIterator,
+                    AsyncFFLogsItemPaginationIterator, AsyncFFLogsMapPaginationIterator,
+                    AsyncFFLogsReportPaginationIterator,)
+from .report import AsyncFFLogsReport
+from .world import (AsyncFFLogsEncounter, AsyncFFLogsExpansion, AsyncFFLogsRegion,
+                    AsyncFFLogsServer, AsyncFFLogsSubregion, AsyncFFLogsZone,)
+
+
+async def _resolve_id(
+    client,
+    query: str,
+    data_indices: list[str],
+    filters: dict,
+    id: int,
+) -> int:
+    '''
+    Find the ID of an object from the given filters, unless the ID is already known
+    '''
+    if id != -1 and 'id' not in filters:
+        return id
+
+    result = await client.q(query.format(
+        filters=construct_filter_string(filters),
+        innerQuery='id',
+    ))
+    return itindex(result, data_indices)['id']
+
+
+class AsyncReportsMixin:
+    '''
+    Asynchronous client extensions to support report data exposed by the FF Logs API.
+    '''
+
+    def reports(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsReportPaginationIterator:
+        '''
+        Iterate over pages of FF Logs reports.
+
+        For valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/warcraft/reportdata.doc.html
+
+        Args:
+            filters: Filters to use when finding reports.
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over the pages of reports that match the given filters.
+        '''
+        return AsyncFFLogsReportPaginationIterator(
+            filters=filters,
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    def get_report(self, code: str) -> AsyncFFLogsReport:
+        '''
+        Retrieves the given report data from FF Logs.
+
+        Args:
+            code: The report code.
+        Returns:
+            An AsyncFFLogsReport object representing the report.
+        '''
+        return AsyncFFLogsReport(code=code, client=self)
+
+
+class AsyncCharactersMixin:
+    '''
+    Asynchronous client extensions to support character data exposed by the FF Logs API.
+    '''
+
+    async def get_character(
+        self,
+        filters: dict = {},
+        id: Optional[int] = -1,
+    ) -> AsyncFFLogsCharacter:
+        '''
+        Retrieves character data from FFLogs.
+        Note that it is possible to use only the `filters` argument,
+        the id parameter is there for ease of use.
+
+        For valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/ff/characterdata.doc.html
+
+        Args:
+            filters: Optional filters to find the character by.
+            id: The ID of the character to retrieve.
+        Returns:
+            An AsyncFFLogsCharacter representing the requested character.
+        '''
+        id = await _resolve_id(
+            self, Q_CHARACTER_DATA, AsyncFFLogsCharacter.DATA_INDICES, filters, id,
+        )
+        return AsyncFFLogsCharacter(id=id, client=self)
+
+
+class AsyncGuildsMixin:
+    '''
+    Asynchronous client extensions to support guild data exposed by the FF Logs API.
+    '''
+
+    def guilds(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsGuildPaginationIterator:
+        '''
+        Iterate over pages of guilds on FF Logs.
+
+        For valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/ff/guilddata.doc.html
+
+        Args:
+            filters: Filters to find guilds by.
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over the pages of guilds that match the given filters.
+        '''
+        return AsyncFFLogsGuildPaginationIterator(
+            filters=filters,
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    async def get_guild(self, filters: dict = {}, id: int = -1) -> AsyncFFLogsGuild:
+        '''
+        Retrieves the given guild data from FFLogs.
+
+        For valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/ff/guilddata.doc.html
+
+        Args:
+            filters: Filters to find the guild by.
+            id: The guild ID.
+        Returns:
+            An AsyncFFLogsGuild object representing the guild.
+        '''
+        id = await _resolve_id(self, Q_GUILD, AsyncFFLogsGuild.DATA_INDICES, filters, id)
+        return AsyncFFLogsGuild(id=id, client=self)
+
+
+class AsyncWorldMixin:
+    '''
+    Asynchronous client extensions to support world data exposed by the FF Logs API.
+    '''
+
+    def get_encounter(self, id: int) -> AsyncFFLogsEncounter:
+        '''
+        Retrieves the given encounter data from FF Logs.
+
+        Args:
+            id: The encounter ID.
+        Returns:
+            An AsyncFFLogsEncounter object representing the encounter.
+        '''
+        return AsyncFFLogsEncounter(id=id, client=self)
+
+    def get_expansion(self, id: int) -> AsyncFFLogsExpansion:
+        '''
+        Retrieves the given expansion data from FF Logs.
+
+        Args:
+            id: The expansion ID.
+        Returns:
+            An AsyncFFLogsExpansion object representing the expansion.
+        '''
+        return AsyncFFLogsExpansion(id=id, client=self)
+
+    async def all_expansions(self) -> list[AsyncFFLogsExpansion]:
+        '''
+        Retrieves a list of all expansions supported by FF Logs.
+
+        Returns:
+            A list of AsyncFFLogsExpansions representing each expansion.
+        '''
+        expacs = (await self.q(Q_EXPANSION_LIST.format(
+            innerQuery='id',
+        )))['worldData']['expansions']
+
+        return [AsyncFFLogsExpansion(id=e['id'], client=self) for e in expacs]
+
+    def get_region(self, id: int) -> AsyncFFLogsRegion:
+        '''
+        Retrieves the given region from FF Logs.
+
+        Args:
+            id: The region ID.
+        Returns:
+            An AsyncFFLogsRegion object representing the region.
+        '''
+        return AsyncFFLogsRegion(id=id, client=self)
+
+    async def all_regions(self) -> list[AsyncFFLogsRegion]:
+        '''
+        Retrieves a list of all regions supported by FF Logs.
+
+        Returns:
+            A list of AsyncFFLogsRegions representing each region.
+        '''
+        regions = (await self.q(Q_REGION_LIST.format(
+            innerQuery='id',
+        )))['worldData']['regions']
+
+        return [AsyncFFLogsRegion(id=r['id'], client=self) for r in regions]
+
+    async def get_server(self, filters: dict = {}, id: Optional[int] = -1) -> AsyncFFLogsServer:
+        '''
+        Retrieves server information from FF Logs given server filters.
+
+        For valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/warcraft/worlddata.doc.html
+
+        Args:
+            filters: Optional filters to find the server by.
+            id: The ID of the server to retrieve.
+        Returns:
+            An AsyncFFLogsServer object representing the server.
+        '''
+        id = await _resolve_id(self, Q_SERVER, AsyncFFLogsServer.DATA_INDICES, filters, id)
+        return AsyncFFLogsServer(id=id, client=self)
+
+    def get_subregion(self, id: int) -> AsyncFFLogsSubregion:
+        '''
+        Retrieves the given subregion from FF Logs.
+
+        Args:
+            id: The subregion ID.
+        Returns:
+            An AsyncFFLogsSubregion object representing the subregion.
+        '''
+        return AsyncFFLogsSubregion(id=id, client=self)
+
+    def get_zone(self, id: int) -> AsyncFFLogsZone:
+        '''
+        Retrieves the given zone from FF Logs.
+
+        Args:
+            id: The zone ID.
+        Returns:
+            An AsyncFFLogsZone object representing the zone.
+        '''
+        return AsyncFFLogsZone(id=id, client=self)
+
+    async def all_zones(self, expansion_id: int) -> list[AsyncFFLogsZone]:
+        '''
+        Retrieves a list of all zones belonging to a given expansion that are supported by FF Logs.
+
+        Returns:
+            A list of AsyncFFLogsZones representing each zone.
+        '''
+        zones = (await self.q(Q_ZONE_LIST.format(
+            filters=f'expansion_id: {expansion_id}',
+            innerQuery='id',
+        )))['worldData']['zones']
+
+        return [AsyncFFLogsZone(id=z['id'], client=self) for z in zones]
+
+
+class AsyncGameDataMixin:
+    '''
+    Asynchronous client extensions to support game data exposed by the FF Logs API.
+    '''
+
+    icon_url = GameDataMixin.icon_url
+
+    def abilities(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsAbilityPaginationIterator:
+        '''
+        Get a pagination of all game abilities.
+
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over all pages of game abilities.
+        '''
+        return AsyncFFLogsAbilityPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    def items(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsItemPaginationIterator:
+        '''
+        Get a pagination of all game items.
+
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over all pages of game items.
+        '''
+        return AsyncFFLogsItemPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    def maps(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsMapPaginationIterator:
+        '''
+        Get a pagination of all game maps.
+
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over all pages of game maps.
+        '''
+        return AsyncFFLogsMapPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    async def ability(self, id: int) -> FFAbility:
+        '''
+        Get ability data for the given ability `id`.
+
+        Args:
+            id: The ID of the game ability.
+        Returns:
+            The game ability.
+        '''
+        # this appears up in reports but the API will raise an error if queried for
+        # as it isn't a real game ability
+        if id == 0:
+            return FFAbility(
+                id=0,
+                name='Unknown Ability',
+                description='',
+                icon='000000-000405.png',
+                type=0,
+            )
+
+        if GAME_DATA.ability(id) is None:
+            ability = (await self.q(Q_ABILITY.format(abilityID=id)))['gameData']['ability']
+            GAME_DATA.add_abilities([FFAbility(
+                id=id,
+                name=ability['name'],
+                description=ability['description'],
+                icon=ability['icon'],
+            )])
+        return GAME_DATA.ability(id)
+
+    async def item(self, id: int) -> FFItem:
+        '''
+        Get item data for the given item `id`.
+
+        Args:
+            id: The ID of the game item.
+        Returns:
+            The game item.
+        '''
+        if GAME_DATA.item(id) is None:
+            item = (await self.q(Q_ITEM.format(itemID=id)))['gameData']['item']
+            GAME_DATA.add_items([FFItem(id=id, name=item['name'], icon=item['icon'])])
+        return GAME_DATA.item(id)
+
+    async def map(self, id: int) -> FFMap:
+        '''
+        Get map data for the given map `id`.
+
+        Args:
+            id: The ID of the game map.
+        Returns:
+            The game map.
+        '''
+        if GAME_DATA.map(id) is None:
+            map = (await self.q(Q_MAP.format(mapID=id)))['gameData']['map']
+            GAME_DATA.add_maps([FFMap(
+                id=id,
+                name=map['name'],
+                filename=map['filename'],
+                offset_x=map['offsetX'],
+                offset_y=map['offsetY'],
+                size_factor=map['sizeFactor'],
+            )])
+        return GAME_DATA.map(id)
+
+    async def jobs(self) -> list[FFJob]:
+        '''
+        Get a list of all game jobs supported by FF Logs.
+
+        Returns:
+            A list of all jobs.
+        '''
+        if GAME_DATA.jobs() is None:
+            jobs = (await self.q(Q_JOBS))['gameData']['class']['specs']
+            GAME_DATA.set_jobs(FFJob(
+                id=job['id'],
+                name=job['name'],
+                slug=job['slug'],
+            ) for job in jobs)
+        return GAME_DATA.jobs()
+
+    async def jobs_by_slug(self) -> Mapping[str, FFJob]:
+        '''
+        Get all game jobs supported by FF Logs by their slug, e.g. ``'WhiteMage'``.
+
+        Returns:
+            A read-only mapping from job slugs to jobs.
+        '''
+        await self.jobs()
+        return GAME_DATA.jobs_by_slug()
+
+    async def job(self, key: Union[str, int]) -> Optional[FFJob]:
+        '''
+        Get a game job by its slug or ID.
+
+        Args:
+            key: The slug (e.g. ``'WhiteMage'``) or the ID of the job.
+        Returns:
+            The job, or None if there is no such job.
+        '''
+        await self.jobs()
+        return GAME_DATA.job(key)
+
+    async def grand_companies(self) -> list[FFGrandCompany]:
+        '''
+        Get all grand companies (called factions by FF Logs) that guilds and characters can
+        belong to.
+
+        Returns:
+            A list of all grand companies.
+        '''
+        if GAME_DATA.grand_companies() is None:
+            gcs = (await self.q(Q_GRAND_COMPANIES))['gameData']['factions']
+            GAME_DATA.set_grand_companies(
+                FFGrandCompany(id=gc['id'], name=gc['name']) for gc in gcs
+            )
+        return GAME_DATA.grand_companies()
+
+    async def grand_company(self, id: int) -> Optional[FFGrandCompany]:
+        '''
+        Get a grand company by its ID.
+
+        Args:
+            id: The ID of the grand company.
+        Returns:
+            The grand company, or None if there is no such grand company.
+        '''
+        await self.grand_companies()
+        return GAME_DATA.grand_company(id)
+
+    async def preload_game_data(
+        self,
+        abilities: bool = True,
+        items: bool = True,
+        maps: bool = True,
+        prefetch: int = 4,
+        bulk: int = 5,
+    ) -> None:
+        '''
+        Retrieve all pages of game abilities, items and/or maps, so that :func:`ability`,
+        :func:`item` and :func:`map` no longer have to query the API.
+
+        Args:
+            abilities: Whether to preload all game abilities.
+            items: Whether to preload all game items.
+            maps: Whether to preload all game maps.
+            prefetch: The amount of pages to fetch ahead of the current page.
+            bulk: The amount of pages to fetch per request.
+        '''
+        paginations = (
+            (abilities, self.abilities, GAME_DATA.add_abilities),
+            (items, self.items, GAME_DATA.add_items),
+            (maps, self.maps, GAME_DATA.add_maps),
+        )
+        for preload, pagination, add in paginations:
+            if not preload:
+                continue
+            async for page in pagination(prefetch=prefetch, bulk=bulk):
+                add(page)
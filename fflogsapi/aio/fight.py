@@ -0,0 +1,692 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
+from warnings import warn
+
+from ..data import (FFGameZone, FFJobInvalid, FFLogsNPCData, FFLogsPhase, FFLogsPlayerDetails,
+                    FFLogsReportCharacterRanking, FFLogsReportComboRanking, FFLogsReportRanking,
+                    FFMap,)
+from ..reports.fight import FFLogsFight
+from ..reports.queries import Q_FIGHT_DATA
+from ..util.decorators import async_fetch_data
+from ..util.filters import construct_filter_string
+from ..util.gql_enums import GQLEnum
+from ..util.indexing import itindex
+from ..util.timeslicing import merge_event_streams, split_time_range, stitch_event_windows
+from .character import AsyncFFLogsCharacter
+from .world import AsyncFFLogsEncounter
+
+if TYPE_CHECKING:
+    from ..analysis.auras import FFLogsAuraIntervals
+    from ..analysis.columnar import FFLogsEventColumns
+    from ..analysis.index import FFLogsEventIndex
+    from ..analysis.tables import FFLogsTableEngine
+    from .client import AsyncFFLogsClient
+    from .report import AsyncFFLogsReport
+
+
+class AsyncFFLogsFight:
+    '''
+    Asynchronous representation of a single fight on FF Logs.
+
+    See :class:`fflogsapi.reports.FFLogsFight` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['reportData', 'report', 'fights', 0]
+
+    PREFETCH_FIELDS = FFLogsFight.PREFETCH_FIELDS
+    ''' The fields fetched by :func:`prefetch` when no fields are given '''
+
+    id: int = -1
+    ''' The ID of the fight, within the report which this fight belongs to '''
+
+    report: 'AsyncFFLogsReport' = None
+    ''' The report which this fight belongs to '''
+
+    def __init__(
+        self,
+        report: 'AsyncFFLogsReport',
+        fight_id: int,
+        client: 'AsyncFFLogsClient',
+    ) -> None:
+        self.report = report
+        self.id = fight_id
+        self._client = client
+        self._data = {}
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information from a fight
+        '''
+        return Q_FIGHT_DATA.format(
+            reportCode=self.report.code,
+            fightID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information from a fight
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    async def prefetch(self, fields: Optional[list[str]] = None) -> None:
+        '''
+        Fetch multiple fields of the fight in a single query, instead of one query per field.
+
+        Args:
+            fields: The names of the fields to fetch, e.g. ``['name', 'kill', 'startTime']``.
+                    By default, all simple fields of the fight are fetched.
+        '''
+        missing = [field for field in fields or self.PREFETCH_FIELDS if field not in self._data]
+        if not missing:
+            return
+
+        result = await self._query_data(' '.join(missing))
+        for field in missing:
+            self._data[field] = result[field]
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The name of the fight
+        '''
+        return self._data['name']
+
+    @async_fetch_data('size')
+    async def size(self) -> int:
+        '''
+        Returns:
+            The amount of players participating in the fight
+        '''
+        return self._data['size']
+
+    @async_fetch_data('kill')
+    async def is_kill(self) -> bool:
+        '''
+        Returns:
+            Whether or not the fight resulted in a kill
+        '''
+        return self._data['kill']
+
+    @async_fetch_data('hasEcho')
+    async def has_echo(self) -> bool:
+        '''
+        Returns:
+            Whether or not Echo was enabled for this fight
+        '''
+        return self._data['hasEcho']
+
+    @async_fetch_data('standardComposition')
+    async def standard_comp(self) -> bool:
+        '''
+        Returns:
+            Whether or not this fight had a standard composition.
+        '''
+        return self._data['standardComposition']
+
+    @async_fetch_data('inProgress')
+    async def in_progress(self) -> bool:
+        '''
+        Returns:
+            Whether or not the fight is still in progress.
+        '''
+        return self._data['inProgress']
+
+    @async_fetch_data('bossPercentage')
+    async def percentage(self) -> float:
+        '''
+        Returns:
+            The minimum percentage of HP that was reached for the last boss in the fight
+        '''
+        return self._data['bossPercentage']
+
+    @async_fetch_data('fightPercentage')
+    async def fight_percentage(self) -> float:
+        '''
+        Returns:
+            The minimum percentage of the entire fight that was reached
+        '''
+        return self._data['fightPercentage']
+
+    @async_fetch_data('lastPhaseAsAbsoluteIndex')
+    async def last_phase_absolute(self) -> int:
+        '''
+        Returns:
+            The last phase the fight was in when it ended,
+            counting from 0 and including intermissions
+        '''
+        return self._data['lastPhaseAsAbsoluteIndex']
+
+    @async_fetch_data('lastPhaseIsIntermission')
+    async def last_phase_intermission(self) -> bool:
+        '''
+        Returns:
+            Whether or not the last phase of the fight is an intermission
+        '''
+        return self._data['lastPhaseIsIntermission']
+
+    @async_fetch_data('difficulty')
+    async def difficulty(self) -> Optional[int]:
+        '''
+        Returns:
+            The difficulty of the fight.
+        '''
+        return self._data['difficulty']
+
+    @async_fetch_data('encounterID')
+    async def encounter(self) -> AsyncFFLogsEncounter:
+        '''
+        Returns:
+            The encounter the fight was a part of.
+        '''
+        return AsyncFFLogsEncounter(id=self._data['encounterID'], client=self._client)
+
+    @async_fetch_data('friendlyPlayers')
+    async def friendly_players(self) -> list[int]:
+        '''
+        Returns:
+            The IDs of all friendly players in the fight
+        '''
+        return self._data['friendlyPlayers']
+
+    @async_fetch_data('startTime')
+    async def start_time(self) -> float:
+        '''
+        Returns:
+            Start time of the fight relative to the start time of the report
+        '''
+        return self._data['startTime']
+
+    @async_fetch_data('endTime')
+    async def end_time(self) -> float:
+        '''
+        Returns:
+            End time of the fight relative to the start time of the report
+        '''
+        return self._data['endTime']
+
+    async def duration(self) -> float:
+        '''
+        Returns:
+            The total duration of the right
+        '''
+        return (await self.end_time()) - (await self.start_time())
+
+    @async_fetch_data('completeRaid')
+    async def complete_raid(self) -> bool:
+        '''
+        Returns:
+            Whether or not this is a complete raid.
+        '''
+        return self._data['completeRaid']
+
+    async def bounding_box(self) -> tuple[int, int, int, int]:
+        '''
+        Returns:
+            The bounding box of player positions as a tuple of the form (minX, minY, maxX, maxY).
+        '''
+        result = await self._query_data('boundingBox{ minX, minY, maxX, maxY }')
+        bb = result['boundingBox']
+
+        return (bb['minX'], bb['minY'], bb['maxX'], bb['maxY'])
+
+    async def _prepare_data_filters(
+        self,
+        filters: dict[str, Any],
+    ) -> tuple[str, dict[str, Any]]:
+        '''
+        Turn a dictionary of filters into a GraphQL filter string
+
+        Returns:
+            A filter string usable in GQL queries
+
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
+        '''
+        fight_start, fight_end = await self.start_time(), await self.end_time()
+
+        if 'startTime' not in filters:
+            filters['startTime'] = fight_start
+        elif filters['startTime'] < fight_start:
+            raise ValueError('Cannot retrieve fight events before the fight has started!')
+        if 'endTime' not in filters:
+            filters['endTime'] = fight_end
+        elif filters['endTime'] > fight_end:
+            raise ValueError('Cannot retrieve fight events after the fight has ended!')
+
+        return construct_filter_string(filters), filters
+
+    async def _events_page(self, filters: dict[str, Any]) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Retrieve a single page of events, starting at the start time of the given filters.
+        '''
+        return await self.report._events_page(filters)
+
+    async def _collect_events(self, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve all pages of events between the start and end time of the given filters.
+        '''
+        return await self.report._collect_events(filters)
+
+    async def events(
+        self,
+        filters: dict[str, Any] = {},
+        windows: int = 1,
+    ) -> list[dict[str, Any]]:
+        '''
+        Retrieves the events of the fight.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+            windows: The amount of time windows to retrieve concurrently.
+        Returns:
+            A filtered list of all events in the fight or None if the fight has zero duration
+        '''
+        if (await self.duration()) == 0:
+            return None
+
+        _, filters = await self._prepare_data_filters(filters.copy())
+
+        time_windows = split_time_range(filters['startTime'], filters['endTime'], windows)
+        if len(time_windows) == 1:
+            return await self._collect_events(filters)
+
+        window_events = await asyncio.gather(*[
+            self._collect_events({**filters, 'startTime': start, 'endTime': end})
+            for start, end in time_windows
+        ])
+        return stitch_event_windows(window_events)
+
+    async def events_columnar(
+        self,
+        filters: dict[str, Any] = {},
+    ) -> Optional['FFLogsEventColumns']:
+        '''
+        Retrieves the events of the fight as NumPy columns, for vectorized analysis.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+        Returns:
+            The filtered events of the fight in columnar form, or None if the fight has zero
+            duration.
+        '''
+        from ..analysis.columnar import FFLogsEventColumns
+
+        if (await self.duration()) == 0:
+            return None
+        return FFLogsEventColumns.from_events([event async for event in self.iter_events(filters)])
+
+    async def events_indexed(
+        self,
+        filters: dict[str, Any] = {},
+        windows: int = 1,
+    ) -> Optional['FFLogsEventIndex']:
+        '''
+        Retrieves the events of the fight, indexed by source, target, ability and type.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+            windows: The amount of time windows to retrieve concurrently.
+        Returns:
+            The indexed events of the fight, or None if the fight has zero duration.
+        '''
+        from ..analysis.index import FFLogsEventIndex
+
+        events = await self.events(filters, windows=windows)
+        return FFLogsEventIndex(events) if events is not None else None
+
+    async def iter_events(
+        self,
+        filters: dict[str, Any] = {},
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        '''
+        Iterate over the events of the fight as their pages are retrieved.
+
+        By default, the next page is requested in the background while the events of the current
+        page are consumed.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+            prefetch: Whether or not to retrieve the next page in the background.
+        Returns:
+            An asynchronous iterator over the filtered events of the fight. The iterator is empty
+            if the fight has zero duration.
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
+        '''
+        if (await self.duration()) == 0:
+            return
+
+        _, filters = await self._prepare_data_filters(filters.copy())
+        desired_end = filters['endTime']
+
+        page = await self._events_page(filters)
+        while True:
+            next_page = page['nextPageTimestamp']
+            next_task = None
+            if next_page and next_page < desired_end:
+                next_filters = {**filters, 'startTime': next_page}
+                if prefetch:
+                    next_task = asyncio.ensure_future(self._events_page(next_filters))
+
+            try:
+                for event in page['data']:
+                    yield event
+            except GeneratorExit:
+                # the consumer stopped early, don't leave the prefetch running
+                if next_task is not None:
+                    next_task.cancel()
+                raise
+
+            if not next_page or next_page >= desired_end:
+                return
+            page = await (next_task if next_task is not None else self._events_page(next_filters))
+
+    async def graph(self, filters: dict[str, Any] = {}) -> dict[Any, Any]:
+        '''
+        Retrieves the graph information for the fight.
+
+        Args:
+            filters: Filters to use when retrieving graph data.
+        Returns:
+            A dictionary of graph information for the fight or None if the fight has zero duration
+        '''
+        if (await self.duration()) == 0:
+            return None
+
+        graph_filters, _ = await self._prepare_data_filters(filters.copy())
+
+        result = await self.report._query_data(f'graph({graph_filters})')
+        return result['graph']['data']
+
+    async def table(self, filters: dict[str, str] = {}) -> dict[Any, Any]:
+        '''
+        Retrieves the table information for the fight.
+
+        Args:
+            filters: Filters to use when retrieving table data.
+        Returns:
+            A dictionary of table information for the fight or None if the fight has zero duration
+        '''
+        if (await self.duration()) == 0:
+            return None
+
+        table_filters, _ = await self._prepare_data_filters(filters.copy())
+
+        result = await self.report._query_data(f'table({table_filters})')
+        return result['table']['data']
+
+    async def _all_events(self) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve the events of both friendly and enemy actors, in timestamp order.
+        '''
+        streams = await asyncio.gather(*(
+            self.events({'hostilityType': GQLEnum(hostility)})
+            for hostility in FFLogsFight.HOSTILITY_TYPES
+        ))
+        return merge_event_streams([events or [] for events in streams])
+
+    async def table_engine(self) -> 'FFLogsTableEngine':
+        '''
+        Retrieves all events of the fight for computing tables locally.
+
+        Returns:
+            A table engine for the fight.
+        '''
+        from ..analysis.tables import FFLogsTableEngine
+
+        events, actors, abilities, start_time, end_time = await asyncio.gather(
+            self._all_events(),
+            self.report.actors(),
+            self.report.abilities(),
+            self.start_time(),
+            self.end_time(),
+        )
+        return FFLogsTableEngine(
+            events=events,
+            actors=actors,
+            abilities=abilities,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    async def aura_intervals(self) -> 'FFLogsAuraIntervals':
+        '''
+        Retrieves the buff and debuff intervals of the fight.
+
+        Returns:
+            The aura intervals of the fight.
+        '''
+        from ..analysis.auras import FFLogsAuraIntervals
+
+        events, start_time, end_time = await asyncio.gather(
+            self._all_events(),
+            self.start_time(),
+            self.end_time(),
+        )
+        return FFLogsAuraIntervals.from_events(
+            events, start_time=start_time, end_time=end_time,
+        )
+
+    async def rankings(
+        self,
+        metric: str = 'default',
+        compare: str = 'Rankings',
+        timeframe: str = 'Today',
+    ) -> Optional[FFLogsReportRanking]:
+        '''
+        Retrieves ranking data for the fight.
+
+        Args:
+            metric: The type of metric to retrieve rankings for.
+            compare: What to compare against. `Rankings` and `Parses` are supported.
+            timeframe: The time frame to compare against. `Today` and `Historical` are supported.
+        Returns:
+            A dictionary of player ranking information or None if there is no ranking information
+            for this fight.
+        '''
+        if 'rankings' not in self._data:
+            ranks = (await self.report._query_data(
+                f'rankings(fightIDs: {self.id}, playerMetric: {metric},\
+                compare: {compare}, timeframe: {timeframe})'
+            ))['rankings']['data']
+
+            if not len(ranks):
+                self._data['rankings'] = None
+                return None
+            ranks = ranks[0]
+
+            jobs = await self._client.jobs_by_slug()
+            character_rankings = []
+            combo_rankings = []
+            for role, data in ranks['roles'].items():
+                for ranking in data['characters']:
+                    character = AsyncFFLogsCharacter(id=ranking['id'], client=self._client)
+                    job = jobs[ranking['class']]
+
+                    if 'id_2' in ranking:
+                        # this is a tank/healer combination ranking
+                        job_b = jobs[ranking['class_2']]
+                        combo_rankings.append(FFLogsReportComboRanking(
+                            type=role,
+                            character_a=character,
+                            character_b=AsyncFFLogsCharacter(
+                                id=ranking['id_2'],
+                                client=self._client,
+                            ),
+                            job_a=job,
+                            job_b=job_b,
+                            amount=ranking['amount'],
+                            rank=str(ranking['rank']),
+                            best_rank=str(ranking['best']),
+                            total_parses=ranking['totalParses'],
+                            percentile=ranking['rankPercent'],
+                        ))
+                    else:
+                        # this is an individual ranking
+                        character_rankings.append(FFLogsReportCharacterRanking(
+                            character=character,
+                            job=job,
+                            amount=ranking['amount'],
+                            rank=str(ranking['rank']),
+                            best_rank=str(ranking['best']),
+                            total_parses=ranking['totalParses'],
+                            percentile=ranking['rankPercent'],
+                        ))
+
+            self._data['rankings'] = FFLogsReportRanking(
+                patch=ranks['bracketData'],
+                bracket=ranks['bracket'],
+                deaths=ranks['deaths'],
+                damage_taken_not_tanks=ranks['damageTakenExcludingTanks'],
+                character_rankings=character_rankings,
+                combo_rankings=combo_rankings,
+            )
+
+        return self._data['rankings']
+
+    async def player_details(self) -> list[FFLogsPlayerDetails]:
+        '''
+        Get a list of player details such as each player's job, name and server for this fight.
+
+        Returns:
+            The player details for this fight.
+        '''
+        if 'playerDetails' not in self._data:
+            details = (await self.report._query_data(
+                f'playerDetails(fightIDs: {self.id})'
+            ))['playerDetails']['data']['playerDetails']
+            jobs = await self._client.jobs_by_slug()
+
+            player_details = []
+            for role, players in details.items():
+                for data in players:
+                    job_slug = data['type']
+                    job = jobs.get(job_slug)
+                    if job is None:
+                        job = FFJobInvalid()
+                        job.slug = job_slug
+
+                    player_details.append(FFLogsPlayerDetails(
+                        id=data['id'],
+                        actor=await self.report.actor(id=data['id']),
+                        guid=data['guid'],
+                        name=data['name'],
+                        server=data['server'],
+                        job=job,
+                        role=role,
+                    ))
+            self._data['playerDetails'] = player_details
+
+        return self._data['playerDetails']
+
+    async def _npcs(self, field: str, hostile: bool) -> list[FFLogsNPCData]:
+        '''
+        INTERNAL
+        Query for and build NPC data from one of the fight's NPC fields.
+        '''
+        pet_owner = ', petOwner' if field == 'friendlyPets' else ''
+        npcs = (await self._query_data(
+            f'{field}{{ gameID, groupCount, id, instanceCount{pet_owner} }}'
+        ))[field]
+
+        return [FFLogsNPCData(
+            id=npc['id'],
+            actor=await self.report.actor(id=npc['id']),
+            hostile=hostile,
+            game_id=npc['gameID'],
+            group_count=npc['groupCount'],
+            instance_count=npc['instanceCount'],
+            pet_owner=await self.report.actor(id=npc['petOwner']) if pet_owner else None,
+        ) for npc in npcs]
+
+    async def enemy_npcs(self) -> Optional[list[FFLogsNPCData]]:
+        '''
+        Returns:
+            A list of enemy NPCs in the fight or None if there are none.
+        '''
+        npcs = await self._npcs('enemyNPCs', hostile=True)
+        return npcs if len(npcs) else None
+
+    async def friendly_npcs(self) -> Optional[list[FFLogsNPCData]]:
+        '''
+        Returns:
+            A list of all friendly NPCs in the fight or None if there are none.
+        '''
+        npcs = await self._npcs('friendlyNPCs', hostile=False)
+        return npcs if len(npcs) else None
+
+    async def pets(self) -> list[FFLogsNPCData]:
+        '''
+        Returns:
+            All friendly pets in the fight.
+        '''
+        return await self._npcs('friendlyPets', hostile=False)
+
+    async def game_zone(self) -> FFGameZone:
+        '''
+        Returns:
+            The game zone this fight takes place in.
+        '''
+        game_zone = (await self._query_data('gameZone{ id, name }'))['gameZone']
+        return FFGameZone(
+            id=game_zone['id'],
+            name=game_zone['name'],
+        )
+
+    async def maps(self) -> list[FFMap]:
+        '''
+        Returns:
+            All maps involved in the fight.
+        '''
+        maps = (await self._query_data('maps{ id }'))['maps']
+        return list(await asyncio.gather(*[self._client.map(id=map['id']) for map in maps]))
+
+    @async_fetch_data('encounterID')
+    async def phases(self) -> list[FFLogsPhase]:
+        '''
+        Returns:
+            A list of phases
+        '''
+        if 'phases' not in self._data:
+            encounter_id = self._data['encounterID']
+            self._data['phases'] = (await self.report._query_phases())[encounter_id]
+        return self._data['phases']
+
+    @async_fetch_data('lastPhase', 'lastPhaseAsAbsoluteIndex')
+    async def last_phase(
+        self,
+        ignore_intermissions: bool = True,
+        as_dataclass: bool = False
+    ) -> Union[int, FFLogsPhase]:
+        '''
+        Get the phase the fight was in when the fight ended.
+
+        Args:
+            ignore_intermissions: When True, the last non-intermission phase is returned
+            as_dataclass: Return the last phase as a FFLogsPhase dataclass.
+        Returns:
+            The last phase the fight was in when it ended
+        '''
+        last_phase = self._data['lastPhase']
+        if as_dataclass:
+            if not ignore_intermissions:
+                last_phase = self._data['lastPhaseAsAbsoluteIndex'] + 1
+            for phase in await self.phases():
+                if phase.id == last_phase:
+                    last_phase = phase
+                    break
+        else:
+            warn(
+                'integer returns from AsyncFFLogsFight.last_phase are deprecated. '
+                'Pass as_dataclass=True to get the new dataclass return instead.',
+                category=FutureWarning,
+            )
+        return last_phase
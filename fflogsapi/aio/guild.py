@@ -0,0 +1,235 @@
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ..constants import FightDifficulty, PartySize
+from ..data import FFGrandCompany, FFLogsGuildZoneRankings, FFLogsRank, FFLogsReportTag
+from ..guilds.queries import Q_GUILD, Q_GUILD_RANKING
+from ..util.decorators import async_fetch_data
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+from .pages import (AsyncFFLogsGuildAttendancePaginationIterator,
+                    AsyncFFLogsGuildCharacterPaginationIterator,)
+from .world import AsyncFFLogsServer, AsyncFFLogsZone
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+
+
+class AsyncFFLogsGuild:
+    '''
+    Asynchronous FFLogs guild information object.
+
+    Unlike :class:`fflogsapi.guilds.FFLogsGuild`, the ID of the guild must be known when
+    instantiating it. Use :func:`AsyncFFLogsClient.get_guild` to find guilds by other filters.
+
+    See :class:`fflogsapi.guilds.FFLogsGuild` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['guildData', 'guild']
+
+    id: int = -1
+    ''' The ID of the guild '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self.filters = {'id': id}
+        self._client = client
+        self._data = {'id': id}
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a guild
+        '''
+        filters = construct_filter_string(self.filters)
+        return Q_GUILD.format(
+            filters=filters,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a guild
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The name of the guild.
+        '''
+        return self._data['name']
+
+    @async_fetch_data('description')
+    async def description(self) -> str:
+        '''
+        Returns:
+            The description of the guild.
+        '''
+        return self._data['description']
+
+    @async_fetch_data('type')
+    async def type(self) -> str:
+        '''
+        Returns:
+            The type of the guild.
+        '''
+        return self._data['type']
+
+    @async_fetch_data('competitionMode')
+    async def competition_mode(self) -> bool:
+        '''
+        Returns:
+            The competition mode of the guild.
+        '''
+        return self._data['competitionMode']
+
+    @async_fetch_data('stealthMode')
+    async def stealth_mode(self) -> bool:
+        '''
+        Returns:
+            The stealth mode of the guild.
+        '''
+        return self._data['stealthMode']
+
+    @async_fetch_data('currentUserRank')
+    async def current_rank(self) -> str:
+        '''
+        Requires the API client to be in user mode.
+
+        Returns:
+            The user's rank in the guild.
+        '''
+        return self._data['currentUserRank']
+
+    async def server(self) -> AsyncFFLogsServer:
+        '''
+        Returns:
+            The server the guild belogns to
+        '''
+        id = (await self._query_data(query='server{ id }'))['server']['id']
+        return AsyncFFLogsServer(id=id, client=self._client)
+
+    async def tags(self) -> list[FFLogsReportTag]:
+        '''
+        Returns:
+            The guild's tags.
+        '''
+        tags = (await self._query_data(query='tags{ id, name }'))['tags']
+        return [FFLogsReportTag(id=tag['id'], name=tag['name'], guild=self) for tag in tags]
+
+    async def grand_company(self) -> FFGrandCompany:
+        '''
+        Returns:
+            The grand company the guild belongs to.
+        '''
+        grand_company = (await self._query_data(query='faction{ id, name }'))['faction']
+        return FFGrandCompany(id=grand_company['id'], name=grand_company['name'])
+
+    def attendance(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsGuildAttendancePaginationIterator:
+        '''
+        Get a pagination of attandance reports.
+
+        Args:
+            filters: Zone and tag ID filters to filter attendance reports by.
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over all attendance report pages.
+        '''
+        return AsyncFFLogsGuildAttendancePaginationIterator(
+            additional_formatting={'guildID': self.id},
+            filters=filters,
+            client=self._client,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    def characters(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsGuildCharacterPaginationIterator:
+        '''
+        Get a pagination of all characters belonging to the guild.
+
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous iterator over all guild character pages.
+        '''
+        return AsyncFFLogsGuildCharacterPaginationIterator(
+            client=self._client,
+            additional_formatting={'guildID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    async def zone_rankings(
+            self,
+            zone: Union[int, AsyncFFLogsZone],
+            size: int = PartySize.FULL.value,
+            difficulty: int = FightDifficulty.SAVAGE.value,
+    ) -> FFLogsGuildZoneRankings:
+        '''
+        Retrieve the guild's ranking information for a given zone, party size and difficulty.
+
+        Args:
+            zone: Either the `int` ID of the zone, or the zone to retrieve ranking information for.
+            size: The party size for which to retrieve rankings.
+            difficulty: The difficulty level for which to retrieve rankings.
+        '''
+        zone_id = zone if isinstance(zone, int) else zone.id
+
+        data = (await self._query_data(Q_GUILD_RANKING.format(
+            zoneID=zone_id,
+            size=size,
+            difficulty=difficulty,
+        )))['zoneRanking']
+
+        rankings = {}
+        for key in data.keys():
+            if not data[key]:
+                rankings[key] = data[key]
+                continue
+
+            rankings[key] = tuple([
+                FFLogsRank(
+                    number=data[key][rank]['number'],
+                    color=data[key][rank]['color'],
+                    percentile=None,
+                ) for rank in ('worldRank', 'regionRank', 'serverRank')
+            ])
+
+        return FFLogsGuildZoneRankings(
+            completion_speed=rankings['completeRaidSpeed'],
+            progress=rankings['progress'],
+            speed=rankings['speed'],
+        )
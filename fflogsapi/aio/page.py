@@ -0,0 +1,381 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
+
+from ..data.page import FFLogsPage
+from ..data.queries import Q_PAGE_META
+from ..util.checkpoint import load_checkpoint, pagination_state, save_checkpoint
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+
+
+class AsyncFFLogsPage:
+    '''
+    Asynchronous representation of a page of data on FFLogs.
+    Base class for specific page types, do not use.
+
+    The page query, indices and data fields are taken from the synchronous page class given
+    by `PAGE_CLASS`. Pages returned by an :class:`AsyncFFLogsPaginationIterator` have already been
+    queried, so their objects can be iterated over without awaiting anything.
+    '''
+
+    # Synchronous page class describing how to query for pages
+    PAGE_CLASS: type[FFLogsPage] = FFLogsPage
+
+    def __init__(self,
+                 page_num: int,
+                 filters: dict[str, str] = {},
+                 client: 'AsyncFFLogsClient' = None,
+                 additional_formatting: dict[str, str] = {},
+                 ) -> None:
+        self.page_num = page_num
+        self.n_from = -1
+        self.n_to = -1
+        self.last_page = -1
+        self.has_more_pages = False
+        self.filters = filters.copy()
+        self.additional_formatting = additional_formatting
+        self.data = None
+        self.objects = None
+
+        self._client = client
+        self._initialized = False
+
+    def __iter__(self):
+        if not self._initialized:
+            raise RuntimeError('The page must be fetched before its objects can be iterated over')
+        return (self.object(idx) for idx in range(self.count()))
+
+    def __len__(self) -> int:
+        return self.count()
+
+    async def fetch(self) -> 'AsyncFFLogsPage':
+        '''
+        Retrieves metadata about data contained in this page.
+
+        Returns:
+            The page itself.
+        '''
+        if self._initialized:
+            return self
+
+        self._load(await self._client.q(self._page_query()))
+        return self
+
+    def _page_query(self) -> str:
+        '''
+        INTERNAL
+        Build the query for the metadata of this page.
+        '''
+        self.filters['page'] = self.page_num
+        filters = construct_filter_string(self.filters)
+        data_fields = ','.join(self.PAGE_CLASS.DATA_FIELDS)
+        return self.PAGE_CLASS.PAGINATION_QUERY.format(
+            filters=filters,
+            innerQuery=Q_PAGE_META.format(dataFields=data_fields),
+            **self.additional_formatting,
+        )
+
+    def _load(self, result: dict[str, Any]) -> None:
+        '''
+        INTERNAL
+        Store the metadata of this page from the result of its query.
+        '''
+        page_data = itindex(result, self.PAGE_CLASS.PAGE_INDICES)
+
+        self.n_from = page_data['from']
+        self.n_to = page_data['to']
+        self.last_page = page_data['last_page']
+        self.has_more_pages = page_data['has_more_pages']
+        self.data = page_data['data']
+        self.objects = [None] * len(self.data)
+
+        self._initialized = True
+
+    def count(self) -> int:
+        '''
+        Returns:
+            The amount of objects in this page.
+        '''
+        return (self.n_to - self.n_from) + 1
+
+    def init_object(self, data: dict) -> Any:
+        '''
+        Initializes an instance of the object being paginated. Defaults to the behavior of the
+        synchronous page class, which is suitable for pages of plain dataclasses.
+        '''
+        return self.PAGE_CLASS.init_object(self, data)
+
+    def object(self, idx: int) -> Optional[Any]:
+        '''
+        Get a specific object from this page.
+
+        Args:
+            idx: The page index of the object to retrieve from the page
+        Returns:
+            An object or None if the object is not contained in the page
+        '''
+        if idx < 0 or idx > len(self.data):
+            return None
+
+        if self.objects[idx] is None:
+            self.objects[idx] = self.init_object(self.data[idx])
+
+        return self.objects[idx]
+
+
+class AsyncFFLogsPaginationIterator:
+    '''
+    Asynchronously iterates over multiple pages (a pagination), returning fetched pages.
+
+    .. code-block:: python
+
+        async for page in client.reports(filters={'guildID': 80551}):
+            for report in page:
+                ...
+
+    The first page is fetched along with the number of pages in the pagination. With `prefetch`,
+    the next pages are fetched concurrently while the current page is being processed. With
+    `bulk`, pages are fetched in groups of `bulk` pages, with one request per group.
+
+    Use :func:`iter_objects` to iterate over the objects of all pages directly:
+
+    .. code-block:: python
+
+        async for report in client.reports(filters={'guildID': 80551}).iter_objects():
+            ...
+
+    Iterations can be limited to a range of pages and checkpointed to a file, see
+    :class:`fflogsapi.data.page.FFLogsPaginationIterator`.
+    '''
+
+    # The page class of the pages in the pagination
+    PAGE_CLASS: type[AsyncFFLogsPage] = None
+
+    def __init__(
+        self,
+        client: 'AsyncFFLogsClient',
+        filters: dict[str, Any] = {},
+        additional_formatting: dict[str, str] = {},
+        prefetch: int = 0,
+        bulk: int = 1,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        checkpoint: Optional[str] = None,
+    ) -> None:
+        '''
+        If the pagination query requires any additional formatting,
+        it can be specified using `additional_formatting`.
+
+        `prefetch` is the amount of pages to fetch ahead of the current page. `bulk` is the amount
+        of pages to fetch per request.
+
+        `start_page` and `end_page` limit the iteration to a range of pages. `checkpoint` is the
+        path of a file to save the progress of the iteration to. If the file already exists, the
+        iteration resumes from it, and its page range replaces the given one.
+
+        Raises:
+            ValueError if the checkpoint file belongs to a different pagination.
+        '''
+        if prefetch < 0:
+            raise ValueError('The amount of pages to prefetch can not be negative')
+        if bulk < 1:
+            raise ValueError(f'The amount of pages per request must be at least 1 (got {bulk})')
+        if start_page < 1:
+            raise ValueError(f'The first page of a pagination is page 1 (got {start_page})')
+
+        self._client = client
+        self._filters = filters.copy()
+        self._first_page = None
+        self.additional_formatting = additional_formatting
+        self.prefetch = prefetch
+        self.bulk = bulk
+        self.start_page = start_page
+        self.end_page = end_page
+        self.checkpoint = checkpoint
+
+        if checkpoint is not None:
+            state = load_checkpoint(
+                checkpoint,
+                pagination='.'.join(self.PAGE_CLASS.PAGE_CLASS.PAGE_INDICES),
+                filters=self._filters,
+                additional_formatting=self.additional_formatting,
+            )
+            if state is not None:
+                self.start_page = state['page']
+                self.end_page = state['end_page']
+
+        self._cur_page = self.start_page - 1
+        # fetched or prefetching groups of pages, by the number of their first page
+        self._pending: dict[int, Union[asyncio.Task, list[AsyncFFLogsPage]]] = {}
+
+    def __aiter__(self) -> 'AsyncFFLogsPaginationIterator':
+        return self
+
+    async def first_page(self) -> AsyncFFLogsPage:
+        '''
+        Returns:
+            The first page of the iteration (`start_page`), which is fetched in the same query
+            as the number of the last page.
+        '''
+        if self._first_page is None:
+            self._first_page = await self._make_page(self.start_page).fetch()
+        return self._first_page
+
+    async def last_page(self) -> int:
+        '''
+        Returns:
+            The number of the last page in the pagination.
+        '''
+        return (await self.first_page()).last_page
+
+    def state(self) -> dict[str, Any]:
+        '''
+        Get the progress of the iteration, which is what is saved to the checkpoint file.
+
+        Returns:
+            A JSON serializable description of the iteration. Its ``page`` is the first page that
+            has not been returned by the iterator yet.
+        '''
+        return pagination_state(
+            pagination='.'.join(self.PAGE_CLASS.PAGE_CLASS.PAGE_INDICES),
+            page=self._cur_page + 1,
+            end_page=self.end_page,
+            filters=self._filters,
+            additional_formatting=self.additional_formatting,
+        )
+
+    async def page_ranges(self, parts: int) -> list[tuple[int, int]]:
+        '''
+        Split the pages of the iteration into ranges of (almost) equal size, e.g. to iterate over
+        them in separate processes with `start_page` and `end_page`.
+
+        Args:
+            parts: The amount of ranges to split the pages into.
+        Returns:
+            The first and last page of each range. Empty ranges are left out.
+        '''
+        first, last = self.start_page, await self._range_end()
+        count = max(last - first + 1, 0)
+        bounds = [first + count * part // parts for part in range(parts + 1)]
+        return [(start, end - 1) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    async def fetch_pages(self, first: int, last: int) -> list[AsyncFFLogsPage]:
+        '''
+        Fetch a range of pages, merging the queries of up to `bulk` pages into each request.
+
+        Args:
+            first: The number of the first page to fetch.
+            last: The number of the last page to fetch.
+        Returns:
+            The fetched pages, in page order.
+        '''
+        pages = [self._make_page(page_num) for page_num in range(first, last + 1)]
+        if len(pages) == 1:
+            await pages[0].fetch()
+            return pages
+
+        async with self._client.batch(max_size=self.bulk) as batch:
+            queries = [batch.q(page._page_query()) for page in pages]
+        for page, query in zip(pages, queries):
+            page._load(query.result())
+        return pages
+
+    async def iter_objects(self) -> AsyncIterator[Any]:
+        '''
+        Iterate over the objects of all pages in the pagination, fetching pages as needed.
+
+        Returns:
+            An asynchronous iterator over the objects of all pages, in page order.
+        '''
+        async for page in self:
+            for obj in page:
+                yield obj
+
+    def _make_page(self, page_num: int) -> AsyncFFLogsPage:
+        '''
+        INTERNAL
+        Create a page of the pagination.
+        '''
+        return self.PAGE_CLASS(
+            page_num=page_num,
+            filters=self._filters,
+            client=self._client,
+            additional_formatting=self.additional_formatting,
+        )
+
+    async def _range_end(self) -> int:
+        '''
+        INTERNAL
+        The last page of the iteration.
+        '''
+        if self.end_page is None:
+            return await self.last_page()
+        return min(self.end_page, await self.last_page())
+
+    def _group(self, page_num: int, last_page: int) -> tuple[int, int]:
+        '''
+        INTERNAL
+        Find the first and last page of the group of pages fetched together with a page.
+        '''
+        # the first page is always fetched on its own, so groups start from the page after it
+        offset = self.start_page + 1
+        first = offset + ((page_num - offset) // self.bulk) * self.bulk
+        return first, min(first + self.bulk - 1, last_page)
+
+    async def __anext__(self) -> AsyncFFLogsPage:
+        # requesting the next page means that the previous pages are done
+        if self.checkpoint is not None:
+            save_checkpoint(self.checkpoint, self.state())
+
+        self._cur_page += 1
+        # a finished checkpoint starts past the end page, don't fetch a page to find out
+        if self.end_page is not None and self._cur_page > self.end_page:
+            last_page = self.end_page
+        else:
+            last_page = await self._range_end()
+        if self._cur_page > last_page:
+            if self.checkpoint is None:
+                self._cur_page = self.start_page - 1
+            else:
+                # keep the checkpoint finished instead of starting the iteration over
+                self._cur_page -= 1
+            self.close()
+            raise StopAsyncIteration
+
+        if self.prefetch:
+            last_prefetch = min(self._cur_page + self.prefetch, last_page)
+            for page_num in range(self._cur_page + 1, last_prefetch + 1):
+                first, last = self._group(page_num, last_page)
+                if first not in self._pending:
+                    self._pending[first] = asyncio.ensure_future(self.fetch_pages(first, last))
+
+        if self._cur_page == self.start_page:
+            return await self.first_page()
+        if not self.prefetch and self.bulk == 1:
+            return await self._make_page(self._cur_page).fetch()
+
+        first, last = self._group(self._cur_page, last_page)
+        pages = self._pending.get(first)
+        if pages is None:
+            pages = await self.fetch_pages(first, last)
+        elif isinstance(pages, asyncio.Task):
+            pages = await pages
+
+        if self._cur_page == last:
+            self._pending.pop(first, None)
+        else:
+            self._pending[first] = pages
+        return pages[self._cur_page - first]
+
+    def close(self) -> None:
+        '''
+        Cancel the fetching of prefetched pages. Only needed if the iteration is stopped early
+        while prefetching pages.
+        '''
+        for pages in self._pending.values():
+            if isinstance(pages, asyncio.Task):
+                pages.cancel()
+        self._pending = {}
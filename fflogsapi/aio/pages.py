@@ -0,0 +1,216 @@
+from typing import TYPE_CHECKING
+
+from ..data import FFLogsAttendanceReport
+from ..game.pages import FFLogsAbilityPage, FFLogsItemPage, FFLogsMapPage
+from ..guilds.pages import FFLogsCharacterPage, FFLogsGuildAttendancePage, FFLogsGuildPage
+from ..reports.pages import FFLogsReportPage
+from ..world.pages import (FFLogsRegionServerPage, FFLogsServerCharacterPage,
+                           FFLogsSubregionServerPage,)
+from .page import AsyncFFLogsPage, AsyncFFLogsPaginationIterator
+
+if TYPE_CHECKING:
+    from .character import AsyncFFLogsCharacter
+    from .guild import AsyncFFLogsGuild
+    from .report import AsyncFFLogsReport
+    from .world import AsyncFFLogsServer
+
+
+class AsyncFFLogsReportPage(AsyncFFLogsPage):
+    '''
+    A page of reports on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsReportPage
+
+    def init_object(self, data: dict) -> 'AsyncFFLogsReport':
+        '''
+        Initializes a report with the given code.
+        '''
+        from .report import AsyncFFLogsReport
+        return AsyncFFLogsReport(code=data['code'], client=self._client)
+
+
+class AsyncFFLogsReportPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple report pages
+    '''
+
+    PAGE_CLASS = AsyncFFLogsReportPage
+
+
+class AsyncFFLogsGuildPage(AsyncFFLogsPage):
+    '''
+    A page of guilds on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsGuildPage
+
+    def init_object(self, data: dict) -> 'AsyncFFLogsGuild':
+        '''
+        Creates a guild from the given data
+        '''
+        from .guild import AsyncFFLogsGuild
+        return AsyncFFLogsGuild(id=data['id'], client=self._client)
+
+
+class AsyncFFLogsGuildPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of guilds.
+    '''
+
+    PAGE_CLASS = AsyncFFLogsGuildPage
+
+
+class AsyncFFLogsGuildAttendancePage(AsyncFFLogsPage):
+    '''
+    A page of guild attendance reports on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsGuildAttendancePage
+
+    def init_object(self, data: dict) -> FFLogsAttendanceReport:
+        '''
+        Creates an attendance report from the given data
+        '''
+        from .report import AsyncFFLogsReport
+        from .world import AsyncFFLogsZone
+        return FFLogsAttendanceReport(
+            report=AsyncFFLogsReport(data['code'], client=self._client),
+            players=[(p['name'], p['presence'], p['type']) for p in data['players']],
+            start=data['startTime'],
+            zone=AsyncFFLogsZone(id=data['zone']['id'], client=self._client),
+        )
+
+
+class AsyncFFLogsGuildAttendancePaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of guild attendance reports
+    '''
+
+    PAGE_CLASS = AsyncFFLogsGuildAttendancePage
+
+
+class AsyncFFLogsGuildCharacterPage(AsyncFFLogsPage):
+    '''
+    A page of a guild's characters on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsCharacterPage
+
+    def init_object(self, data: dict) -> 'AsyncFFLogsCharacter':
+        '''
+        Initializes a character with the given ID.
+        '''
+        from .character import AsyncFFLogsCharacter
+        return AsyncFFLogsCharacter(id=data['id'], client=self._client)
+
+
+class AsyncFFLogsGuildCharacterPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of a guild's characters
+    '''
+
+    PAGE_CLASS = AsyncFFLogsGuildCharacterPage
+
+
+class AsyncFFLogsServerCharacterPage(AsyncFFLogsGuildCharacterPage):
+    '''
+    A page of a server's characters on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsServerCharacterPage
+
+
+class AsyncFFLogsServerCharacterPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of a server's characters.
+    '''
+
+    PAGE_CLASS = AsyncFFLogsServerCharacterPage
+
+
+class AsyncFFLogsRegionServerPage(AsyncFFLogsPage):
+    '''
+    A page of a region's servers on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsRegionServerPage
+
+    def init_object(self, data: dict) -> 'AsyncFFLogsServer':
+        '''
+        Initializes a server with the given ID.
+        '''
+        from .world import AsyncFFLogsServer
+        return AsyncFFLogsServer(id=data['id'], client=self._client)
+
+
+class AsyncFFLogsRegionServerPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of a region's servers
+    '''
+
+    PAGE_CLASS = AsyncFFLogsRegionServerPage
+
+
+class AsyncFFLogsSubregionServerPage(AsyncFFLogsRegionServerPage):
+    '''
+    A page of a subregion's servers on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsSubregionServerPage
+
+
+class AsyncFFLogsSubregionServerPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple pages of a subregion's servers
+    '''
+
+    PAGE_CLASS = AsyncFFLogsSubregionServerPage
+
+
+class AsyncFFLogsAbilityPage(AsyncFFLogsPage):
+    '''
+    A page of game abilities on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsAbilityPage
+
+
+class AsyncFFLogsAbilityPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple ability pages
+    '''
+
+    PAGE_CLASS = AsyncFFLogsAbilityPage
+
+
+class AsyncFFLogsItemPage(AsyncFFLogsPage):
+    '''
+    A page of game items on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsItemPage
+
+
+class AsyncFFLogsItemPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple item pages
+    '''
+
+    PAGE_CLASS = AsyncFFLogsItemPage
+
+
+class AsyncFFLogsMapPage(AsyncFFLogsPage):
+    '''
+    A page of game maps on FF Logs.
+    '''
+
+    PAGE_CLASS = FFLogsMapPage
+
+
+class AsyncFFLogsMapPaginationIterator(AsyncFFLogsPaginationIterator):
+    '''
+    Iterates over multiple map pages
+    '''
+
+    PAGE_CLASS = AsyncFFLogsMapPage
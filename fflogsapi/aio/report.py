@@ -0,0 +1,457 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..data import (FFLogsActor, FFLogsArchivalData, FFLogsPhase, FFLogsReportAbility,
+                    FFLogsReportTag,)
+from ..reports.queries import (IQ_REPORT_ABILITIES, IQ_REPORT_ACTORS, IQ_REPORT_LOG_VERSION,
+                               IQ_REPORT_PHASES, Q_REPORT_DATA,)
+from ..util.decorators import async_fetch_data
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+from ..util.timeslicing import partition_events
+from .character import AsyncFFLogsCharacter
+from .fight import AsyncFFLogsFight
+from .user import AsyncFFLogsUser
+from .world import AsyncFFLogsRegion, AsyncFFLogsZone
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+    from .guild import AsyncFFLogsGuild
+
+
+class AsyncFFLogsReport:
+    '''
+    Asynchronous representation of a report on FF Logs.
+
+    See :class:`fflogsapi.reports.FFLogsReport` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['reportData', 'report']
+
+    code: str = ''
+    ''' The code for this report '''
+
+    def __init__(self, code: str, client: 'AsyncFFLogsClient' = None) -> None:
+        self.code = code
+        self._fights = {}
+        self._data = {}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        INTERNAL
+        Build the query for a specific piece of information from a report.
+        '''
+        return Q_REPORT_DATA.format(
+            reportCode=self.code,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        INTERNAL
+        Query for a specific piece of information from a report.
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    async def _events_page(self, filters: dict[str, Any]) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Retrieve a single page of events, starting at the start time of the given filters.
+        '''
+        filter_string = construct_filter_string(filters)
+        result = await self._query_data(f'events({filter_string}) {{ data, nextPageTimestamp }}')
+        return result['events']
+
+    async def _collect_events(self, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve all pages of events between the start and end time of the given filters.
+        '''
+        filters = filters.copy()
+
+        # used for pagination
+        desired_end = filters['endTime']
+
+        page = await self._events_page(filters)
+        # the page data may be read-only, collect the events in a new list
+        events = list(page['data'])
+
+        next_page = page['nextPageTimestamp']
+        while next_page and next_page < desired_end:
+            filters['startTime'] = next_page
+            page = await self._events_page(filters)
+            events.extend(page['data'])
+            next_page = page['nextPageTimestamp']
+
+        return events
+
+    async def _query_phases(self) -> dict[int, list[FFLogsPhase]]:
+        '''
+        INTERNAL
+        Query for all phase data exposed by this report
+
+        Returns:
+            A dictionary mapping encounter IDs in the report to a list of phases for that encounter
+        '''
+        if 'phases' not in self._data:
+            all_phases: dict[int, list[FFLogsPhase]] = {}
+            encounter_phases = (await self._query_data(IQ_REPORT_PHASES))['phases']
+            for encounter in encounter_phases:
+                separates_wipes = encounter['separatesWipes']
+                all_phases[encounter['encounterID']] = []
+                for phase in encounter['phases']:
+                    phase = FFLogsPhase(
+                        id=phase['id'],
+                        name=phase['name'],
+                        intermission=phase['isIntermission'],
+                        separates_wipes=separates_wipes,
+                    )
+                    all_phases[encounter['encounterID']].append(phase)
+            self._data['phases'] = all_phases
+        return self._data['phases']
+
+    async def actors(self) -> list[FFLogsActor]:
+        '''
+        Returns:
+            A list of all actors in the report
+        '''
+        if 'masterActors' not in self._data:
+            actors = (await self._query_data(IQ_REPORT_ACTORS))['masterData']['actors']
+            actors = sorted(actors, key=lambda a: a['id'])
+
+            jobs = await self._client.jobs_by_slug()
+            all_actors = {}
+            for actor in actors:
+                actor = FFLogsActor(
+                    report=self,
+                    id=actor['id'],
+                    name=actor['name'],
+                    type=actor['type'],
+                    sub_type=actor['subType'],
+                    server=actor['server'],
+                    game_id=actor['gameID'],
+                    job=jobs.get(actor['subType']),
+                    pet_owner=None,
+                )
+                all_actors[actor.id] = actor
+
+            # 2nd pass to fill pet owner fields with actual FFLogsActors instead of just IDs
+            pets = {}
+            for actor in actors:
+                if actor['petOwner'] is None:
+                    continue
+                all_actors[actor['id']].pet_owner = all_actors[actor['petOwner']]
+                pets.setdefault(actor['petOwner'], []).append(all_actors[actor['id']])
+
+            self._data['masterActors'] = list(all_actors.values())
+            self._data['masterActorsByID'] = all_actors
+            self._data['masterPets'] = pets
+
+        return self._data['masterActors']
+
+    async def actor(self, id: int) -> Optional[FFLogsActor]:
+        '''
+        Get a specific actor by their report ID.
+
+        Args:
+            id: The report ID of the actor.
+        Returns:
+            An actor or None if there is no actor with the given ID.
+        '''
+        # side effect to get actor data
+        await self.actors()
+        return self._data['masterActorsByID'].get(id)
+
+    async def pets(self, owner_id: int) -> list[FFLogsActor]:
+        '''
+        Get the pets of an actor.
+
+        Args:
+            owner_id: The report ID of the pet owner.
+        Returns:
+            The pets owned by the actor.
+        '''
+        await self.actors()
+        return list(self._data['masterPets'].get(owner_id, []))
+
+    async def abilities(self) -> list[FFLogsReportAbility]:
+        '''
+        Returns:
+            A list of all abilities in the report
+        '''
+        if 'masterAbilities' not in self._data:
+            abilities = (await self._query_data(IQ_REPORT_ABILITIES))['masterData']['abilities']
+            self._data['masterAbilities'] = [FFLogsReportAbility(
+                game_id=ability['gameID'],
+                name=ability['name'],
+                type=ability['type'],
+            ) for ability in abilities]
+
+        return self._data['masterAbilities']
+
+    async def ability(self, game_id: int) -> Optional[FFLogsReportAbility]:
+        '''
+        Get a specific ability by its game ID.
+
+        Args:
+            game_id: The game ID of the ability.
+        Returns:
+            An ability or None if the ability is not in the report.
+        '''
+        # side effect to get ability data
+        await self.abilities()
+        return self._data['masterAbilitiesByID'].get(game_id)
+
+    async def log_version(self) -> int:
+        '''
+        Returns:
+            The version of the parser client used to parse and upload the log file.
+        '''
+        result = await self._query_data(IQ_REPORT_LOG_VERSION)
+        return result['masterData']['logVersion']
+
+    @async_fetch_data('title')
+    async def title(self) -> str:
+        '''
+        Returns:
+            The title of this report.
+        '''
+        return self._data['title']
+
+    async def archivation_data(self) -> FFLogsArchivalData:
+        '''
+        Get the archivation status for this report, including archival date, if any.
+
+        Returns:
+            The report's archivation data.
+        '''
+        data = (await self._query_data(
+            'archiveStatus{ isArchived, isAccessible, archiveDate }'
+        ))['archiveStatus']
+
+        return FFLogsArchivalData(
+            archived=data['isArchived'],
+            accessible=data['isAccessible'],
+            date=data['archiveDate'],
+        )
+
+    async def owner(self) -> AsyncFFLogsUser:
+        '''
+        Returns:
+            The user that owns this report.
+        '''
+        owner_id = (await self._query_data('owner{ id }'))['owner']['id']
+        return AsyncFFLogsUser(id=owner_id, client=self._client)
+
+    async def guild(self) -> Optional['AsyncFFLogsGuild']:
+        '''
+        Returns:
+            The guild this report belongs to, if any.
+        '''
+        from .guild import AsyncFFLogsGuild
+        guild = (await self._query_data('guild{ id }'))['guild']
+        if guild is None:
+            return None
+        return AsyncFFLogsGuild(id=guild['id'], client=self._client)
+
+    async def tag(self) -> Optional[FFLogsReportTag]:
+        '''
+        The tag applied to this report used by the guild to which this report belongs. If a tag
+        was not applied, returns None.
+
+        Returns:
+            The report tag, if any.
+        '''
+        tag = (await self._query_data('guildTag{ id, name }'))['guildTag']
+        if tag is None:
+            return None
+        return FFLogsReportTag(id=tag['id'], name=tag['name'], guild=await self.guild())
+
+    async def zone(self) -> AsyncFFLogsZone:
+        '''
+        Returns:
+            The principal zone for fights in this report.
+        '''
+        zone_id = (await self._query_data('zone{ id }'))['zone']['id']
+        return AsyncFFLogsZone(id=zone_id, client=self._client)
+
+    async def region(self) -> AsyncFFLogsRegion:
+        '''
+        Returns:
+            The region of the report.
+        '''
+        id = (await self._query_data('region{ id }'))['region']['id']
+        return AsyncFFLogsRegion(id=id, client=self._client)
+
+    @async_fetch_data('startTime')
+    async def start_time(self) -> float:
+        '''
+        Returns:
+            The start timestamp of the report.
+        '''
+        return self._data['startTime']
+
+    @async_fetch_data('endTime')
+    async def end_time(self) -> float:
+        '''
+        Returns:
+            The end timestamp of the report.
+        '''
+        return self._data['endTime']
+
+    @async_fetch_data('segments')
+    async def segments(self) -> int:
+        '''
+        Returns:
+            The amount of segments uploaded to this report.
+        '''
+        return self._data['segments']
+
+    @async_fetch_data('exportedSegments')
+    async def exported_segments(self) -> int:
+        '''
+        Returns:
+            The amount of segments in this report that were exported.
+        '''
+        return self._data['exportedSegments']
+
+    @async_fetch_data('visibility')
+    async def visibility(self) -> str:
+        '''
+        Get the visibility level of the report. Can be `public`, `private` or `unlisted`.
+
+        Returns:
+            The visibility of the report.
+        '''
+        return self._data['visibility']
+
+    @async_fetch_data('revision')
+    async def revision(self) -> int:
+        '''
+        Get the report's revision number, which is increased every time the report is re-exported.
+
+        Returns:
+            The report's revision number.
+        '''
+        return self._data['revision']
+
+    async def duration(self) -> float:
+        '''
+        Returns:
+            The total duration of the report
+        '''
+        return (await self.end_time()) - (await self.start_time())
+
+    async def fight_count(self) -> int:
+        '''
+        Returns:
+            The total amount of fights in the report
+        '''
+        result = await self._query_data('fights { id }')
+        return len(result['fights'])
+
+    async def fight(self, id: int = -1) -> Optional[AsyncFFLogsFight]:
+        '''
+        Get a specific fight from this report.
+
+        Args:
+            id: The ID of the fight to retrieve. Default: last fight
+        Returns:
+            An AsyncFFLogsFight object or None if the fight is not in the report
+        '''
+        fight_count = await self.fight_count()
+        if id == -1:
+            id = fight_count
+
+        if id < 1 or id > fight_count:
+            return None
+
+        if id not in self._fights:
+            self._fights[id] = AsyncFFLogsFight(
+                report=self,
+                fight_id=id,
+                client=self._client,
+            )
+
+        return self._fights[id]
+
+    async def prefetch(self, fields: Optional[list[str]] = None) -> None:
+        '''
+        Fetch multiple fields of every fight in the report with a single query.
+
+        Args:
+            fields: The names of the fight fields to fetch. By default, the fields listed in
+                    :attr:`AsyncFFLogsFight.PREFETCH_FIELDS` are fetched.
+        '''
+        fields = [field for field in fields or AsyncFFLogsFight.PREFETCH_FIELDS if field != 'id']
+        fights = (await self._query_data(f'fights {{ id {" ".join(fields)} }}'))['fights']
+
+        for data in fights:
+            if data['id'] not in self._fights:
+                self._fights[data['id']] = AsyncFFLogsFight(
+                    report=self,
+                    fight_id=data['id'],
+                    client=self._client,
+                )
+
+            fight = self._fights[data['id']]
+            for field in fields:
+                fight._data[field] = data[field]
+
+    async def fights(self) -> list[AsyncFFLogsFight]:
+        '''
+        Returns:
+            A list of all fights in this report.
+        '''
+        fight_count = await self.fight_count()
+        if len(self._fights) < fight_count:
+            for id in range(1, fight_count + 1):
+                # fight() will update _fights as a side effect
+                await self.fight(id=id)
+        return list(self._fights.values())
+
+    async def events_by_fight(
+        self,
+        filters: dict[str, Any] = {},
+    ) -> dict[int, list[dict[str, Any]]]:
+        '''
+        Retrieves the events of all fights in the report at once.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+        Returns:
+            The events of each fight, by fight ID.
+        '''
+        await self.prefetch(fields=['startTime', 'endTime'])
+        fights = [
+            (fight.id, fight._data['startTime'], fight._data['endTime'])
+            for fight in await self.fights()
+            if 'fightIDs' not in filters or fight.id in filters['fightIDs']
+        ]
+        if not fights:
+            return {}
+
+        filters = filters.copy()
+        filters['fightIDs'] = [fight_id for fight_id, _, _ in fights]
+        filters.setdefault('startTime', min(start for _, start, _ in fights))
+        filters.setdefault('endTime', max(end for _, _, end in fights))
+
+        return partition_events(await self._collect_events(filters), fights)
+
+    async def ranked_characters(self) -> list[AsyncFFLogsCharacter]:
+        '''
+        Get all the characters that ranked on kills in this report.
+
+        Returns:
+            A list of all ranked characters.
+        '''
+        if 'rankedCharacters' not in self._data:
+            characters = (await self._query_data('rankedCharacters{ id }'))['rankedCharacters']
+            self._data['rankedCharacters'] = [
+                AsyncFFLogsCharacter(id=character['id'], client=self._client)
+                for character in characters
+            ]
+
+        return self._data['rankedCharacters']
@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING, Any
+
+from ..user.queries import Q_USER
+from ..util.decorators import async_fetch_data
+from ..util.indexing import itindex
+from .character import AsyncFFLogsCharacter
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+    from .guild import AsyncFFLogsGuild
+
+
+class AsyncFFLogsUser:
+    '''
+    Asynchronous FF Logs user information object.
+
+    See :class:`fflogsapi.user.FFLogsUser` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['userData', 'user']
+
+    id: int = -1
+    ''' The ID of the user '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a user
+        '''
+        return Q_USER.format(
+            userID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a user
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The name of the user.
+        '''
+        return self._data['name']
+
+    async def characters(self) -> list[AsyncFFLogsCharacter]:
+        '''
+        Only available when the client is in user mode.
+
+        Returns:
+            A list of characters claimed by the user.
+        '''
+        characters = (await self._query_data('characters { id }'))['characters']
+        return [AsyncFFLogsCharacter(id=c['id'], client=self._client) for c in characters]
+
+    async def guilds(self) -> list['AsyncFFLogsGuild']:
+        '''
+        Only available when the client is in user mode.
+
+        Returns:
+            A list of guilds the user belongs to.
+        '''
+        from .guild import AsyncFFLogsGuild
+        guilds = (await self._query_data('guilds { id }'))['guilds']
+        return [AsyncFFLogsGuild(id=guild['id'], client=self._client) for guild in guilds]
@@ -0,0 +1,544 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..data import FFLogsPartition
+from ..util.decorators import async_fetch_data
+from ..util.filters import construct_filter_string
+from ..util.indexing import itindex
+from ..world.queries import Q_ENCOUNTER, Q_EXPANSION, Q_REGION, Q_SERVER, Q_SUBREGION, Q_ZONE
+from .pages import (AsyncFFLogsRegionServerPaginationIterator,
+                    AsyncFFLogsServerCharacterPaginationIterator,
+                    AsyncFFLogsSubregionServerPaginationIterator,)
+
+if TYPE_CHECKING:
+    from .client import AsyncFFLogsClient
+
+
+class AsyncFFLogsEncounter:
+    '''
+    Asynchronous representation of an encounter on FF Logs.
+
+    See :class:`fflogsapi.world.FFLogsEncounter` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'encounter']
+
+    id: int = -1
+    ''' The ID of the encounter '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about an encounter
+        '''
+        return Q_ENCOUNTER.format(
+            encounterID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about an encounter
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The encounter's name.
+        '''
+        return self._data['name']
+
+    async def zone(self) -> 'AsyncFFLogsZone':
+        '''
+        Returns:
+            The encounter's zone.
+        '''
+        zone_id = (await self._query_data('zone{ id }'))['zone']['id']
+        return AsyncFFLogsZone(id=zone_id, client=self._client)
+
+    async def character_rankings(self, filters: dict[str, Any] = {}) -> dict:
+        '''
+        Args:
+            filters: Filters to use when retrieving character rankings for the encounter.
+        Returns:
+            The encounter's filtered character ranking data.
+        '''
+        filters = construct_filter_string(filters)
+        if filters:
+            filters = f'({filters})'
+
+        result = await self._query_data(f'characterRankings{filters}')
+        return result['characterRankings']
+
+    async def fight_rankings(self, filters: dict[str, Any] = {}) -> dict:
+        '''
+        Args:
+            filters: Filters to use when retrieving fight rankings for the encounter.
+        Returns:
+            The encounter's filtered fight ranking data.
+        '''
+        filters = construct_filter_string(filters)
+        if filters:
+            filters = f'({filters})'
+
+        result = await self._query_data(f'fightRankings{filters}')
+        return result['fightRankings']
+
+
+class AsyncFFLogsExpansion:
+    '''
+    Asynchronous representation of an expansion on FF Logs.
+
+    See :class:`fflogsapi.world.FFLogsExpansion` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'expansion']
+
+    id: int = -1
+    ''' The ID of the expansion '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a expansion
+        '''
+        return Q_EXPANSION.format(
+            expansionID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a expansion
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The expansion's name.
+        '''
+        return self._data['name']
+
+    async def zones(self) -> list['AsyncFFLogsZone']:
+        '''
+        Returns:
+            A list of the expansion's zones.
+        '''
+        zones = (await self._query_data('zones{ id }'))['zones']
+        return [AsyncFFLogsZone(id=zone['id'], client=self._client) for zone in zones]
+
+
+class AsyncFFLogsZone:
+    '''
+    Asynchronous representation of a zone on FF Logs.
+
+    See :class:`fflogsapi.world.FFLogsZone` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'zone']
+
+    id: int = -1
+    ''' The ID of the zone '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a zone
+        '''
+        return Q_ZONE.format(
+            zoneID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a zone
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The zone's name.
+        '''
+        return self._data['name']
+
+    @async_fetch_data('frozen')
+    async def frozen(self) -> bool:
+        '''
+        Returns:
+            Whether or not the zone is frozen.
+        '''
+        return self._data['frozen']
+
+    async def encounters(self) -> list[AsyncFFLogsEncounter]:
+        '''
+        Returns:
+            A list of the zone's encounters.
+        '''
+        encounters = (await self._query_data('encounters{ id }'))['encounters']
+        return [AsyncFFLogsEncounter(id=e['id'], client=self._client) for e in encounters]
+
+    async def brackets(self) -> dict:
+        '''
+        Returns:
+            The zone's bracket information.
+        '''
+        bracket_info = await self._query_data('brackets{ type, min, max, bucket }')
+        return bracket_info['brackets']
+
+    async def partitions(self) -> list[FFLogsPartition]:
+        '''
+        Returns:
+            The zone's partition information.
+        '''
+        if 'partitions' not in self._data:
+            partition_info = await self._query_data(
+                'partitions{ id, name, compactName, default }',
+            )
+            self._data['partitions'] = [FFLogsPartition(
+                id=partition['id'],
+                name=partition['name'],
+                compact_name=partition['compactName'],
+                default=partition['default'],
+            ) for partition in partition_info['partitions']]
+
+        return list(self._data['partitions'])
+
+    async def difficulties(self) -> dict:
+        '''
+        Returns:
+            The zone's difficulty information.
+        '''
+        difficulty_info = await self._query_data('difficulties{ id, name, sizes }')
+        return difficulty_info['difficulties']
+
+    async def expansion(self) -> AsyncFFLogsExpansion:
+        '''
+        Returns:
+            The expansion that this zone belongs to.
+        '''
+        expac_id = (await self._query_data('expansion{ id }'))['expansion']['id']
+        return AsyncFFLogsExpansion(id=expac_id, client=self._client)
+
+
+class AsyncFFLogsRegion:
+    '''
+    Asynchronous representation of a region on FF Logs.
+
+    See :class:`fflogsapi.world.FFLogsRegion` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'region']
+
+    id: int = -1
+    ''' The ID of the region '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a region
+        '''
+        return Q_REGION.format(
+            regionID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a region
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The region's name.
+        '''
+        return self._data['name']
+
+    @async_fetch_data('compactName')
+    async def compact_name(self) -> str:
+        '''
+        Returns:
+            The region's compact name.
+        '''
+        return self._data['compactName']
+
+    @async_fetch_data('slug')
+    async def slug(self) -> str:
+        '''
+        Returns:
+            The region's slug.
+        '''
+        return self._data['slug']
+
+    def servers(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsRegionServerPaginationIterator:
+        '''
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous pagination iterator of the region's servers.
+        '''
+        return AsyncFFLogsRegionServerPaginationIterator(
+            client=self._client,
+            additional_formatting={'regionID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+    async def subregions(self) -> list['AsyncFFLogsSubregion']:
+        '''
+        Returns:
+            A list of subregions.
+        '''
+        if 'subregions' not in self._data:
+            subregions = (await self._query_data('subregions{ id }'))['subregions']
+            self._data['subregions'] = [
+                AsyncFFLogsSubregion(id=subregion['id'], client=self._client)
+                for subregion in subregions
+            ]
+
+        return self._data['subregions']
+
+
+class AsyncFFLogsSubregion:
+    '''
+    Asynchronous representation of a subregion (data center) on FF Logs.
+
+    See :class:`fflogsapi.world.FFLogsSubregion` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'subregion']
+
+    id: int = -1
+    ''' The ID of the subregion '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a subregion
+        '''
+        return Q_SUBREGION.format(
+            subregionID=self.id,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a subregion
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The subregion's name.
+        '''
+        return self._data['name']
+
+    async def region(self) -> AsyncFFLogsRegion:
+        '''
+        Returns:
+            The subregion's parent region.
+        '''
+        if 'region' not in self._data:
+            region = (await self._query_data('region{ id }'))['region']['id']
+            self._data['region'] = AsyncFFLogsRegion(id=region, client=self._client)
+
+        return self._data['region']
+
+    def servers(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsSubregionServerPaginationIterator:
+        '''
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous pagination iterator of the subregion's servers.
+        '''
+        return AsyncFFLogsSubregionServerPaginationIterator(
+            client=self._client,
+            additional_formatting={'subregionID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
+
+
+class AsyncFFLogsServer:
+    '''
+    Asynchronous representation of a server on FFLogs.
+
+    Unlike :class:`fflogsapi.world.FFLogsServer`, the ID of the server must be known when
+    instantiating it. Use :func:`AsyncFFLogsClient.get_server` to find servers by other filters.
+
+    See :class:`fflogsapi.world.FFLogsServer` for documentation of the individual methods.
+    '''
+
+    DATA_INDICES = ['worldData', 'server']
+
+    id: int = -1
+    ''' The ID of the server '''
+
+    def __init__(self, id: int, client: 'AsyncFFLogsClient' = None) -> None:
+        self.id = id
+        self.filters = {'id': id}
+        self._data = {'id': id}
+        self._client = client
+
+    def _format_query(self, query: str) -> str:
+        '''
+        Build the query for a specific piece of information about a server
+        '''
+        filters = construct_filter_string(self.filters)
+        return Q_SERVER.format(
+            filters=filters,
+            innerQuery=query,
+        )
+
+    async def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a server
+        '''
+        result = await self._client.q(self._format_query(query), ignore_cache=ignore_cache)
+
+        return itindex(result, self.DATA_INDICES)
+
+    @async_fetch_data('name')
+    async def name(self) -> str:
+        '''
+        Returns:
+            The server's name.
+        '''
+        return self._data['name']
+
+    @async_fetch_data('normalizedName')
+    async def normalized_name(self) -> str:
+        '''
+        Returns:
+            The server's normalized name.
+        '''
+        return self._data['normalizedName']
+
+    @async_fetch_data('slug')
+    async def slug(self) -> str:
+        '''
+        Returns:
+            The server's slug.
+        '''
+        return self._data['slug']
+
+    async def region(self) -> AsyncFFLogsRegion:
+        '''
+        Returns:
+            The server's region.
+        '''
+        if 'region' not in self._data:
+            region = (await self._query_data('region{ id }'))['region']['id']
+            self._data['region'] = AsyncFFLogsRegion(id=region, client=self._client)
+
+        return self._data['region']
+
+    async def subregion(self) -> AsyncFFLogsSubregion:
+        '''
+        Returns:
+            The server's subregion.
+        '''
+        if 'subregion' not in self._data:
+            subregion = (await self._query_data('subregion{ id }'))['subregion']['id']
+            self._data['subregion'] = AsyncFFLogsSubregion(id=subregion, client=self._client)
+
+        return self._data['subregion']
+
+    def characters(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> AsyncFFLogsServerCharacterPaginationIterator:
+        '''
+        Args:
+            prefetch: The amount of pages to fetch ahead of the current page concurrently.
+            bulk: The amount of pages to fetch per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
+        Returns:
+            An asynchronous pagination iterator over all pages of characters on the server.
+        '''
+        return AsyncFFLogsServerCharacterPaginationIterator(
+            client=self._client,
+            additional_formatting={'serverID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
@@ -0,0 +1,46 @@
+'''
+Local analysis of fight events.
+
+The analysis tools require ``numpy``, which can be installed with the ``analysis`` extra:
+
+```shell
+pip install fflogsapi[analysis]
+```
+'''
+
+from .auras import AURA_KINDS, FFLogsAuraBands, FFLogsAuraIntervals
+from .columnar import COLUMNS, EVENT_TYPE_CODES, FFLogsEventColumns
+from .expressions import FFLogsFilterExpression, compile_expression
+from .graphs import GRAPH_TYPES, FFLogsGraph, build_graph
+from .index import INDEXED_FIELDS, FFLogsEventIndex
+from .tables import DATA_TYPES, SUPPORTED_FILTERS, FFLogsTableEngine
+
+__all__ = [
+    # auras.py
+    'AURA_KINDS',
+    'FFLogsAuraBands',
+    'FFLogsAuraIntervals',
+
+    # columnar.py
+    'COLUMNS',
+    'EVENT_TYPE_CODES',
+    'FFLogsEventColumns',
+
+    # expressions.py
+    'FFLogsFilterExpression',
+    'compile_expression',
+
+    # graphs.py
+    'GRAPH_TYPES',
+    'FFLogsGraph',
+    'build_graph',
+
+    # index.py
+    'INDEXED_FIELDS',
+    'FFLogsEventIndex',
+
+    # tables.py
+    'DATA_TYPES',
+    'SUPPORTED_FILTERS',
+    'FFLogsTableEngine',
+]
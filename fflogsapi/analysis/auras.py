@@ -0,0 +1,411 @@
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from ..constants import EventType
+
+AURA_KINDS = {
+    # aura kind: (apply event type, refresh event type, remove event type)
+    'Buffs': (EventType.APPLY_BUFF, EventType.REFRESH_BUFF, EventType.REMOVE_BUFF),
+    'Debuffs': (EventType.APPLY_DEBUFF, EventType.REFRESH_DEBUFF, EventType.REMOVE_DEBUFF),
+}
+''' The kinds of auras, with the event types that apply, refresh and remove them '''
+
+_KIND_CODES = {kind: code for code, kind in enumerate(AURA_KINDS)}
+_APPLY_TYPES = {apply.value: code for code, (apply, _, _) in enumerate(AURA_KINDS.values())}
+_REFRESH_TYPES = {refresh.value: code for code, (_, refresh, _) in enumerate(AURA_KINDS.values())}
+_REMOVE_TYPES = {remove.value: code for code, (_, _, remove) in enumerate(AURA_KINDS.values())}
+
+
+class FFLogsAuraBands:
+    '''
+    Disjoint time intervals during which an aura is active, sorted by time.
+
+    Each band includes its start time but not its end time. Since the bands are sorted and do not
+    overlap, both their start and end times are sorted arrays, so all queries are binary searches.
+    '''
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        self.starts = starts
+        ''' The start time of each band '''
+        self.ends = ends
+        ''' The end time of each band '''
+        self._uptimes = np.concatenate(([0], np.cumsum(ends - starts)))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(self.starts.tolist(), self.ends.tolist())
+
+    def active_at(self, timestamp: float) -> bool:
+        '''
+        Check whether the aura is active at a given time.
+
+        Args:
+            timestamp: The time to check.
+        Returns:
+            True if the aura is active at the given time.
+        '''
+        band = np.searchsorted(self.ends, timestamp, side='right')
+        return bool(band < len(self.starts) and self.starts[band] <= timestamp)
+
+    def active_mask(self, timestamps: np.ndarray) -> np.ndarray:
+        '''
+        Check whether the aura is active at each of the given times, e.g. to find the damage
+        events that happened while a buff was active.
+
+        Args:
+            timestamps: The times to check, e.g. ``columns['timestamp']`` of columnar events.
+        Returns:
+            A boolean array that is True where the aura is active.
+        '''
+        bands = np.searchsorted(self.ends, timestamps, side='right')
+        inside = bands < len(self.starts)
+        inside[inside] = self.starts[bands[inside]] <= np.asarray(timestamps)[inside]
+        return inside
+
+    def overlap(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> 'FFLogsAuraBands':
+        '''
+        Get the bands that overlap a time window, clipped to the window.
+
+        Args:
+            start_time: The start of the window. Unbounded by default.
+            end_time: The end of the window. Unbounded by default.
+        Returns:
+            The clipped bands.
+        '''
+        first, last = self._window(start_time, end_time)
+        starts = self.starts[first:last]
+        ends = self.ends[first:last]
+        if start_time is not None:
+            starts = np.maximum(starts, start_time)
+        if end_time is not None:
+            ends = np.minimum(ends, end_time)
+        nonempty = ends > starts
+        return FFLogsAuraBands(starts[nonempty], ends[nonempty])
+
+    def uptime(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> float:
+        '''
+        Get the total time the aura is active within a time window.
+
+        Args:
+            start_time: The start of the window. Unbounded by default.
+            end_time: The end of the window. Unbounded by default.
+        Returns:
+            The uptime in milliseconds.
+        '''
+        first, last = self._window(start_time, end_time)
+        if last <= first:
+            return 0
+        uptime = self._uptimes[last] - self._uptimes[first]
+        # the bands at the edges may only partially be inside the window
+        if start_time is not None:
+            uptime -= max(0, start_time - self.starts[first])
+        if end_time is not None:
+            uptime -= max(0, self.ends[last - 1] - end_time)
+        return max(0, uptime.item())
+
+    def _window(self, start_time: Optional[float], end_time: Optional[float]) -> tuple[int, int]:
+        '''
+        INTERNAL
+        The range of bands that overlap a time window.
+        '''
+        first = 0 if start_time is None else \
+            int(np.searchsorted(self.ends, start_time, side='right'))
+        last = len(self.starts) if end_time is None else \
+            int(np.searchsorted(self.starts, end_time, side='left'))
+        return first, last
+
+    @classmethod
+    def merge(cls, starts: np.ndarray, ends: np.ndarray) -> 'FFLogsAuraBands':
+        '''
+        Merge possibly overlapping intervals into disjoint bands.
+
+        Args:
+            starts: The start time of each interval.
+            ends: The end time of each interval.
+        Returns:
+            The bands covered by the intervals.
+        '''
+        if not len(starts):
+            return cls(starts, ends)
+
+        order = np.argsort(starts, kind='stable')
+        starts, ends = starts[order], ends[order]
+        # latest end of all intervals so far. an interval that starts after it starts a new band
+        reach = np.maximum.accumulate(ends)
+        breaks = starts[1:] > reach[:-1]
+        return cls(
+            starts[np.concatenate(([True], breaks))],
+            reach[np.concatenate((breaks, [True]))],
+        )
+
+
+class FFLogsAuraIntervals:
+    '''
+    The intervals during which buffs and debuffs are active, for each application of an aura.
+
+    Use :func:`bands` to get the merged bands of an aura on an actor (or on all actors), which
+    support fast "active at", overlap and uptime queries.
+
+    Use :func:`fflogsapi.reports.FFLogsFight.aura_intervals` to get the aura intervals of a fight.
+    '''
+
+    def __init__(
+        self,
+        source_ids: np.ndarray,
+        target_ids: np.ndarray,
+        ability_ids: np.ndarray,
+        kinds: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        applied: np.ndarray,
+    ) -> None:
+        self.source_ids = source_ids
+        ''' The ID of the actor that applied each aura '''
+        self.target_ids = target_ids
+        ''' The ID of the actor each aura was applied to '''
+        self.ability_ids = ability_ids
+        ''' The game ID of each aura '''
+        self.kinds = kinds
+        ''' The kind of each aura, as an index into :data:`AURA_KINDS` '''
+        self.starts = starts
+        ''' The start time of each interval '''
+        self.ends = ends
+        ''' The end time of each interval '''
+        self.applied = applied
+        ''' Whether each interval starts with an application, i.e. not before logging started '''
+
+        self._rows_by_key = {}
+        for row, key in enumerate(zip(target_ids.tolist(), ability_ids.tolist())):
+            self._rows_by_key.setdefault(key, []).append(row)
+        self._bands = {}
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[dict[str, Any]],
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> 'FFLogsAuraIntervals':
+        '''
+        Pair the apply and remove events of auras into intervals, in a single pass over the events.
+
+        Auras that are removed or refreshed without having been applied are assumed to have been
+        applied before logging started, and auras that are never removed last until the end.
+
+        Args:
+            events: The events of a fight, in timestamp order. Events that are not aura events
+                    are ignored.
+            start_time: The start of the fight. Defaults to the time of the first event.
+            end_time: The end of the fight. Defaults to the time of the last event.
+        Returns:
+            The aura intervals.
+        '''
+        intervals = []
+        # rows of the intervals that are still open, by (source, target, aura, kind)
+        open_rows = {}
+        timestamp = None
+
+        for event in events:
+            timestamp = event['timestamp']
+            if start_time is None:
+                start_time = timestamp
+
+            event_type = event['type']
+            if event_type in _APPLY_TYPES:
+                key = (
+                    event.get('sourceID', -1),
+                    event.get('targetID', -1),
+                    event.get('abilityGameID', -1),
+                    _APPLY_TYPES[event_type],
+                )
+                open_rows.setdefault(key, []).append(len(intervals))
+                intervals.append([*key, timestamp, None, True])
+            elif event_type in _REMOVE_TYPES or event_type in _REFRESH_TYPES:
+                removed = event_type in _REMOVE_TYPES
+                key = (
+                    event.get('sourceID', -1),
+                    event.get('targetID', -1),
+                    event.get('abilityGameID', -1),
+                    _REMOVE_TYPES[event_type] if removed else _REFRESH_TYPES[event_type],
+                )
+                rows = open_rows.get(key)
+                if not rows:
+                    # the aura was applied before logging started
+                    rows = open_rows.setdefault(key, [])
+                    rows.append(len(intervals))
+                    intervals.append([*key, start_time, None, False])
+                if removed:
+                    intervals[rows.pop()][5] = timestamp
+
+        if end_time is None:
+            end_time = timestamp if timestamp is not None else 0
+        for rows in open_rows.values():
+            for row in rows:
+                intervals[row][5] = end_time
+
+        columns = list(zip(*intervals)) or [()] * 7
+        return cls(
+            source_ids=np.array(columns[0], dtype=np.int32),
+            target_ids=np.array(columns[1], dtype=np.int32),
+            ability_ids=np.array(columns[2], dtype=np.int64),
+            kinds=np.array(columns[3], dtype=np.int8),
+            starts=np.array(columns[4]),
+            ends=np.array(columns[5]),
+            applied=np.array(columns[6], dtype=np.bool_),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def keys(self) -> list[tuple[int, int]]:
+        '''
+        Returns:
+            The (target ID, aura ID) pairs of all auras that were active at some point.
+        '''
+        return list(self._rows_by_key)
+
+    def select(
+        self,
+        source_id: Optional[int] = None,
+        target_id: Optional[int] = None,
+        ability_id: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> 'FFLogsAuraIntervals':
+        '''
+        Select the intervals of some of the auras.
+
+        Args:
+            source_id: Only select auras applied by this actor.
+            target_id: Only select auras applied to this actor.
+            ability_id: Only select auras with this game ID.
+            kind: Only select auras of this kind, one of ``Buffs`` and ``Debuffs``.
+        Returns:
+            The selected intervals.
+        '''
+        rows = self._rows(source_id, target_id, ability_id, kind)
+        return FFLogsAuraIntervals(
+            source_ids=self.source_ids[rows],
+            target_ids=self.target_ids[rows],
+            ability_ids=self.ability_ids[rows],
+            kinds=self.kinds[rows],
+            starts=self.starts[rows],
+            ends=self.ends[rows],
+            applied=self.applied[rows],
+        )
+
+    def bands(
+        self,
+        target_id: Optional[int] = None,
+        ability_id: Optional[int] = None,
+        source_id: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> FFLogsAuraBands:
+        '''
+        Get the bands during which at least one of the matching auras is active.
+
+        The bands are cached, so repeated queries for the same aura are cheap.
+
+        Args:
+            target_id: Only include auras applied to this actor.
+            ability_id: Only include auras with this game ID.
+            source_id: Only include auras applied by this actor.
+            kind: Only include auras of this kind, one of ``Buffs`` and ``Debuffs``.
+        Returns:
+            The merged bands of the matching auras.
+        '''
+        cache_key = (target_id, ability_id, source_id, kind)
+        bands = self._bands.get(cache_key)
+        if bands is None:
+            rows = self._rows(source_id, target_id, ability_id, kind)
+            bands = self._bands[cache_key] = FFLogsAuraBands.merge(
+                self.starts[rows], self.ends[rows],
+            )
+        return bands
+
+    def active_at(self, timestamp: float, target_id: int, ability_id: int) -> bool:
+        '''
+        Check whether an aura is active on an actor at a given time.
+
+        Args:
+            timestamp: The time to check.
+            target_id: The ID of the actor.
+            ability_id: The game ID of the aura.
+        Returns:
+            True if the aura is active on the actor at the given time.
+        '''
+        return self.bands(target_id, ability_id).active_at(timestamp)
+
+    def uptime(
+        self,
+        target_id: Optional[int] = None,
+        ability_id: Optional[int] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> float:
+        '''
+        Get the total time an aura is active on an actor within a time window.
+
+        Args:
+            target_id: The ID of the actor. Auras on any actor count by default.
+            ability_id: The game ID of the aura. Any aura counts by default.
+            start_time: The start of the window. Unbounded by default.
+            end_time: The end of the window. Unbounded by default.
+        Returns:
+            The uptime in milliseconds.
+        '''
+        return self.bands(target_id, ability_id).uptime(start_time, end_time)
+
+    def applications(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> int:
+        '''
+        Count the applications of auras within a time window (bounds included).
+
+        Args:
+            start_time: The start of the window. Unbounded by default.
+            end_time: The end of the window. Unbounded by default.
+        Returns:
+            The amount of applications.
+        '''
+        applied = self.applied.copy()
+        if start_time is not None:
+            applied &= self.starts >= start_time
+        if end_time is not None:
+            applied &= self.starts <= end_time
+        return int(applied.sum())
+
+    def _rows(
+        self,
+        source_id: Optional[int],
+        target_id: Optional[int],
+        ability_id: Optional[int],
+        kind: Optional[str],
+    ) -> np.ndarray:
+        '''
+        INTERNAL
+        The rows of the intervals matching the given criteria.
+        '''
+        if target_id is not None and ability_id is not None:
+            rows = np.array(self._rows_by_key.get((target_id, ability_id), ()), dtype=np.int64)
+        else:
+            mask = np.ones(len(self), dtype=np.bool_)
+            if target_id is not None:
+                mask &= self.target_ids == target_id
+            if ability_id is not None:
+                mask &= self.ability_ids == ability_id
+            rows = np.flatnonzero(mask)
+
+        if source_id is not None:
+            rows = rows[self.source_ids[rows] == source_id]
+        if kind is not None:
+            rows = rows[self.kinds[rows] == _KIND_CODES[kind]]
+        return rows
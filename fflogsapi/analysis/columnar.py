@@ -0,0 +1,277 @@
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+from ..constants import EventType
+
+COLUMNS = (
+    # (event key, column name, dtype, value used when the event does not have the field)
+    ('timestamp', 'timestamp', np.int64, 0),
+    ('fight', 'fight', np.int32, -1),
+    ('sourceID', 'source_id', np.int32, -1),
+    ('targetID', 'target_id', np.int32, -1),
+    ('abilityGameID', 'ability_id', np.int64, -1),
+    ('amount', 'amount', np.int64, 0),
+    ('overheal', 'overheal', np.int64, 0),
+    ('absorbed', 'absorbed', np.int64, 0),
+    ('unmitigatedAmount', 'unmitigated_amount', np.int64, 0),
+    ('hitType', 'hit_type', np.int8, -1),
+    ('directHit', 'direct_hit', np.bool_, False),
+    ('tick', 'tick', np.bool_, False),
+    ('multiplier', 'multiplier', np.float64, np.nan),
+    ('packetID', 'packet_id', np.int64, -1),
+)
+''' The fields that are stored as dense columns '''
+
+EVENT_TYPE_CODES = {event_type.value: code for code, event_type in enumerate(EventType)}
+''' The type codes of the known event types. Unknown event types get the codes after these. '''
+
+
+class FFLogsEventColumns:
+    '''
+    Fight events stored as NumPy columns, for vectorized analysis.
+
+    Common fields (see :data:`COLUMNS`) are stored as dense columns with one value per event.
+    Events that lack a field, or have None for it, get a placeholder value instead: -1 for IDs and
+    codes, 0 for amounts, False for flags and NaN for the multiplier. Use :func:`has` to tell
+    placeholders apart from real values, e.g. an amount of 0. Event types are stored as integer
+    codes in the ``type`` column, see :func:`type_code`.
+
+    All other fields are rare, so they are stored in sparse side tables which only contain the
+    events that have the field. See :func:`sparse`.
+
+    Use :func:`fflogsapi.reports.FFLogsFight.events_columnar` to get the columns of a fight.
+    '''
+
+    def __init__(
+        self,
+        columns: dict[str, np.ndarray],
+        type_names: list[str],
+        sparse: dict[str, tuple[np.ndarray, list[Any]]],
+        present: Optional[dict[str, np.ndarray]] = None,
+    ) -> None:
+        self.columns = columns
+        ''' The dense columns, by column name '''
+        self.type_names = type_names
+        ''' The event type of each type code '''
+        self.sparse_fields = sparse
+        ''' The side tables of sparse fields, as (row indices, values) tuples by event key '''
+        self.present = present if present is not None else {}
+        '''
+        Masks of the events that have a value in a dense column, by column name. Columns without
+        a mask have a value for every event.
+        '''
+
+    @classmethod
+    def from_events(cls, events: Iterable[dict[str, Any]]) -> 'FFLogsEventColumns':
+        '''
+        Build columns from event dictionaries.
+
+        The events are consumed one by one, so they can be streamed from e.g.
+        :func:`fflogsapi.reports.FFLogsFight.iter_events` without keeping them all in memory.
+
+        Args:
+            events: The event dictionaries.
+        Returns:
+            The events in columnar form.
+        '''
+        keys = tuple(key for key, _, _, _ in COLUMNS)
+        defaults = tuple(default for _, _, _, default in COLUMNS)
+        known_keys = frozenset(keys + ('type',))
+
+        values = tuple([] for _ in COLUMNS)
+        missing = tuple([] for _ in COLUMNS)
+        types = []
+        type_codes = dict(EVENT_TYPE_CODES)
+        sparse = {}
+
+        for row, event in enumerate(events):
+            get = event.get
+            for column, missing_rows, key, default in zip(values, missing, keys, defaults):
+                value = get(key)
+                if value is None:
+                    column.append(default)
+                    missing_rows.append(row)
+                    if key in event:
+                        # keep explicit None values, so that they survive a round trip
+                        if key not in sparse:
+                            sparse[key] = ([], [])
+                        sparse[key][0].append(row)
+                        sparse[key][1].append(None)
+                else:
+                    column.append(value)
+
+            event_type = event['type']
+            code = type_codes.get(event_type)
+            if code is None:
+                code = type_codes[event_type] = len(type_codes)
+            types.append(code)
+
+            if not known_keys.issuperset(event):
+                for key, value in event.items():
+                    if key in known_keys:
+                        continue
+                    if key not in sparse:
+                        sparse[key] = ([], [])
+                    sparse[key][0].append(row)
+                    sparse[key][1].append(value)
+
+        columns = {
+            name: np.array(column, dtype=dtype)
+            for (_, name, dtype, _), column in zip(COLUMNS, values)
+        }
+        columns['type'] = np.array(types, dtype=np.int16)
+
+        present = {}
+        for (_, name, _, _), missing_rows in zip(COLUMNS, missing):
+            if missing_rows:
+                mask = np.ones(len(columns['type']), dtype=bool)
+                mask[missing_rows] = False
+                present[name] = mask
+
+        return cls(
+            columns=columns,
+            type_names=list(type_codes),
+            sparse={
+                key: (np.array(rows, dtype=np.int64), field_values)
+                for key, (rows, field_values) in sparse.items()
+            },
+            present=present,
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns['timestamp'])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        '''
+        Get a dense column by name, e.g. ``columns['amount']``.
+        '''
+        return self.columns[name]
+
+    def has(self, name: str) -> np.ndarray:
+        '''
+        Get a mask of the events that have a value in a dense column.
+
+        Args:
+            name: The name of the column, e.g. ``'amount'``.
+        Returns:
+            A boolean array that is False for events whose value in the column is a placeholder.
+        '''
+        mask = self.present.get(name)
+        if mask is None:
+            return np.ones(len(self), dtype=bool)
+        return mask
+
+    def type_code(self, event_type: Union[str, EventType]) -> int:
+        '''
+        Get the code used for an event type in the ``type`` column.
+
+        Args:
+            event_type: The event type, e.g. ``EventType.DAMAGE`` or ``'damage'``.
+        Returns:
+            The type code, or -1 if the type is neither a known event type nor the type of any
+            of the events.
+        '''
+        if isinstance(event_type, EventType):
+            event_type = event_type.value
+        try:
+            return self.type_names.index(event_type)
+        except ValueError:
+            return -1
+
+    def of_type(self, *event_types: Union[str, EventType]) -> np.ndarray:
+        '''
+        Get a mask of the events that have one of the given types.
+
+        Args:
+            event_types: The event types to find.
+        Returns:
+            A boolean array that is True for events of the given types.
+        '''
+        codes = [self.type_code(event_type) for event_type in event_types]
+        return np.isin(self.columns['type'], codes)
+
+    def sparse(self, key: str, fill: Any = None) -> np.ndarray:
+        '''
+        Get a sparse field as a dense column.
+
+        Args:
+            key: The key of the field in the event dictionaries, e.g. ``'stack'``.
+            fill: The value used for events that do not have the field. If not set, the column
+                  is an object array with None for events that do not have the field.
+        Returns:
+            An array with the value of the field for each event.
+        '''
+        rows, values = self.sparse_fields.get(key, (np.empty(0, dtype=np.int64), []))
+        if fill is None:
+            column = np.full(len(self), None, dtype=object)
+            # values may be lists or dicts, which numpy would try to broadcast
+            for row, value in zip(rows.tolist(), values):
+                column[row] = value
+            return column
+
+        column = np.full(len(self), fill)
+        column[rows] = values
+        return column
+
+    def select(self, mask: np.ndarray) -> 'FFLogsEventColumns':
+        '''
+        Select a subset of the events.
+
+        Args:
+            mask: A boolean mask or an array of row indices of the events to select.
+        Returns:
+            The selected events in columnar form.
+        '''
+        mask = np.asarray(mask)
+        rows = np.flatnonzero(mask) if mask.dtype == np.bool_ else np.sort(mask)
+
+        sparse = {}
+        for key, (field_rows, values) in self.sparse_fields.items():
+            found = np.isin(field_rows, rows)
+            if not found.any():
+                continue
+            # rows of the field in the selection
+            new_rows = np.searchsorted(rows, field_rows[found])
+            sparse[key] = (new_rows, [value for value, f in zip(values, found) if f])
+
+        return FFLogsEventColumns(
+            columns={name: column[rows] for name, column in self.columns.items()},
+            type_names=self.type_names,
+            sparse=sparse,
+            present={name: mask[rows] for name, mask in self.present.items()},
+        )
+
+    def to_events(self, rows: Optional[Iterable[int]] = None) -> list[dict[str, Any]]:
+        '''
+        Convert (some of) the events back into event dictionaries.
+
+        Fields that the events did not have are left out.
+
+        Args:
+            rows: The rows of the events to convert. All events are converted by default.
+        Returns:
+            The events as dictionaries.
+        '''
+        rows = range(len(self)) if rows is None else rows
+        dense = [
+            (key, self.columns[name].tolist(), self.present[name].tolist())
+            if name in self.present else (key, self.columns[name].tolist(), None)
+            for key, name, _, _ in COLUMNS
+        ]
+        types = self.columns['type'].tolist()
+
+        sparse = {}
+        for key, (field_rows, values) in self.sparse_fields.items():
+            for row, value in zip(field_rows.tolist(), values):
+                sparse.setdefault(row, []).append((key, value))
+
+        events = []
+        for row in rows:
+            event = {'timestamp': dense[0][1][row], 'type': self.type_names[types[row]]}
+            for key, column, present in dense[1:]:
+                if present is None or present[row]:
+                    event[key] = column[row]
+            event.update(sparse.get(row, ()))
+            events.append(event)
+        return events
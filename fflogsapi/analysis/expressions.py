@@ -0,0 +1,412 @@
+import operator
+import re
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from ..data import FFLogsActor, FFLogsReportAbility
+from .columnar import COLUMNS, FFLogsEventColumns
+
+TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)
+        |(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<operator>==|!=|<>|<=|>=|&&|\|\||[=<>!(),])
+        |(?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+    )
+''', re.VERBOSE)
+
+OPERATORS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<>': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+FIELDS = {
+    'type': 'type',
+    'timestamp': 'timestamp',
+    'fight': 'fight',
+    'source.id': 'sourceID',
+    'target.id': 'targetID',
+    'ability.id': 'abilityGameID',
+    'amount': 'amount',
+    'overheal': 'overheal',
+    'absorbed': 'absorbed',
+    'hittype': 'hitType',
+}
+''' Fields of the expression language and the event keys they refer to '''
+
+ACTOR_FIELDS = {
+    'source.name': ('sourceID', 'name'),
+    'source.type': ('sourceID', 'type'),
+    'source.subtype': ('sourceID', 'sub_type'),
+    'target.name': ('targetID', 'name'),
+    'target.type': ('targetID', 'type'),
+    'target.subtype': ('targetID', 'sub_type'),
+}
+''' Actor fields of the expression language, as (event key, actor attribute) '''
+
+ABILITY_FIELDS = {
+    'ability.name': ('abilityGameID', 'name'),
+    'ability.type': ('abilityGameID', 'type'),
+}
+''' Ability fields of the expression language, as (event key, ability attribute) '''
+
+_COLUMN_NAMES = {key: name for key, name, _, _ in COLUMNS}
+
+
+class FFLogsFilterExpression:
+    '''
+    A compiled filter expression, which can be applied to events locally.
+
+    Use :func:`compile_expression` to compile filter expressions.
+    '''
+
+    def __init__(self, expression: str, tree: tuple) -> None:
+        self.expression = expression
+        ''' The source of the expression '''
+        self._tree = tree
+        self._predicate = _build_predicate(tree)
+
+    def __call__(self, event: dict[str, Any]) -> bool:
+        '''
+        Check if an event matches the expression.
+
+        Args:
+            event: The event dictionary.
+        Returns:
+            True if the event matches the expression.
+        '''
+        return self._predicate(event)
+
+    def filter(self, events: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        '''
+        Filter events by the expression.
+
+        Args:
+            events: The events to filter, e.g. from :func:`fflogsapi.reports.FFLogsFight.events`
+                    or :func:`fflogsapi.reports.FFLogsFight.iter_events`.
+        Returns:
+            An iterator over the events that match the expression.
+        '''
+        return filter(self._predicate, events)
+
+    def mask(self, columns: FFLogsEventColumns) -> np.ndarray:
+        '''
+        Evaluate the expression for columnar events.
+
+        Events that do not have a field are treated like in the event predicates: they only
+        match inequality comparisons.
+
+        Args:
+            columns: The events, e.g. from :func:`fflogsapi.reports.FFLogsFight.events_columnar`.
+        Returns:
+            A boolean mask that is True for the events that match the expression.
+        '''
+        return _evaluate_mask(self._tree, columns)
+
+    def __repr__(self) -> str:
+        return f'FFLogsFilterExpression({self.expression!r})'
+
+
+def compile_expression(
+    expression: str,
+    actors: Iterable[FFLogsActor] = (),
+    abilities: Iterable[FFLogsReportAbility] = (),
+) -> FFLogsFilterExpression:
+    '''
+    Compile a filter expression so that it can be applied to events locally, instead of querying
+    the API with a ``filterExpression`` filter for every variation.
+
+    A practical subset of the FF Logs expression language is supported:
+
+    * Comparisons with ``=``, ``!=``, ``<``, ``<=``, ``>`` and ``>=``,
+      e.g. ``type = "damage"`` or ``amount > 10000``
+    * Lists with ``IN (...)`` and ``NOT IN (...)``, e.g. ``ability.id in (7535, 7548)``
+    * Time windows with ``BETWEEN``, e.g. ``timestamp between 10000 and 20000``
+    * Boolean operators ``AND``, ``OR`` and ``NOT`` (or ``&&``, ``||`` and ``!``) and parentheses
+    * The fields ``type``, ``timestamp``, ``fight``, ``source.id``, ``target.id``, ``ability.id``,
+      ``amount``, ``overheal``, ``absorbed`` and ``hitType``, as well as any event key
+    * The actor fields ``source.name``, ``source.type``, ``source.subType``, ``target.name``,
+      ``target.type`` and ``target.subType``, and the ability fields ``ability.name`` and
+      ``ability.type``. These are looked up in the given actors and abilities
+
+    Keywords, field names and actor/ability names are case insensitive.
+
+    Args:
+        expression: The filter expression.
+        actors: The actors of the report, e.g. from :func:`fflogsapi.reports.FFLogsReport.actors`.
+        abilities: The abilities of the report, e.g. from
+                   :func:`fflogsapi.reports.FFLogsReport.abilities`.
+    Returns:
+        The compiled expression.
+    Raises:
+        ValueError if the expression is invalid or uses unsupported features.
+    '''
+    tree = _Parser(expression).parse()
+    return FFLogsFilterExpression(expression, _resolve(tree, list(actors), list(abilities)))
+
+
+class _Parser:
+    '''
+    Recursive descent parser turning expressions into trees of tuples:
+    ``('and', [...])``, ``('or', [...])``, ``('not', node)``, ``('cmp', field, op, value)`` and
+    ``('in', field, values)``.
+    '''
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = TOKEN_PATTERN.match(expression, position)
+            if match is None or match.end() == position:
+                raise ValueError(f'Invalid filter expression at position {position}: '
+                                 f'{expression[position:]!r}')
+            kind = match.lastgroup
+            text = match.group(kind)
+            if kind == 'number':
+                value = float(text) if '.' in text else int(text)
+            elif kind == 'string':
+                value = re.sub(r'\\(.)', r'\1', text[1:-1])
+            elif kind == 'name' and text.lower() in ('true', 'false'):
+                kind, value = 'bool', text.lower() == 'true'
+            else:
+                value = text
+            self.tokens.append((kind, value))
+            position = match.end()
+        self.position = 0
+
+    def _peek(self) -> tuple[str, Any]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return ('end', None)
+
+    def _next(self) -> tuple[str, Any]:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _accept(self, *words: str) -> bool:
+        kind, value = self._peek()
+        if kind in ('name', 'operator') and value.lower() in words:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, *words: str) -> None:
+        if not self._accept(*words):
+            raise ValueError(f'Expected {words[0]!r} in filter expression {self.expression!r}')
+
+    def parse(self) -> tuple:
+        tree = self._or()
+        if self._peek()[0] != 'end':
+            raise ValueError(
+                f'Unexpected {self._peek()[1]!r} in filter expression {self.expression!r}'
+            )
+        return tree
+
+    def _or(self) -> tuple:
+        nodes = [self._and()]
+        while self._accept('or', '||'):
+            nodes.append(self._and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def _and(self) -> tuple:
+        nodes = [self._not()]
+        while self._accept('and', '&&'):
+            nodes.append(self._not())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def _not(self) -> tuple:
+        if self._accept('not', '!'):
+            return ('not', self._not())
+        if self._accept('('):
+            node = self._or()
+            self._expect(')')
+            return node
+        return self._comparison()
+
+    def _value(self) -> Any:
+        kind, value = self._next()
+        if kind not in ('number', 'string', 'bool'):
+            raise ValueError(f'Expected a value in filter expression {self.expression!r}, '
+                             f'got {value!r}')
+        return value
+
+    def _comparison(self) -> tuple:
+        kind, field = self._next()
+        if kind != 'name':
+            raise ValueError(f'Expected a field in filter expression {self.expression!r}, '
+                             f'got {field!r}')
+
+        if self._accept('between'):
+            low = self._value()
+            self._expect('and')
+            high = self._value()
+            return ('and', [('cmp', field, '>=', low), ('cmp', field, '<=', high)])
+
+        negated = self._accept('not')
+        if self._accept('in'):
+            self._expect('(')
+            values = [self._value()]
+            while self._accept(','):
+                values.append(self._value())
+            self._expect(')')
+            node = ('in', field, values)
+            return ('not', node) if negated else node
+        if negated:
+            raise ValueError(f'Expected \'in\' after \'not\' in filter expression '
+                             f'{self.expression!r}')
+
+        kind, op = self._next()
+        if kind != 'operator' or op not in OPERATORS:
+            raise ValueError(f'Expected a comparison in filter expression {self.expression!r}, '
+                             f'got {op!r}')
+        return ('cmp', field, op, self._value())
+
+
+def _lookup_ids(objects: list, id_attr: str, attr: str, values: list) -> frozenset:
+    '''
+    Find the IDs of the actors or abilities that have one of the given attribute values.
+    '''
+    wanted = {value.lower() if isinstance(value, str) else value for value in values}
+    ids = set()
+    for obj in objects:
+        value = getattr(obj, attr)
+        if (value.lower() if isinstance(value, str) else value) in wanted:
+            ids.add(getattr(obj, id_attr))
+    return frozenset(ids)
+
+
+def _resolve(node: tuple, actors: list, abilities: list) -> tuple:
+    '''
+    Map the fields of an expression tree to event keys, turning actor and ability fields into
+    lists of IDs.
+    '''
+    kind = node[0]
+    if kind in ('and', 'or'):
+        return (kind, [_resolve(child, actors, abilities) for child in node[1]])
+    if kind == 'not':
+        return ('not', _resolve(node[1], actors, abilities))
+
+    field = node[1].lower()
+    if kind == 'cmp':
+        op, values = node[2], [node[3]]
+    else:
+        op, values = 'in', node[2]
+
+    lookup = None
+    if field in ACTOR_FIELDS:
+        key, attr = ACTOR_FIELDS[field]
+        lookup = (actors, 'id', attr)
+    elif field in ABILITY_FIELDS:
+        key, attr = ABILITY_FIELDS[field]
+        lookup = (abilities, 'game_id', attr)
+    else:
+        key = FIELDS.get(field, node[1])
+
+    if field == 'type':
+        values = [value.lower() if isinstance(value, str) else value for value in values]
+
+    if lookup is not None:
+        if op not in ('in', '=', '==', '!=', '<>'):
+            raise ValueError(f'Only equality comparisons are supported for {node[1]}')
+        ids = _lookup_ids(*lookup, values)
+        node = ('in', key, ids)
+        return ('not', node) if OPERATORS.get(op) is operator.ne else node
+
+    if kind == 'in':
+        return ('in', key, frozenset(values))
+    return ('cmp', key, op, values[0])
+
+
+def _build_predicate(node: tuple) -> Callable[[dict[str, Any]], bool]:
+    '''
+    Build a function that checks if an event matches an expression tree.
+    '''
+    kind = node[0]
+    if kind == 'and':
+        children = [_build_predicate(child) for child in node[1]]
+        return lambda event: all(child(event) for child in children)
+    if kind == 'or':
+        children = [_build_predicate(child) for child in node[1]]
+        return lambda event: any(child(event) for child in children)
+    if kind == 'not':
+        child = _build_predicate(node[1])
+        return lambda event: not child(event)
+    if kind == 'in':
+        _, key, values = node
+        return lambda event: event.get(key) in values
+
+    _, key, op, value = node
+    compare = OPERATORS[op]
+    # events without the field only match inequality comparisons
+    missing = compare is operator.ne
+
+    def predicate(event: dict[str, Any]) -> bool:
+        event_value = event.get(key)
+        if event_value is None:
+            return missing
+        try:
+            return compare(event_value, value)
+        except TypeError:
+            return False
+    return predicate
+
+
+def _evaluate_mask(node: tuple, columns: FFLogsEventColumns) -> np.ndarray:
+    '''
+    Evaluate an expression tree for columnar events.
+    '''
+    kind = node[0]
+    if kind == 'and':
+        return np.logical_and.reduce([_evaluate_mask(child, columns) for child in node[1]])
+    if kind == 'or':
+        return np.logical_or.reduce([_evaluate_mask(child, columns) for child in node[1]])
+    if kind == 'not':
+        return ~_evaluate_mask(node[1], columns)
+
+    key = node[1]
+    if kind == 'in':
+        values = node[2]
+    else:
+        op, values = node[2], [node[3]]
+
+    present = None
+    if key == 'type':
+        column = columns['type']
+        values = [columns.type_code(value) for value in values]
+    elif key in _COLUMN_NAMES:
+        column = columns[_COLUMN_NAMES[key]]
+        present = columns.present.get(_COLUMN_NAMES[key])
+    else:
+        # sparse fields are compared value by value, like in the event predicates
+        predicate = _build_predicate(node)
+        mask = np.zeros(len(columns), dtype=bool)
+        rows, field_values = columns.sparse_fields.get(key, (np.empty(0, dtype=np.int64), []))
+        mask[rows] = [predicate({key: value}) for value in field_values]
+        if kind == 'cmp' and OPERATORS[op] is operator.ne:
+            # events without the field match inequality comparisons
+            present = np.zeros(len(columns), dtype=bool)
+            present[rows] = True
+            mask |= ~present
+        return mask
+
+    if kind == 'in':
+        mask = np.isin(column, list(values))
+    else:
+        mask = OPERATORS[op](column, values[0])
+
+    if present is None:
+        return mask
+    # placeholders of events without the field must not match, except for inequality
+    if kind == 'cmp' and OPERATORS[op] is operator.ne:
+        return mask | ~present
+    return mask & present
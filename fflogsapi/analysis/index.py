@@ -0,0 +1,161 @@
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+from ..constants import EventType
+
+INDEXED_FIELDS = {
+    # argument name: event key
+    'source_id': 'sourceID',
+    'target_id': 'targetID',
+    'ability_id': 'abilityGameID',
+    'type': 'type',
+}
+''' The event fields that are indexed, by the argument names used to look them up '''
+
+
+class FFLogsEventIndex:
+    '''
+    Fight events with indexes on their source, target, ability and type.
+
+    Each index maps the values of a field to the sorted offsets of the events with that value.
+    Looking up events, e.g. all casts by an actor within a time window, therefore only takes
+    time proportional to the amount of events found (plus a binary search for time windows)
+    instead of scanning every event of the fight.
+
+    Use :func:`fflogsapi.reports.FFLogsFight.events_indexed` to get the indexed events of a fight.
+
+    Args:
+        events: The events to index, in timestamp order.
+    '''
+
+    def __init__(self, events: Iterable[dict[str, Any]]) -> None:
+        self.events = list(events)
+        ''' All indexed events '''
+        self.timestamps = np.fromiter(
+            (event['timestamp'] for event in self.events), dtype=np.int64, count=len(self.events),
+        )
+        ''' The timestamp of each event '''
+
+        offsets = {field: {} for field in INDEXED_FIELDS}
+        keys = list(INDEXED_FIELDS.items())
+        for offset, event in enumerate(self.events):
+            for field, key in keys:
+                value = event.get(key)
+                if value is None:
+                    continue
+                field_offsets = offsets[field]
+                if value in field_offsets:
+                    field_offsets[value].append(offset)
+                else:
+                    field_offsets[value] = [offset]
+
+        self._indexes = {
+            field: {value: np.array(found, dtype=np.int64) for value, found in values.items()}
+            for field, values in offsets.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def values(self, field: str) -> list[Any]:
+        '''
+        Get the distinct values of an indexed field.
+
+        Args:
+            field: One of ``source_id``, ``target_id``, ``ability_id`` and ``type``.
+        Returns:
+            The values of the field that occur in the events.
+        '''
+        return list(self._indexes[field])
+
+    def offsets(
+        self,
+        source_id: Optional[int] = None,
+        target_id: Optional[int] = None,
+        ability_id: Optional[int] = None,
+        type: Optional[Union[str, EventType]] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> np.ndarray:
+        '''
+        Find the offsets of the events matching all of the given criteria.
+
+        Args:
+            source_id: The ID of the source actor.
+            target_id: The ID of the target actor.
+            ability_id: The game ID of the ability.
+            type: The event type.
+            start_time: Only find events at or after this time.
+            end_time: Only find events at or before this time.
+        Returns:
+            The sorted offsets of the matching events in :attr:`events`.
+        '''
+        if isinstance(type, EventType):
+            type = type.value
+        criteria = {
+            'source_id': source_id,
+            'target_id': target_id,
+            'ability_id': ability_id,
+            'type': type,
+        }
+
+        candidates = [
+            self._indexes[field].get(value, np.empty(0, dtype=np.int64))
+            for field, value in criteria.items() if value is not None
+        ]
+        if not candidates:
+            return self._time_slice(None, start_time, end_time)
+
+        # intersect starting from the smallest index to keep intermediate results small
+        candidates.sort(key=len)
+        found = candidates[0]
+        for other in candidates[1:]:
+            if not len(found):
+                break
+            found = np.intersect1d(found, other, assume_unique=True)
+        return self._time_slice(found, start_time, end_time)
+
+    def find(self, **criteria) -> list[dict[str, Any]]:
+        '''
+        Find the events matching all of the given criteria.
+
+        See :func:`offsets` for the criteria.
+
+        Returns:
+            The matching events, in timestamp order.
+        '''
+        return [self.events[offset] for offset in self.offsets(**criteria).tolist()]
+
+    def count(self, **criteria) -> int:
+        '''
+        Count the events matching all of the given criteria.
+
+        See :func:`offsets` for the criteria.
+
+        Returns:
+            The amount of matching events.
+        '''
+        return len(self.offsets(**criteria))
+
+    def _time_slice(
+        self,
+        offsets: Optional[np.ndarray],
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> np.ndarray:
+        '''
+        INTERNAL
+        Limit sorted event offsets to a time window with binary searches.
+        '''
+        # events are in timestamp order, so the time window is a range of offsets
+        first = 0 if start_time is None else \
+            np.searchsorted(self.timestamps, start_time, side='left')
+        last = len(self.events) if end_time is None else \
+            np.searchsorted(self.timestamps, end_time, side='right')
+
+        if offsets is None:
+            return np.arange(first, last, dtype=np.int64)
+        if start_time is None and end_time is None:
+            return offsets
+        return offsets[np.searchsorted(offsets, first):np.searchsorted(offsets, last)]
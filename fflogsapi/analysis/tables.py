@@ -0,0 +1,370 @@
+from collections import Counter, defaultdict
+from typing import Any, Iterable, Optional, Union
+
+from ..data import FFLogsActor, FFLogsReportAbility
+from ..util.gql_enums import GQLEnum
+from .auras import AURA_KINDS, FFLogsAuraIntervals
+
+DATA_TYPES = ('Summary', 'DamageDone', 'Healing', 'DamageTaken', 'Casts', 'Buffs', 'Debuffs')
+''' The table data types that can be computed locally '''
+
+SUPPORTED_FILTERS = frozenset({
+    'dataType',
+    'startTime',
+    'endTime',
+    'sourceID',
+    'targetID',
+    'abilityID',
+    'sourceAurasPresent',
+    'sourceAurasAbsent',
+    'targetAurasPresent',
+    'targetAurasAbsent',
+})
+''' The table filters that can be applied locally '''
+
+AURA_FILTERS = (
+    'sourceAurasPresent',
+    'sourceAurasAbsent',
+    'targetAurasPresent',
+    'targetAurasAbsent',
+)
+
+
+class FFLogsTableEngine:
+    '''
+    Computes fight tables locally from the events of a fight.
+
+    :func:`fflogsapi.reports.FFLogsFight.table` queries the API for every combination of filters.
+    The table engine instead computes tables from events that have already been retrieved, so any
+    amount of tables can be computed from a single download of the fight's events.
+
+    The tables are shaped like the table data returned by the API, but only contain the most
+    commonly used fields. Damage includes damage absorbed by shields, and healing includes
+    shield absorbs. The following filters are supported:
+
+    * ``dataType``: One of :data:`DATA_TYPES`, as a string or a :class:`fflogsapi.GQLEnum`.
+      Defaults to ``Summary``.
+    * ``startTime``, ``endTime``: The time window of the table.
+    * ``sourceID``, ``targetID``, ``abilityID``: Only count events with the given source, target
+      or ability.
+    * ``sourceAurasPresent``, ``sourceAurasAbsent``, ``targetAurasPresent``,
+      ``targetAurasAbsent``: Comma separated aura names or ability IDs that must all be present on
+      (or all be absent from) the source or target of an event for it to be counted.
+
+    Aura filters and the Buffs/Debuffs tables need the buff and debuff events of the fight,
+    so the events should not be filtered by data type.
+
+    Use :func:`fflogsapi.reports.FFLogsFight.table_engine` to get the table engine of a fight.
+
+    Args:
+        events: The events of the fight, in timestamp order.
+        actors: The actors of the report, used for actor names and types.
+        abilities: The abilities of the report, used for ability names and to find auras by name.
+        start_time: The start of the fight. Defaults to the time of the first event.
+        end_time: The end of the fight. Defaults to the time of the last event.
+    '''
+
+    def __init__(
+        self,
+        events: Iterable[dict[str, Any]],
+        actors: Iterable[FFLogsActor] = (),
+        abilities: Iterable[FFLogsReportAbility] = (),
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> None:
+        self.events = list(events)
+        self._actors = {actor.id: actor for actor in actors}
+        self._abilities = {ability.game_id: ability for ability in abilities}
+
+        self._ability_ids_by_name = defaultdict(set)
+        for ability in self._abilities.values():
+            self._ability_ids_by_name[ability.name.lower()].add(ability.game_id)
+
+        if start_time is None:
+            start_time = self.events[0]['timestamp'] if self.events else 0
+        if end_time is None:
+            end_time = self.events[-1]['timestamp'] if self.events else 0
+        self.start_time = start_time
+        self.end_time = end_time
+        self._auras = None
+
+    @property
+    def auras(self) -> FFLogsAuraIntervals:
+        '''
+        The aura intervals of the fight, which are used for aura filters and tables.
+        '''
+        if self._auras is None:
+            self._auras = FFLogsAuraIntervals.from_events(
+                self.events, self.start_time, self.end_time,
+            )
+        return self._auras
+
+    def table(self, filters: dict[str, Any] = {}) -> dict[str, Any]:
+        '''
+        Compute a table from the events of the fight.
+
+        Args:
+            filters: Filters to use when computing the table. See the class description for the
+                     supported filters.
+        Returns:
+            A dictionary of table information, shaped like the result of
+            :func:`fflogsapi.reports.FFLogsFight.table`.
+        Raises:
+            ValueError if a filter or data type is not supported.
+        '''
+        unsupported = set(filters) - SUPPORTED_FILTERS
+        if unsupported:
+            raise ValueError(
+                f'Filters not supported by local tables: {", ".join(sorted(unsupported))}'
+            )
+
+        data_type = filters.get('dataType', 'Summary')
+        if isinstance(data_type, GQLEnum):
+            data_type = data_type.enum_name
+        if data_type not in DATA_TYPES:
+            raise ValueError(f'Unsupported table data type: {data_type}')
+
+        start = filters.get('startTime', self.start_time)
+        end = filters.get('endTime', self.end_time)
+        if data_type in AURA_KINDS:
+            if any(key in filters for key in AURA_FILTERS):
+                raise ValueError('Aura filters can not be used for aura tables')
+            return self._aura_table(data_type, start, end, filters)
+
+        events = self._select(start, end, filters)
+        table = {'totalTime': end - start}
+        if data_type == 'Summary':
+            table['damageDone'] = self._summary(events, ('damage',), 'sourceID')
+            table['healingDone'] = self._summary(events, ('heal', 'absorbed'), 'sourceID')
+            table['damageTaken'] = self._summary(events, ('damage',), 'targetID')
+        elif data_type == 'DamageDone':
+            table['entries'] = self._entries(events, ('damage',), 'sourceID', 'targetID')
+        elif data_type == 'Healing':
+            table['entries'] = self._entries(events, ('heal', 'absorbed'), 'sourceID', 'targetID')
+        elif data_type == 'DamageTaken':
+            table['entries'] = self._entries(events, ('damage',), 'targetID', 'sourceID')
+        elif data_type == 'Casts':
+            table['entries'] = self._entries(events, ('cast',), 'sourceID', 'targetID', count=True)
+        return table
+
+    def _parse_auras(self, auras: Union[str, int, Iterable]) -> list[frozenset[int]]:
+        '''
+        INTERNAL
+        Turn an aura filter into the ability IDs each listed aura may have.
+        '''
+        if isinstance(auras, str):
+            auras = auras.split(',')
+        elif isinstance(auras, int):
+            auras = [auras]
+
+        parsed = []
+        for aura in auras:
+            if isinstance(aura, str):
+                aura = aura.strip()
+                if not aura.isdigit():
+                    parsed.append(frozenset(self._ability_ids_by_name.get(aura.lower(), ())))
+                    continue
+            parsed.append(frozenset((int(aura),)))
+        return parsed
+
+    def _select(self, start: float, end: float, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Find the events that pass the given filters.
+        '''
+        source_id = filters.get('sourceID')
+        target_id = filters.get('targetID')
+        ability_id = filters.get('abilityID')
+        aura_filters = [
+            (key.startswith('source'), key.endswith('Present'), self._parse_auras(filters[key]))
+            for key in AURA_FILTERS if key in filters
+        ]
+
+        selected = []
+        for event in self.events:
+            timestamp = event['timestamp']
+            if timestamp > end:
+                break
+
+            if timestamp < start:
+                continue
+            if source_id is not None and event.get('sourceID') != source_id:
+                continue
+            if target_id is not None and event.get('targetID') != target_id:
+                continue
+            if ability_id is not None and event.get('abilityGameID') != ability_id:
+                continue
+
+            if aura_filters and not all(
+                all(
+                    self._aura_active(
+                        event.get('sourceID' if on_source else 'targetID'), aura_ids, timestamp,
+                    ) == present
+                    for aura_ids in auras
+                )
+                for on_source, present, auras in aura_filters
+            ):
+                continue
+
+            selected.append(event)
+
+        return selected
+
+    def _aura_active(self, actor_id: int, aura_ids: frozenset[int], timestamp: float) -> bool:
+        '''
+        INTERNAL
+        Whether any of the given auras is active on an actor at a given time.
+        '''
+        return any(
+            self.auras.bands(actor_id, aura_id).active_at(timestamp) for aura_id in aura_ids
+        )
+
+    def _amount(self, event: dict[str, Any]) -> int:
+        '''
+        INTERNAL
+        The amount of damage or healing done by an event.
+        '''
+        if event['type'] == 'damage':
+            return event.get('amount', 0) + event.get('absorbed', 0)
+        return event.get('amount', 0)
+
+    def _actor_entry(self, actor_id: int) -> dict[str, Any]:
+        '''
+        INTERNAL
+        The fields describing an actor in a table entry.
+        '''
+        actor = self._actors.get(actor_id)
+        if actor is None:
+            return {'name': 'Unknown', 'id': actor_id, 'guid': None, 'type': 'Unknown'}
+        return {
+            'name': actor.name,
+            'id': actor.id,
+            'guid': actor.game_id,
+            'type': actor.sub_type,
+            'icon': actor.sub_type,
+        }
+
+    def _ability_entry(self, ability_id: int) -> dict[str, Any]:
+        '''
+        INTERNAL
+        The fields describing an ability in a table entry.
+        '''
+        ability = self._abilities.get(ability_id)
+        if ability is None:
+            return {'name': 'Unknown Ability', 'guid': ability_id, 'type': 0}
+        return {'name': ability.name, 'guid': ability_id, 'type': ability.type}
+
+    def _summary(
+        self,
+        events: list[dict[str, Any]],
+        event_types: tuple[str, ...],
+        group_key: str,
+    ) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Total amounts per actor, as in the summary table.
+        '''
+        totals = Counter()
+        for event in events:
+            if event['type'] in event_types:
+                totals[event.get(group_key)] += self._amount(event)
+
+        return [
+            {**self._actor_entry(actor_id), 'total': total}
+            for actor_id, total in totals.most_common()
+        ]
+
+    def _entries(
+        self,
+        events: list[dict[str, Any]],
+        event_types: tuple[str, ...],
+        group_key: str,
+        other_key: str,
+        count: bool = False,
+    ) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Table entries per actor, with the abilities and other actors involved.
+        '''
+        totals = Counter()
+        hits = Counter()
+        ability_totals = defaultdict(Counter)
+        ability_hits = defaultdict(Counter)
+        other_totals = defaultdict(Counter)
+
+        for event in events:
+            if event['type'] not in event_types:
+                continue
+            actor_id = event.get(group_key)
+            ability_id = event.get('abilityGameID')
+            amount = 1 if count else self._amount(event)
+
+            totals[actor_id] += amount
+            hits[actor_id] += 1
+            ability_totals[actor_id][ability_id] += amount
+            ability_hits[actor_id][ability_id] += 1
+            other_totals[actor_id][event.get(other_key)] += amount
+
+        others_field = 'targets' if other_key == 'targetID' else 'sources'
+        entries = []
+        for actor_id, total in totals.most_common():
+            entries.append({
+                **self._actor_entry(actor_id),
+                'total': total,
+                'hitCount': hits[actor_id],
+                'abilities': [
+                    {
+                        **self._ability_entry(ability_id),
+                        'total': ability_total,
+                        'hitCount': ability_hits[actor_id][ability_id],
+                    }
+                    for ability_id, ability_total in ability_totals[actor_id].most_common()
+                ],
+                others_field: [
+                    {**self._actor_entry(other_id), 'total': other_total}
+                    for other_id, other_total in other_totals[actor_id].most_common()
+                ],
+            })
+        return entries
+
+    def _aura_table(
+        self,
+        data_type: str,
+        start: float,
+        end: float,
+        filters: dict[str, Any],
+    ) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Compute a buffs or debuffs table.
+        '''
+        target_id = filters.get('targetID')
+        intervals = self.auras.select(
+            source_id=filters.get('sourceID'),
+            target_id=target_id,
+            ability_id=filters.get('abilityID'),
+            kind=data_type,
+        )
+
+        auras = []
+        for aura in sorted(set(intervals.ability_ids.tolist())):
+            bands = intervals.bands(ability_id=aura).overlap(start, end)
+            uses = intervals.select(ability_id=aura).applications(start, end)
+            if not len(bands) and not uses:
+                continue
+            auras.append({
+                **self._ability_entry(aura),
+                'totalUptime': bands.uptime(),
+                'totalUses': uses,
+                'bands': [
+                    {'startTime': band_start, 'endTime': band_end}
+                    for band_start, band_end in bands
+                ],
+            })
+
+        auras.sort(key=lambda aura: aura['totalUptime'], reverse=True)
+        return {
+            'totalTime': end - start,
+            'useTargets': target_id is not None,
+            'auras': auras,
+        }
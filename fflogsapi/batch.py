@@ -0,0 +1,188 @@
+'''
+Query batching, which allows many queries to be sent to the FF Logs API in a single request.
+'''
+
+from typing import TYPE_CHECKING, Any
+
+from gql.transport.exceptions import TransportQueryError
+
+from .util.batching import merge_queries, split_result
+from .util.indexing import itindex
+
+if TYPE_CHECKING:
+    from .client import BaseFFLogsClient
+
+
+class FFLogsBatchedQuery:
+    '''
+    A query that has been added to a query batch.
+    '''
+
+    query: str = ''
+    ''' The GraphQL query '''
+
+    def __init__(self, query: str, client: 'BaseFFLogsClient') -> None:
+        self.query = query
+        self._client = client
+        self._result = None
+
+    @property
+    def done(self) -> bool:
+        '''
+        Whether or not the query has been executed.
+        '''
+        return self._result is not None
+
+    def result(self) -> dict[str, Any]:
+        '''
+        Returns:
+            The result of the query as a dictionary. The result is read-only if the client
+            does not copy results.
+        Raises:
+            RuntimeError if the batch containing the query has not been executed yet.
+        '''
+        if not self.done:
+            raise RuntimeError('The query batch must be executed before its results can be used')
+        return self._client._deliver(self._result)
+
+
+class BaseFFLogsQueryBatch:
+    '''
+    Bookkeeping shared by the synchronous and asynchronous query batches.
+    Base class for specific batch types, do not use.
+    '''
+
+    def __init__(
+        self,
+        client: 'BaseFFLogsClient',
+        max_size: int = 25,
+        ignore_cache: bool = False,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f'The maximum batch size must be at least 1 (got {max_size})')
+
+        self._client = client
+        self.max_size = max_size
+        self.ignore_cache = ignore_cache
+        self._queries = {}
+        self._targets = []
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def q(self, query: str) -> FFLogsBatchedQuery:
+        '''
+        Add a raw GraphQL query to the batch.
+
+        Identical queries are only executed once.
+
+        Args:
+            query: The GraphQL query to add.
+        Returns:
+            A handle which gives access to the result of the query once the batch is executed.
+        '''
+        if query not in self._queries:
+            self._queries[query] = FFLogsBatchedQuery(query, client=self._client)
+        return self._queries[query]
+
+    def fetch(self, obj: Any, *keys: str) -> None:
+        '''
+        Add queries for the given fields of an API object (e.g. a fight or report) to the batch.
+
+        When the batch is executed, the fields are stored on the object just like when they are
+        accessed through the object's methods. Fields the object already has are skipped.
+
+        Args:
+            obj: The object to fetch fields for.
+            keys: The names of the fields to fetch, e.g. ``'name'`` or ``'startTime'``.
+        '''
+        for key in keys:
+            if key in obj._data:
+                continue
+            self._targets.append((obj, key, self.q(obj._format_query(key))))
+
+    def _pending_chunks(self) -> list[list[FFLogsBatchedQuery]]:
+        '''
+        INTERNAL
+        Resolve queries from the cache and split the remaining ones into request sized chunks.
+        '''
+        pending = []
+        for batched in self._queries.values():
+            if batched.done:
+                continue
+            if not self.ignore_cache:
+                cached_result = self._client._cache_lookup(batched.query)
+                if cached_result is not None:
+                    batched._result = cached_result
+                    continue
+            pending.append(batched)
+
+        return [pending[i:i + self.max_size] for i in range(0, len(pending), self.max_size)]
+
+    def _store(self, batched: FFLogsBatchedQuery, result: dict[str, Any]) -> None:
+        '''
+        INTERNAL
+        Store the result of a single query in the batch and the query cache.
+        '''
+        batched._result = self._client._cache_store(batched.query, result)
+
+    def _finish(self) -> None:
+        '''
+        INTERNAL
+        Fill fetched fields into their objects.
+        '''
+        for obj, key, batched in self._targets:
+            obj._data[key] = itindex(batched.result(), obj.DATA_INDICES)[key]
+        self._targets = []
+
+
+class FFLogsQueryBatch(BaseFFLogsQueryBatch):
+    '''
+    A batch of queries that are executed against the FF Logs API in as few requests as possible.
+
+    The root fields of the batched queries are aliased and merged into a single GraphQL document,
+    so that up to `max_size` queries are executed in one round trip. The result is then split back
+    into the results of the individual queries, which are cached separately.
+
+    If a merged request fails with a GraphQL error, its queries are retried one by one so that the
+    error is raised by the query that caused it. Other errors, e.g. connection errors, are raised
+    right away.
+
+    Use :func:`fflogsapi.FFLogsClient.batch` to create query batches.
+    '''
+
+    def __enter__(self) -> 'FFLogsQueryBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def _execute_chunk(self, chunk: list[FFLogsBatchedQuery]) -> None:
+        '''
+        INTERNAL
+        Execute a chunk of queries in a single request.
+        '''
+        if len(chunk) > 1:
+            try:
+                result = self._client._execute(merge_queries([b.query for b in chunk]))
+            except TransportQueryError:
+                # a GraphQL error in one of the queries, find out which one below
+                pass
+            else:
+                for batched, query_result in zip(chunk, split_result(result, len(chunk))):
+                    self._store(batched, query_result)
+                return
+
+        for batched in chunk:
+            self._store(batched, self._client._execute(batched.query))
+
+    def execute(self) -> None:
+        '''
+        Execute all queries in the batch that have not been executed yet.
+
+        This is done automatically when leaving the batch's ``with`` block.
+        '''
+        for chunk in self._pending_chunks():
+            self._execute_chunk(chunk)
+        self._finish()
@@ -0,0 +1,26 @@
+'''
+Storage backends for the client's query cache.
+'''
+
+from .base import CacheBackend
+from .bounded import BoundedMemoryCacheBackend
+from .memory import MemoryCacheBackend
+from .sqlite import SQLiteCacheBackend
+from .tiered import TieredCacheBackend
+
+__all__ = [
+    # base.py
+    'CacheBackend',
+
+    # bounded.py
+    'BoundedMemoryCacheBackend',
+
+    # memory.py
+    'MemoryCacheBackend',
+
+    # sqlite.py
+    'SQLiteCacheBackend',
+
+    # tiered.py
+    'TieredCacheBackend',
+]
@@ -0,0 +1,101 @@
+from typing import Any, Iterator, Optional
+
+
+class CacheBackend:
+    '''
+    Interface for storage backends of the client's query cache.
+
+    A cache backend maps query strings to query results. Each entry carries its own expiry time,
+    given as a unix timestamp. Backends only store entries, while the client decides when an entry
+    is too old to be used. This means that :func:`get` must return expired entries as well,
+    until they are removed by :func:`delete` or :func:`expire`.
+
+    Custom backends should subclass this class and implement at least :func:`get`, :func:`set`,
+    :func:`delete`, :func:`expire`, :func:`iterate` and :func:`__len__`.
+    '''
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, query: str) -> bool:
+        return self.get(query) is not None
+
+    def get(self, query: str) -> Optional[tuple[float, Any]]:
+        '''
+        Look up the cache entry of a query.
+
+        Args:
+            query: The query to look up.
+        Returns:
+            A tuple of the entry's expiry time and the cached result,
+            or None if the query is not cached.
+        '''
+        raise NotImplementedError
+
+    def set(self, query: str, result: Any, expiry: float) -> None:
+        '''
+        Store the result of a query, replacing any existing entry for the query.
+
+        Args:
+            query: The query to store the result of.
+            result: The result of the query.
+            expiry: The unix timestamp at which the entry expires.
+        '''
+        raise NotImplementedError
+
+    def delete(self, query: str) -> None:
+        '''
+        Remove the entry of a query from the cache, if it exists.
+
+        Args:
+            query: The query to remove the entry of.
+        '''
+        raise NotImplementedError
+
+    def expire(self, now: float) -> int:
+        '''
+        Remove all entries that have expired.
+
+        Args:
+            now: The current unix timestamp.
+        Returns:
+            The amount of removed entries.
+        '''
+        raise NotImplementedError
+
+    def iterate(self) -> Iterator[tuple[str, float, Any]]:
+        '''
+        Iterate over all entries in the cache.
+
+        Returns:
+            An iterator of ``(query, expiry, result)`` tuples.
+        '''
+        raise NotImplementedError
+
+    def extend(self, extension_time: float) -> None:
+        '''
+        Extend the lifetime of all cache entries.
+
+        Args:
+            extension_time: How much time to add to the entries' expiry time, in seconds.
+        '''
+        for query, expiry, result in list(self.iterate()):
+            self.set(query, result, expiry + extension_time)
+
+    def save(self, directory: str) -> Optional[str]:
+        '''
+        Persist the cache. Backends that write entries as soon as they are set need not do
+        anything here.
+
+        Args:
+            directory: The client's cache directory.
+        Returns:
+            The path the cache was saved to, or None if nothing was saved.
+        '''
+        return None
+
+    def close(self) -> None:
+        '''
+        Release any resources held by the backend.
+        '''
+        pass
@@ -0,0 +1,208 @@
+import heapq
+import pickle
+from collections import OrderedDict
+from itertools import count
+from threading import RLock
+from time import time
+from typing import Any, Iterator, Optional
+
+from .base import CacheBackend
+
+
+class BoundedMemoryCacheBackend(CacheBackend):
+    '''
+    In-memory cache backend with a limited capacity.
+
+    When the cache grows beyond its entry or byte budget, entries are evicted according to the
+    eviction policy until the cache fits the budget again. With a byte budget, the size of an entry
+    is approximated by the size of its pickled result, which is only computed if `max_bytes` is
+    set. Entries that are larger than the entire byte budget are not stored.
+
+    Expired entries are evicted proactively whenever the cache is accessed, regardless of which
+    entry is accessed. Note that this means expired entries can not be served by a client that
+    ignores cache expiry.
+
+    The backend is typically used as a fast first level cache in front of a persistent backend,
+    see :class:`fflogsapi.cache.TieredCacheBackend`.
+
+    Args:
+        max_entries: The maximum amount of entries to keep. Unlimited if None.
+        max_bytes: The maximum total size of the cached results, in bytes. Unlimited if None.
+        policy: The eviction policy. Either ``'lru'`` (least recently used) or
+                ``'lfu'`` (least frequently used).
+
+    Raises:
+        ValueError if the eviction policy is invalid.
+    '''
+
+    POLICIES = ('lru', 'lfu')
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = 'lru',
+    ) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f'Invalid eviction policy (must be one of {self.POLICIES}, got {policy})'
+            )
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+
+        self.size_bytes = 0
+        ''' The approximate total size of the cached results in bytes, 0 without a byte budget '''
+
+        # query -> (expiry, result, size), ordered from least to most recently used
+        self._entries = OrderedDict()
+        self._hits = {}
+        # heaps with lazy invalidation, stale items are skipped when popped
+        self._expiry_heap = []
+        self._lfu_heap = []
+        self._counter = count()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, query: str) -> None:
+        '''
+        INTERNAL
+        Remove an entry and its bookkeeping.
+        '''
+        entry = self._entries.pop(query, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
+            self._hits.pop(query, None)
+
+    def _touch(self, query: str) -> None:
+        '''
+        INTERNAL
+        Record a use of an entry for the eviction policy.
+        '''
+        if self.policy == 'lru':
+            self._entries.move_to_end(query)
+        else:
+            self._hits[query] += 1
+            heapq.heappush(self._lfu_heap, (self._hits[query], next(self._counter), query))
+
+    def _expire_due(self, now: float) -> int:
+        '''
+        INTERNAL
+        Evict all entries whose expiry time has passed.
+        '''
+        expired = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expiry, _, query = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(query)
+            if entry is not None and entry[0] == expiry:
+                self._remove(query)
+                expired += 1
+        return expired
+
+    def _evict_one(self, protected: str) -> None:
+        '''
+        INTERNAL
+        Evict a single entry according to the eviction policy.
+        The `protected` entry is only evicted if it is the last entry in the cache.
+        '''
+        if self.policy == 'lru':
+            self._remove(next(iter(self._entries)))
+            return
+
+        # newly added entries have no uses yet, don't let them evict themselves right away
+        skipped = None
+        while self._lfu_heap:
+            item = heapq.heappop(self._lfu_heap)
+            hits, _, query = item
+            if self._hits.get(query) != hits:
+                continue
+            if query == protected and len(self._entries) > 1:
+                skipped = item
+                continue
+            self._remove(query)
+            break
+
+        if skipped is not None:
+            heapq.heappush(self._lfu_heap, skipped)
+
+    def _over_budget(self) -> bool:
+        '''
+        INTERNAL
+        Whether or not the cache currently exceeds its budget.
+        '''
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.size_bytes > self.max_bytes
+
+    def _compact(self) -> None:
+        '''
+        INTERNAL
+        Drop stale heap items once they outnumber the live entries.
+        '''
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (entry[0], next(self._counter), query) for query, entry in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        if len(self._lfu_heap) > 2 * len(self._entries) + 64:
+            self._lfu_heap = [
+                (hits, next(self._counter), query) for query, hits in self._hits.items()
+            ]
+            heapq.heapify(self._lfu_heap)
+
+    def get(self, query: str) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            self._expire_due(time())
+            entry = self._entries.get(query)
+            if entry is None:
+                return None
+
+            self._touch(query)
+            return entry[0], entry[1]
+
+    def set(self, query: str, result: Any, expiry: float) -> None:
+        # measuring a result means pickling it, which is costly for large results like events
+        size = 0
+        if self.max_bytes is not None:
+            size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._remove(query)
+            self._expire_due(time())
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            self._entries[query] = (expiry, result, size)
+            self.size_bytes += size
+            heapq.heappush(self._expiry_heap, (expiry, next(self._counter), query))
+            if self.policy == 'lfu':
+                self._hits[query] = 0
+                heapq.heappush(self._lfu_heap, (0, next(self._counter), query))
+
+            while self._over_budget():
+                self._evict_one(protected=query)
+            self._compact()
+
+    def delete(self, query: str) -> None:
+        with self._lock:
+            self._remove(query)
+
+    def expire(self, now: float) -> int:
+        with self._lock:
+            return self._expire_due(now)
+
+    def iterate(self) -> Iterator[tuple[str, float, Any]]:
+        with self._lock:
+            entries = [(query, entry[0], entry[1]) for query, entry in self._entries.items()]
+        yield from entries
+
+    def extend(self, extension_time: float) -> None:
+        with self._lock:
+            for query, entry in self._entries.items():
+                self._entries[query] = (entry[0] + extension_time, entry[1], entry[2])
+            self._expiry_heap = [
+                (entry[0], next(self._counter), query) for query, entry in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
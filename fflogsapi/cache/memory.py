@@ -0,0 +1,85 @@
+import os
+import pickle
+from typing import Any, Iterator, Optional
+
+from .base import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    '''
+    Cache backend keeping all entries in a dictionary in memory.
+
+    This is the default backend of the client. The whole cache can be pickled to a file in the
+    client's cache directory with :func:`save`, and loaded again with :func:`load`.
+    '''
+
+    def __init__(self, entries: Optional[dict[str, tuple[float, Any]]] = None) -> None:
+        self._entries = entries if entries is not None else {}
+
+    @classmethod
+    def load(cls, path: str) -> 'MemoryCacheBackend':
+        '''
+        Load a cache previously saved with :func:`save`.
+
+        Args:
+            path: The path of the pickled cache file.
+        Returns:
+            A memory cache backend containing the entries of the file.
+        '''
+        with open(path, 'rb') as f:
+            return cls(entries=pickle.load(f))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: str) -> Optional[tuple[float, Any]]:
+        return self._entries.get(query)
+
+    def set(self, query: str, result: Any, expiry: float) -> None:
+        self._entries[query] = (expiry, result)
+
+    def delete(self, query: str) -> None:
+        self._entries.pop(query, None)
+
+    def expire(self, now: float) -> int:
+        # copy the entries, other threads may add to the cache in the meantime
+        expired = [query for query, entry in list(self._entries.items()) if now >= entry[0]]
+        for query in expired:
+            del self._entries[query]
+        return len(expired)
+
+    def iterate(self) -> Iterator[tuple[str, float, Any]]:
+        for query, (expiry, result) in list(self._entries.items()):
+            yield query, expiry, result
+
+    def extend(self, extension_time: float) -> None:
+        for query, entry in list(self._entries.items()):
+            self._entries[query] = (entry[0] + extension_time, entry[1])
+
+    def save(self, directory: str) -> Optional[str]:
+        '''
+        Stores all cached queries in pickled format.
+
+        The file name is the unix timestamp of the entry with the largest expiry time. This means
+        that there is no guarantee that *all* results in the cache are usable, but there is at
+        least *some* useful data in the cache.
+
+        Args:
+            directory: The directory to save the cache file in.
+        Returns:
+            The path of the cache file, or None if the cache is empty.
+        '''
+        if not self._entries:
+            return None
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # annotate the cache file with the largest expiry time
+        # that way cache files with a timestamp larger than the current time are fully expired
+        max_expiry = max(entry[0] for entry in self._entries.values())
+        cache_file_path = os.path.join(directory, f'{max_expiry}.pkl')
+        with open(cache_file_path, 'wb+') as f:
+            pickle.dump(self._entries, f)
+
+        return cache_file_path
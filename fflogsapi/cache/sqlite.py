@@ -0,0 +1,103 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+from threading import Lock
+from typing import Any, Iterator, Optional
+
+from .base import CacheBackend
+
+
+class SQLiteCacheBackend(CacheBackend):
+    '''
+    Cache backend storing entries in an SQLite database on disk.
+
+    Entries are written to the database one at a time as soon as they are set, and are only
+    loaded into memory when they are looked up. This keeps memory usage low for large caches, and
+    cached results survive crashes without having to call :func:`fflogsapi.FFLogsClient.save_cache`.
+
+    The backend may be shared between multiple clients in the same process, including
+    :class:`fflogsapi.aio.AsyncFFLogsClient`.
+
+    Args:
+        path: The path of the database file. By default, the database is stored in the system's
+              temporary directory.
+    '''
+
+    DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'fflogsapi-querycache.sqlite3')
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS query_cache ('
+                'query TEXT PRIMARY KEY, expiry REAL NOT NULL, result BLOB NOT NULL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS query_cache_expiry ON query_cache (expiry)'
+            )
+
+    def _execute(self, statement: str, parameters: tuple = ()) -> list[tuple]:
+        '''
+        INTERNAL
+        Execute a statement against the database and fetch all resulting rows.
+        '''
+        with self._lock:
+            return self._connection.execute(statement, parameters).fetchall()
+
+    def __len__(self) -> int:
+        return self._execute('SELECT COUNT(*) FROM query_cache')[0][0]
+
+    def get(self, query: str) -> Optional[tuple[float, Any]]:
+        rows = self._execute('SELECT expiry, result FROM query_cache WHERE query = ?', (query,))
+        if not rows:
+            return None
+        return rows[0][0], pickle.loads(rows[0][1])
+
+    def set(self, query: str, result: Any, expiry: float) -> None:
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._execute(
+            'INSERT OR REPLACE INTO query_cache (query, expiry, result) VALUES (?, ?, ?)',
+            (query, expiry, blob),
+        )
+
+    def delete(self, query: str) -> None:
+        self._execute('DELETE FROM query_cache WHERE query = ?', (query,))
+
+    def expire(self, now: float) -> int:
+        with self._lock:
+            return self._connection.execute(
+                'DELETE FROM query_cache WHERE expiry <= ?', (now,)
+            ).rowcount
+
+    def iterate(self) -> Iterator[tuple[str, float, Any]]:
+        # only keep the keys in memory, results are loaded one at a time
+        for (query,) in self._execute('SELECT query FROM query_cache'):
+            entry = self.get(query)
+            if entry is not None:
+                yield query, entry[0], entry[1]
+
+    def extend(self, extension_time: float) -> None:
+        self._execute('UPDATE query_cache SET expiry = expiry + ?', (extension_time,))
+
+    def save(self, directory: str) -> Optional[str]:
+        '''
+        Entries are written as soon as they are set, so this only checkpoints the database's
+        write-ahead log.
+
+        Returns:
+            The path of the database file.
+        '''
+        self._execute('PRAGMA wal_checkpoint(PASSIVE)')
+        return self.path
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,69 @@
+from typing import Any, Iterator, Optional
+
+from .base import CacheBackend
+
+
+class TieredCacheBackend(CacheBackend):
+    '''
+    Two-level cache backend, combining a fast (and usually bounded) first level cache with a
+    persistent second level cache.
+
+    Entries are written to both levels. Lookups that miss the first level are served by the second
+    level, and the entry is then promoted to the first level. For example, to keep at most 256 MB
+    of recently used results in memory while storing everything on disk:
+
+    .. code-block:: python
+
+        backend = TieredCacheBackend(
+            BoundedMemoryCacheBackend(max_bytes=256 * 1024 ** 2),
+            SQLiteCacheBackend(),
+        )
+        client = FFLogsClient(CLIENT_ID, CLIENT_SECRET, cache_backend=backend)
+
+    Args:
+        l1: The first level cache.
+        l2: The second level cache, which is considered to contain all entries.
+    '''
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend) -> None:
+        self.l1 = l1
+        self.l2 = l2
+
+    def __len__(self) -> int:
+        return len(self.l2)
+
+    def get(self, query: str) -> Optional[tuple[float, Any]]:
+        entry = self.l1.get(query)
+        if entry is not None:
+            return entry
+
+        entry = self.l2.get(query)
+        if entry is not None:
+            self.l1.set(query, entry[1], entry[0])
+        return entry
+
+    def set(self, query: str, result: Any, expiry: float) -> None:
+        self.l2.set(query, result, expiry)
+        self.l1.set(query, result, expiry)
+
+    def delete(self, query: str) -> None:
+        self.l1.delete(query)
+        self.l2.delete(query)
+
+    def expire(self, now: float) -> int:
+        self.l1.expire(now)
+        return self.l2.expire(now)
+
+    def iterate(self) -> Iterator[tuple[str, float, Any]]:
+        return self.l2.iterate()
+
+    def extend(self, extension_time: float) -> None:
+        self.l1.extend(extension_time)
+        self.l2.extend(extension_time)
+
+    def save(self, directory: str) -> Optional[str]:
+        return self.l2.save(directory)
+
+    def close(self) -> None:
+        self.l1.close()
+        self.l2.close()
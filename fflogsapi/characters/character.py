@@ -38,15 +38,21 @@ class FFLogsCharacter:
 
         self.id = self.filters['id']
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a character
+        Build the query for a specific piece of information about a character
         '''
         filters = construct_filter_string(self.filters)
-        result = self._client.q(Q_CHARACTER_DATA.format(
+        return Q_CHARACTER_DATA.format(
             filters=filters,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a character
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -151,7 +157,7 @@ class FFLogsCharacter:
         result = self._query_data(f'encounterRankings{filters}')['encounterRankings']
         from ..guilds.guild import FFLogsGuild
         from ..reports.report import FFLogsReport
-        jobs = self._client.jobs()
+        jobs = self._client.jobs_by_slug()
         ranks = []
         for rank in result['ranks']:
             report = FFLogsReport(code=rank['report']['code'], client=self._client)
@@ -161,8 +167,8 @@ class FFLogsCharacter:
             if rank['guild']['id']:
                 guild = FFLogsGuild(id=rank['guild']['id'], client=self._client)
 
-            job = list(filter(lambda j: j.slug == rank['spec'], jobs))[0]
-            best_job = list(filter(lambda j: j.slug == rank['bestSpec'], jobs))[0]
+            job = jobs[rank['spec']]
+            best_job = jobs[rank['bestSpec']]
 
             ranks.append(FFLogsFightRank(
                 locked_in=rank['lockedIn'],
@@ -205,9 +211,9 @@ class FFLogsCharacter:
         '''
         Turn JSON data into an all-stars ranking dataclass
         '''
-        jobs = self._client.jobs()
+        jobs = self._client.jobs_by_slug()
         if not job and 'spec' in data:
-            job = list(filter(lambda j: j.slug == data['spec'], jobs))[0]
+            job = jobs[data['spec']]
 
         partitions = zone.partitions()
         return FFLogsAllStarsRanking(
@@ -244,17 +250,17 @@ class FFLogsCharacter:
         result = self._query_data(f'zoneRankings{filters}')['zoneRankings']
         from ..world.zone import FFLogsZone
         zone = FFLogsZone(id=result['zone'], client=self._client)
-        jobs = self._client.jobs()
+        jobs = self._client.jobs_by_slug()
         encounters = []
         for rank in result['rankings']:
             # TODO: real fixes instead of ignoring the issue
-            # IndexError is from the spec filters on null rankings
+            # KeyError is from the job lookups on null rankings
             # StopIteration is from the allstars ranking construction
             try:
                 from ..world.encounter import FFLogsEncounter
                 encounter = FFLogsEncounter(id=rank['encounter']['id'], client=self._client)
-                job = list(filter(lambda j: j.slug == rank['spec'], jobs))[0]
-                best_job = list(filter(lambda j: j.slug == rank['bestSpec'], jobs))[0]
+                job = jobs[rank['spec']]
+                best_job = jobs[rank['bestSpec']]
 
                 encounters.append(FFLogsZoneEncounterRanking(
                     locked_in=rank['lockedIn'],
@@ -268,7 +274,7 @@ class FFLogsCharacter:
                     best_job=best_job,
                     all_stars=self._make_all_stars_ranking(rank['allStars'], zone=zone, job=job),
                 ))
-            except (IndexError, StopIteration):
+            except (KeyError, StopIteration):
                 continue
 
         return FFLogsZoneRanking(
@@ -3,90 +3,86 @@ The client implementation that allows communication with the FF Logs API.
 '''
 
 import os
-import pickle
 import tempfile
-from copy import deepcopy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from functools import wraps
-from time import time
-from typing import Any
+from time import sleep, time
+from typing import Any, ContextManager, Iterable, Optional, Union
 from warnings import warn
 
 from gql import Client as GQLClient
 from gql import gql
 from gql.transport.requests import RequestsHTTPTransport
 from oauthlib.oauth2 import BackendApplicationClient, WebApplicationClient
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from requests_oauthlib import OAuth2Session
 
+from .batch import FFLogsQueryBatch
+from .cache import CacheBackend, MemoryCacheBackend
 from .characters.client_extensions import CharactersMixin
 from .game.client_extensions import GameDataMixin
 from .guilds.client_extensions import GuildsMixin
 from .prograce.client_extensions import ProgressRaceMixin
+from .ratelimit import FFLogsRateLimiter, is_low_priority, low_priority
 from .reports.client_extensions import ReportsMixin
 from .user.client_extensions import UserMixin
 from .user_auth import UserModeAuthMixin
+from .util.frozen import FrozenDict, FrozenList, freeze, thaw
 from .world.client_extensions import WorldMixin
+from .world.snapshot import FFLogsWorldSnapshot
 
 
 def ensure_token(func):
     '''
     Ensures the given function has a valid OAuth token.
+
+    Concurrent threads that fail with the same stale token will only refresh it once.
     '''
     @wraps(func)
     def ensured(*args, **kwargs):
         self = args[0]
+        if not self.token:
+            self._refresh_stale_token(stale_token=self.token)
+
+        token = self.token
         try:
             return func(*args, **kwargs)
         except Exception:
-            if self.mode == 'user':
-                # for user mode, the user must login through their browser
-                # see user_auth.py
-                self.user_auth()
-            elif self.mode == 'client':
-                self.token = self.oauth_session.fetch_token(
-                    self.OAUTH_TOKEN_URL,
-                    auth=self.auth,
-                )
+            self._refresh_stale_token(stale_token=token)
             return func(*args, **kwargs)
     return ensured
 
 
-class FFLogsClient(
-    UserModeAuthMixin,
-    ReportsMixin,
-    CharactersMixin,
-    GuildsMixin,
-    WorldMixin,
-    UserMixin,
-    GameDataMixin,
-    ProgressRaceMixin,
-):
+class _PooledRequestsHTTPTransport(RequestsHTTPTransport):
     '''
-    A client capable of communicating with the FF Logs V2 GraphQL API.
+    A requests transport that keeps a pool of keep-alive connections to the API, so that
+    multiple threads can send requests over the same transport at once.
 
-    Caching is enabled by default, but can be overriden with the enable_caching parameter when
-    instantiating the client. A cache of executed queries will then be maintained by the client.
-    To save the query cache for later reuse, you must manually call :func:`save_cache` on the
-    client. It's also possible to extend the lifetime of all cache queries with
-    :func:`extend_cache`, or to manually clean up old cache files with :func:`clean_cache`.
+    Args:
+        url: The GraphQL endpoint.
+        pool_size: The maximum amount of connections kept open for reuse.
+    '''
 
-    Two modes of use are supported by the client - ``client`` and ``user`` mode.
-    When in client mode, the API client can access the public API. To access private information
-    such as private logs or hidden characters' information, you *must* use user mode.
+    def __init__(self, url: str, pool_size: int) -> None:
+        super().__init__(url=url)
+        self.pool_size = pool_size
 
-    Args:
-        client_id: Client application ID
-        client_secret: Client application secret
-        mode: Whether to use the client or user endpoint. Client mode gives public API access,
-              while user mode allows access to private information. User mode requires login.
-        enable_caching: If enabled, the client will cache the result of queries
-                        for up to a time specified by the cache_expiry argument.
-        cache_directory: The directory to read and save query cache files in.
-        cache_expiry: How long to keep query results in cache, in seconds. Default is 1 day.
-        cache_override: If set, force the client to load cached queries from the given file path
-        ignore_cache_expiry: If set to True, the client will load the most up-to-date cache,
-                             even if it has expired
-        clean_cache: Automatically remove expired cache files from the cache directory
+    def connect(self) -> None:
+        super().connect()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+
+class BaseFFLogsClient:
+    '''
+    Authentication and query caching shared by all FF Logs API clients.
+    Base class for specific client types, do not use.
+
+    See :class:`FFLogsClient` for a description of the arguments.
 
     Raises:
         ValueError if the provided client mode is invalid.
@@ -98,7 +94,10 @@ class FFLogsClient(
 
     OAUTH_TOKEN_URL = 'https://www.fflogs.com/oauth/token'
 
-    Q_RATE_LIMIT = 'query{{rateLimitData{innerQuery}}}'
+    Q_RATE_LIMIT = 'query{{rateLimitData{{{innerQuery}}}}}'
+    Q_RATE_LIMIT_USAGE = Q_RATE_LIMIT.format(
+        innerQuery='limitPerHour pointsSpentThisHour pointsResetIn',
+    )
 
     def __init__(
         self,
@@ -111,6 +110,10 @@ class FFLogsClient(
         cache_override: str = '',
         ignore_cache_expiry: bool = False,
         clean_cache: bool = True,
+        cache_backend: Optional[CacheBackend] = None,
+        copy_results: bool = True,
+        world_snapshot: Optional[Union[str, FFLogsWorldSnapshot]] = None,
+        rate_limiter: Optional[FFLogsRateLimiter] = None,
     ) -> None:
         self.auth = HTTPBasicAuth(client_id, client_secret)
         oauth_client = None
@@ -126,10 +129,16 @@ class FFLogsClient(
         self.token = {}
         self.mode = mode
 
-        self._query_cache = {}
+        self._cache = cache_backend if cache_backend is not None else MemoryCacheBackend()
         self.cache_expiry = cache_expiry
         self.cache_queries = enable_caching
         self.ignore_cache_expiry = ignore_cache_expiry
+        self.copy_results = copy_results
+
+        if isinstance(world_snapshot, str):
+            world_snapshot = FFLogsWorldSnapshot.load(world_snapshot)
+        self.world_snapshot = world_snapshot
+        self.rate_limiter = rate_limiter
 
         # deprecation warning for cache_directory use
         if cache_directory != './fflogs-querycache':
@@ -140,7 +149,8 @@ class FFLogsClient(
             # future behavior
             self.cache_dir = os.path.join(tempfile.gettempdir(), 'fflogsapi')
 
-        if enable_caching:
+        # custom backends manage their own storage
+        if enable_caching and cache_backend is None:
             if not os.path.exists(self.cache_dir):
                 os.makedirs(self.cache_dir)
 
@@ -158,88 +168,148 @@ class FFLogsClient(
                     cache_path = os.path.join(self.cache_dir, max_expiry_cache)
 
             if cache_path:
-                with open(cache_path, 'rb') as f:
-                    self._query_cache = pickle.load(f)
+                self._cache = MemoryCacheBackend.load(cache_path)
 
         if clean_cache:
             self.clean_cache()
 
-        endpoint = self.CLIENT_ENDPOINT if mode == 'client' else self.USER_ENDPOINT
-        self._transport = RequestsHTTPTransport(url=self.API_URL + endpoint)
-        self._gql_client = GQLClient(transport=self._transport, fetch_schema_from_transport=True)
+        self._endpoint = self.API_URL + (
+            self.CLIENT_ENDPOINT if mode == 'client' else self.USER_ENDPOINT
+        )
 
-    def close(self) -> None:
+    def _refresh_token(self) -> None:
         '''
-        Close the OAuth session with the FF Logs API
+        INTERNAL
+        Fetch a new OAuth token for the client.
         '''
-        self.oauth_session.close()
-        self._transport.close()
+        if self.mode == 'user':
+            # for user mode, the user must login through their browser
+            # see user_auth.py
+            self.user_auth()
+        elif self.mode == 'client':
+            self.token = self.oauth_session.fetch_token(
+                self.OAUTH_TOKEN_URL,
+                auth=self.auth,
+            )
 
-    @ensure_token
-    def q(self, query: str, ignore_cache: bool = False) -> dict[str, Any]:
+    def _auth_headers(self) -> dict[str, str]:
         '''
-        Executes a raw GraphQL query against the FFLogs API.
+        INTERNAL
+        The HTTP headers used to authorize requests against the API.
+        '''
+        access_token = self.token['access_token']
+        return {'Authorization': f'Bearer {access_token}'}
 
-        Generally, you should not use this unless you need to execute a query that is not properly
-        supported by the client. You can also use this function to query for more information in
-        batch than the client normally would.
+    def _cache_lookup(self, query: str) -> Optional[Any]:
+        '''
+        INTERNAL
+        Look up the cached result of a query, removing it from the cache if it has expired.
 
-        The result of the query is stored in cache by default, and will be returned in place of a
-        real query result if the same query is repeated. If you need up-to-date query results,
-        use `ignore_cache` to force the client to query the actual API for the information.
-        Note that the result is still cached if the client has caching enabled, so any repeat of
-        the same query that does not use `ignore_cache` will always return the last result of
-        actually executing the query.
+        Queries that are in the world snapshot of the client are answered from the snapshot,
+        even if caching is disabled.
 
-        Args:
-            query: The GraphQL query to execute.
-            ignore_cache: Whether or not to ignore cached results, forcing a query to be executed
-                          against the API.
+        Returns:
+            The cached result of the query, or None if the query has no usable cached result.
+        '''
+        if self.world_snapshot is not None:
+            snapshot_result = self.world_snapshot.get(query)
+            if snapshot_result is not None:
+                return snapshot_result
+
+        if not self.cache_queries:
+            return None
+
+        cached_result = self._cache.get(query)
+        if cached_result is None:
+            return None
+
+        # expired entry
+        if not self.ignore_cache_expiry and time() >= cached_result[0]:
+            self._cache.delete(query)
+            return None
+
+        result = cached_result[1]
+        if not isinstance(result, (FrozenDict, FrozenList)):
+            # entry from a cache saved before results were frozen, only freeze it once
+            result = freeze(result)
+            self._cache.set(query, result, cached_result[0])
+
+        if self.world_snapshot is not None and self.world_snapshot.recording:
+            self.world_snapshot.record(query, result)
+        return result
+
+    def _cache_store(self, query: str, result: Any) -> Any:
+        '''
+        INTERNAL
+        Store the result of a query in the query cache, if caching is enabled.
 
         Returns:
-            The result of the query as a dictionary.
+            The frozen result as stored in the cache.
         '''
-        if self.cache_queries and not ignore_cache and query in self._query_cache:
-            cached_result = self._query_cache[query]
-            # expired entry
-            if not self.ignore_cache_expiry and time() >= cached_result[0]:
-                self._query_cache.pop(query)
-            else:
-                return deepcopy(cached_result[1])
+        result = freeze(result)
+        if self.cache_queries:
+            self._cache.set(query, result, time() + self.cache_expiry)
+        if self.world_snapshot is not None and self.world_snapshot.recording:
+            self.world_snapshot.record(query, result)
+        return result
 
-        access_token = self.token['access_token']
-        self._transport.headers = {'Authorization': f'Bearer {access_token}'}
-        gql_q = gql(query)
-        result = self._gql_client.execute(gql_q)
+    def _deliver(self, result: Any) -> Any:
+        '''
+        INTERNAL
+        Prepare a frozen query result for the caller, copying it unless the client is in
+        zero-copy mode.
+        '''
+        return thaw(result) if self.copy_results else result
 
-        if self.cache_queries:
-            self._query_cache[query] = (time() + self.cache_expiry, result)
+    def low_priority(self) -> ContextManager[None]:
+        '''
+        Mark all requests made within the ``with`` block as low priority, e.g. for background
+        crawls:
+
+        .. code-block:: python
+
+            with client.low_priority():
+                for page in client.items(prefetch=4):
+                    ...
+
+        If the client has a rate limiter, low priority requests wait until the point budget
+        resets once the remaining points fall below the limiter's low priority reserve, keeping
+        those points available to other requests. Without a rate limiter, this has no effect.
 
-        return deepcopy(result)
+        Returns:
+            A context manager.
+        '''
+        return low_priority()
+
+    def _update_rate_limiter(self, result: dict[str, Any]) -> None:
+        '''
+        INTERNAL
+        Correct the rate limiter's budget with a result of :data:`Q_RATE_LIMIT_USAGE`.
+        '''
+        usage = result['rateLimitData']
+        self.rate_limiter.update(
+            limit_per_hour=usage['limitPerHour'],
+            spent=usage['pointsSpentThisHour'],
+            reset_in=usage['pointsResetIn'],
+        )
 
     def save_cache(self, silent: bool = True) -> None:
         '''
-        Stores all cached queries in pickled format.
+        Stores all cached queries.
+
+        With the default in-memory cache, the cache is pickled to a file in the cache directory.
+        The file name is the the unix timestamp of the query with the largest expiry time. This
+        means that there is no guarantee that *all* results in the cache are usable, but there is
+        at least *some* useful data in the cache.
 
-        The query cache file is stored in the cache directory. The file name is the the
-        unix timestamp of the query with the largest expiry time. This means that there is
-        no guarantee that *all* results in the cache are usable, but there is at least *some*
-        useful data in the cache.
+        Persistent cache backends such as :class:`fflogsapi.cache.SQLiteCacheBackend` store
+        queries as soon as they are executed, so saving the cache is not required for them.
 
         Args:
             silent: If False, print the path of the cache file.
         '''
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
-
-        # annotate the cache file with the largest expiry time
-        # that way cache files with a timestamp larger than the current time are fully expired
-        max_expiry = max(self._query_cache.values(), key=lambda q: q[0])
-        cache_file_path = os.path.join(self.cache_dir, f'{max_expiry[0]}.pkl')
-        with open(cache_file_path, 'wb+') as f:
-            pickle.dump(self._query_cache, f)
-
-        if not silent:
+        cache_file_path = self._cache.save(self.cache_dir)
+        if not silent and cache_file_path:
             print(f'Cache saved to {cache_file_path}')
 
     def extend_cache(self, extension_time: int) -> None:
@@ -249,17 +319,23 @@ class FFLogsClient(
         Args:
             extension_time: How much time to add to the cache entries' expiry time, in seconds.
         '''
-        for query, entry in self._query_cache.items():
-            self._query_cache[query] = (entry[0] + extension_time, entry[1])
+        self._cache.extend(extension_time)
 
     def clean_cache(self) -> None:
         '''
-        Delete expired cache files.
+        Delete expired cache files and entries.
 
         This goes through the cache file directory, deleting all pickled files with a timestamp less
         than the current unix timestamp. Such cache files are guaranteed not to contain useful data
-        anymore.
+        anymore. Expired entries are also removed from the cache backend, unless the client
+        ignores cache expiry.
         '''
+        if not self.ignore_cache_expiry:
+            self._cache.expire(time())
+
+        if not os.path.exists(self.cache_dir):
+            return
+
         cache_files = list(filter(
             lambda f: f.endswith('.pkl') and f[:-4].replace('.', '').isdigit(),
             os.listdir(self.cache_dir)
@@ -270,6 +346,296 @@ class FFLogsClient(
                 if time() >= expiry:
                     os.remove(os.path.join(self.cache_dir, file))
 
+
+class FFLogsClient(
+    UserModeAuthMixin,
+    ReportsMixin,
+    CharactersMixin,
+    GuildsMixin,
+    WorldMixin,
+    UserMixin,
+    GameDataMixin,
+    ProgressRaceMixin,
+    BaseFFLogsClient,
+):
+    '''
+    A client capable of communicating with the FF Logs V2 GraphQL API.
+
+    Caching is enabled by default, but can be overriden with the enable_caching parameter when
+    instantiating the client. A cache of executed queries will then be maintained by the client.
+    To save the query cache for later reuse, you must manually call :func:`save_cache` on the
+    client. It's also possible to extend the lifetime of all cache queries with
+    :func:`extend_cache`, or to manually clean up old cache files with :func:`clean_cache`.
+
+    Two modes of use are supported by the client - ``client`` and ``user`` mode.
+    When in client mode, the API client can access the public API. To access private information
+    such as private logs or hidden characters' information, you *must* use user mode.
+
+    The client can be shared between threads. To run many independent queries in parallel, see
+    :func:`execute_many` or :class:`fflogsapi.aio.AsyncFFLogsClient`.
+
+    Args:
+        client_id: Client application ID
+        client_secret: Client application secret
+        mode: Whether to use the client or user endpoint. Client mode gives public API access,
+              while user mode allows access to private information. User mode requires login.
+        enable_caching: If enabled, the client will cache the result of queries
+                        for up to a time specified by the cache_expiry argument.
+        cache_directory: The directory to read and save query cache files in.
+        cache_expiry: How long to keep query results in cache, in seconds. Default is 1 day.
+        cache_override: If set, force the client to load cached queries from the given file path
+        ignore_cache_expiry: If set to True, the client will load the most up-to-date cache,
+                             even if it has expired
+        clean_cache: Automatically remove expired cache files from the cache directory
+        cache_backend: If set, store cached queries in the given backend instead of in memory,
+                       e.g. a :class:`fflogsapi.cache.SQLiteCacheBackend`. The same backend may
+                       be shared by multiple clients. Cache files in the cache directory are not
+                       loaded when a custom backend is used.
+        copy_results: If set to False, the client runs in zero-copy mode. Query results are then
+                      returned as read-only dictionaries and lists which are shared with the query
+                      cache, instead of as mutable copies. This is much faster for large results
+                      like fight events. Use :func:`fflogsapi.util.thaw` if you need a mutable
+                      copy of a result.
+        world_snapshot: A :class:`fflogsapi.world.FFLogsWorldSnapshot`, or the path of a saved
+                        snapshot. World data lookups that are in the snapshot are answered from
+                        it instead of querying the API.
+        rate_limiter: A :class:`fflogsapi.FFLogsRateLimiter` that schedules requests to stay
+                      within the client's hourly point allowance. Requests are not scheduled
+                      if None.
+        max_connections: The maximum amount of keep-alive connections to the API that are kept
+                         open for reuse. Should be at least the amount of threads sending
+                         requests at the same time, see :func:`execute_many`.
+
+    Raises:
+        ValueError if the provided client mode is invalid.
+    '''
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        mode: str = 'client',
+        enable_caching: bool = True,
+        cache_directory: str = './fflogs-querycache',
+        cache_expiry: int = 86400,
+        cache_override: str = '',
+        ignore_cache_expiry: bool = False,
+        clean_cache: bool = True,
+        cache_backend: Optional[CacheBackend] = None,
+        copy_results: bool = True,
+        world_snapshot: Optional[Union[str, FFLogsWorldSnapshot]] = None,
+        rate_limiter: Optional[FFLogsRateLimiter] = None,
+        max_connections: int = 10,
+    ) -> None:
+        super().__init__(
+            client_id=client_id,
+            client_secret=client_secret,
+            mode=mode,
+            enable_caching=enable_caching,
+            cache_directory=cache_directory,
+            cache_expiry=cache_expiry,
+            cache_override=cache_override,
+            ignore_cache_expiry=ignore_cache_expiry,
+            clean_cache=clean_cache,
+            cache_backend=cache_backend,
+            copy_results=copy_results,
+            world_snapshot=world_snapshot,
+            rate_limiter=rate_limiter,
+        )
+
+        self.max_connections = max_connections
+        # requests may be made from multiple threads, e.g. when fetching fight events in
+        # parallel. they share one session, whose connections are kept alive for reuse
+        self._transport = _PooledRequestsHTTPTransport(
+            url=self._endpoint,
+            pool_size=max_connections,
+        )
+        self._gql_client = GQLClient(transport=self._transport, fetch_schema_from_transport=True)
+        self._session = None
+        self._connect_lock = threading.Lock()
+        self._token_lock = threading.Lock()
+        self._rate_limit_lock = threading.Lock()
+
+    def close(self) -> None:
+        '''
+        Close the OAuth and HTTP sessions with the FF Logs API
+        '''
+        self.oauth_session.close()
+        with self._connect_lock:
+            if self._session is not None:
+                self._gql_client.close_sync()
+                self._session = None
+
+    def _connect(self) -> Any:
+        '''
+        INTERNAL
+        Open the HTTP session used to communicate with the FF Logs API, if it is not open yet.
+
+        Returns:
+            The GraphQL session.
+        '''
+        with self._connect_lock:
+            if self._session is None:
+                # the schema is fetched when connecting
+                self._transport.headers = self._auth_headers()
+                self._session = self._gql_client.connect_sync()
+            return self._session
+
+    def _refresh_stale_token(self, stale_token: dict) -> None:
+        '''
+        INTERNAL
+        Fetch a new OAuth token, unless another thread already replaced the stale token.
+        '''
+        with self._token_lock:
+            if self.token and self.token is not stale_token:
+                return
+            self._refresh_token()
+
+    def _execute(self, query: str) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Execute a query against the API, bypassing the query cache. If the client has a rate
+        limiter, this waits until the query fits the point budget.
+        '''
+        if self.rate_limiter is not None:
+            self._schedule_request()
+        return self._send(query)
+
+    def _schedule_request(self) -> None:
+        '''
+        INTERNAL
+        Wait until the rate limiter allows another request.
+        '''
+        self._sync_rate_limiter()
+        while True:
+            delay = self.rate_limiter.reserve(low_priority=is_low_priority())
+            if not delay:
+                return
+            sleep(delay)
+            self._sync_rate_limiter()
+
+    def _sync_rate_limiter(self) -> None:
+        '''
+        INTERNAL
+        Read the point usage from the API into the rate limiter, if it is due.
+        '''
+        # concurrent requests would otherwise all read the point usage at once
+        with self._rate_limit_lock:
+            if self.rate_limiter.needs_sync():
+                self._update_rate_limiter(self._send(self.Q_RATE_LIMIT_USAGE))
+
+    @ensure_token
+    def _send(self, query: str) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Send a query to the API.
+        '''
+        session = self._connect()
+        # pass the headers per request, the transport is shared between threads
+        return session.execute(gql(query), extra_args={'headers': self._auth_headers()})
+
+    def q(self, query: str, ignore_cache: bool = False) -> dict[str, Any]:
+        '''
+        Executes a raw GraphQL query against the FFLogs API.
+
+        Generally, you should not use this unless you need to execute a query that is not properly
+        supported by the client. You can also use this function to query for more information in
+        batch than the client normally would.
+
+        The result of the query is stored in cache by default, and will be returned in place of a
+        real query result if the same query is repeated. If you need up-to-date query results,
+        use `ignore_cache` to force the client to query the actual API for the information.
+        Note that the result is still cached if the client has caching enabled, so any repeat of
+        the same query that does not use `ignore_cache` will always return the last result of
+        actually executing the query.
+
+        Args:
+            query: The GraphQL query to execute.
+            ignore_cache: Whether or not to ignore cached results, forcing a query to be executed
+                          against the API.
+
+        Returns:
+            The result of the query as a dictionary. The result is read-only if the client
+            does not copy results.
+        '''
+        if not ignore_cache:
+            cached_result = self._cache_lookup(query)
+            if cached_result is not None:
+                return self._deliver(cached_result)
+
+        result = self._execute(query)
+        frozen_result = self._cache_store(query, result)
+
+        # the fresh result is not shared with the cache, so it can be handed out as-is
+        return result if self.copy_results else frozen_result
+
+    def execute_many(
+        self,
+        queries: Iterable[str],
+        max_workers: Optional[int] = None,
+        ignore_cache: bool = False,
+    ) -> list[dict[str, Any]]:
+        '''
+        Execute independent raw GraphQL queries in parallel, see :func:`q`.
+
+        Each query is sent as a separate request from a thread pool. To send the queries as a
+        single request instead, see :func:`batch`.
+
+        .. code-block:: python
+
+            results = client.execute_many([
+                'query { rateLimitData { pointsSpentThisHour } }',
+                'query { worldData { zone(id: 54) { name } } }',
+            ], max_workers=2)
+
+        Args:
+            queries: The GraphQL queries to execute.
+            max_workers: The maximum amount of queries to execute at the same time. Defaults to
+                         the client's ``max_connections``.
+            ignore_cache: Whether or not to ignore cached results, forcing the queries to be
+                          executed against the API.
+        Returns:
+            The results of the queries, in the same order as the queries.
+        '''
+        queries = list(queries)
+        if not queries:
+            return []
+
+        max_workers = max_workers or self.max_connections
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            # run in copies of the caller's context, e.g. to keep the request priority
+            futures = [
+                executor.submit(copy_context().run, self.q, query, ignore_cache)
+                for query in queries
+            ]
+            return [future.result() for future in futures]
+
+    def batch(self, max_size: int = 25, ignore_cache: bool = False) -> FFLogsQueryBatch:
+        '''
+        Collect multiple queries and execute them as a single request to the API.
+
+        Queries added to the batch are merged into one GraphQL document when the batch is
+        executed, either by leaving the ``with`` block or by calling
+        :func:`FFLogsQueryBatch.execute`. The result of each query is stored in the query cache
+        as if it had been executed on its own:
+
+        .. code-block:: python
+
+            with client.batch() as batch:
+                for fight in report.fights():
+                    batch.fetch(fight, 'name', 'kill', 'startTime', 'endTime')
+
+            # no further requests are sent to the API here
+            names = [fight.name() for fight in report.fights()]
+
+        Args:
+            max_size: The maximum amount of queries to merge into a single request.
+            ignore_cache: Whether or not to ignore cached results of the batched queries.
+        Returns:
+            A new query batch.
+        '''
+        return FFLogsQueryBatch(client=self, max_size=max_size, ignore_cache=ignore_cache)
+
     def rate_limit_allowance(self) -> int:
         '''
         Fetches the amount of points the API client is allowed to spend each hour.
@@ -279,7 +645,7 @@ class FFLogsClient(
         '''
         return self.q(self.Q_RATE_LIMIT.format(
             innerQuery='limitPerHour'
-        ))['rateLimitData']['limitPerHour']
+        ), ignore_cache=True)['rateLimitData']['limitPerHour']
 
     def rate_limit_reset_time(self) -> int:
         '''
@@ -291,7 +657,7 @@ class FFLogsClient(
         '''
         return self.q(self.Q_RATE_LIMIT.format(
             innerQuery='pointsResetIn'
-        ))['rateLimitData']['pointsResetIn']
+        ), ignore_cache=True)['rateLimitData']['pointsResetIn']
 
     def rate_limit_spent(self) -> float:
         '''
@@ -302,4 +668,22 @@ class FFLogsClient(
         '''
         return self.q(self.Q_RATE_LIMIT.format(
             innerQuery='pointsSpentThisHour'
-        ))['rateLimitData']['pointsSpentThisHour']
+        ), ignore_cache=True)['rateLimitData']['pointsSpentThisHour']
+
+    def rate_limit_remaining(self) -> float:
+        '''
+        Get the amount of points the API client has left this hour.
+
+        With a rate limiter, this is the limiter's estimate, which is only read from the API when
+        the limiter is due to synchronize. Without one, the point usage is always read from
+        the API.
+
+        Returns:
+            The amount of points left until the allowance resets.
+        '''
+        if self.rate_limiter is not None:
+            self._sync_rate_limiter()
+            return self.rate_limiter.remaining()
+
+        usage = self.q(self.Q_RATE_LIMIT_USAGE, ignore_cache=True)['rateLimitData']
+        return max(usage['limitPerHour'] - usage['pointsSpentThisHour'], 0)
@@ -1,5 +1,8 @@
-from typing import TYPE_CHECKING, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
 
+from ..util.checkpoint import load_checkpoint, pagination_state, save_checkpoint
 from ..util.filters import construct_filter_string
 from ..util.indexing import itindex
 from .queries import Q_PAGE_META
@@ -30,6 +33,8 @@ class FFLogsPage:
         self.page_num = page_num
         self.n_from = -1
         self.n_to = -1
+        self.last_page = -1
+        self.has_more_pages = False
         self.filters = filters.copy()
         self.additional_formatting = additional_formatting
         self.data = None
@@ -47,20 +52,35 @@ class FFLogsPage:
     def _query_page(self) -> None:
         '''
         Retrieves metadata about data contained in this page.
-        Specifically, IDs/codes are gathered and stored.
+        Specifically, IDs/codes are gathered and stored, along with the number of the last page.
+        '''
+        self._load(self._client.q(self._page_query()))
+
+    def _page_query(self) -> str:
+        '''
+        INTERNAL
+        Build the query for the metadata of this page.
         '''
         self.filters['page'] = self.page_num
         filters = construct_filter_string(self.filters)
         data_fields = ','.join(self.DATA_FIELDS)
-        page_data = self._client.q(self.PAGINATION_QUERY.format(
+        return self.PAGINATION_QUERY.format(
             filters=filters,
             innerQuery=Q_PAGE_META.format(dataFields=data_fields),
             **self.additional_formatting,
-        ))
-        page_data = itindex(page_data, self.PAGE_INDICES)
+        )
+
+    def _load(self, result: dict[str, Any]) -> None:
+        '''
+        INTERNAL
+        Store the metadata of this page from the result of its query.
+        '''
+        page_data = itindex(result, self.PAGE_INDICES)
 
         self.n_from = page_data['from']
         self.n_to = page_data['to']
+        self.last_page = page_data['last_page']
+        self.has_more_pages = page_data['has_more_pages']
         self.data = page_data['data']
         self.objects = [None] * len(self.data)
 
@@ -128,6 +148,36 @@ class FFLogsPageIterator:
 class FFLogsPaginationIterator:
     '''
     Iterates over multiple pages (a pagination), returning pages
+
+    The first page is retrieved along with the number of pages in the pagination. By default, the
+    other pages are retrieved when they are first used. With `prefetch`, the next pages are
+    retrieved in the background while the current page is being processed:
+
+    .. code-block:: python
+
+        for page in client.reports(filters={'guildID': 80551}, prefetch=4):
+            for report in page:
+                ...
+
+    With `bulk`, pages are retrieved in groups of `bulk` pages, with one request per group. This
+    greatly reduces the amount of requests needed to walk through long paginations like game
+    items. The page queries of a group are merged with a query batch, see
+    :func:`fflogsapi.FFLogsClient.batch`.
+
+    Use :func:`iter_objects` to iterate over the objects of all pages directly.
+
+    Long crawls can be checkpointed to a small state file with `checkpoint`. The checkpoint is
+    updated whenever the next page is requested, and a new pagination with the same checkpoint
+    file resumes from the first page that was not finished. Finished checkpoints are kept, so
+    iterating over their pagination again does not start it over. With `start_page` and `end_page`,
+    only a range of pages is iterated over, which allows splitting a crawl over multiple
+    processes with :func:`page_ranges`:
+
+    .. code-block:: python
+
+        server = client.get_server(filters={'slug': 'twintania', 'region': 'eu'})
+        for page in server.characters(checkpoint='twintania.json'):
+            ...
     '''
 
     # The page class of the pages in the pagination
@@ -138,39 +188,244 @@ class FFLogsPaginationIterator:
         client: 'FFLogsClient',
         filters: dict[str, Any] = {},
         additional_formatting: dict[str, str] = {},
+        prefetch: int = 0,
+        bulk: int = 1,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        checkpoint: Optional[str] = None,
     ) -> None:
         '''
         If the pagination query requires any additional formatting,
         it can be specified using `additional_formatting`.
+
+        `prefetch` is the amount of pages to retrieve ahead of the current page, which is also the
+        amount of threads used to retrieve them. `bulk` is the amount of pages to retrieve
+        per request.
+
+        `start_page` and `end_page` limit the iteration to a range of pages. `checkpoint` is the
+        path of a file to save the progress of the iteration to. If the file already exists, the
+        iteration resumes from it, and its page range replaces the given one.
+
+        Raises:
+            ValueError if the checkpoint file belongs to a different pagination.
         '''
+        if prefetch < 0:
+            raise ValueError('The amount of pages to prefetch can not be negative')
+        if bulk < 1:
+            raise ValueError(f'The amount of pages per request must be at least 1 (got {bulk})')
+        if start_page < 1:
+            raise ValueError(f'The first page of a pagination is page 1 (got {start_page})')
+
         self._client = client
-        self._cur_page = 0
         self._filters = filters.copy()
         self.additional_formatting = additional_formatting
+        self.prefetch = prefetch
+        self.bulk = bulk
+        self.start_page = start_page
+        self.end_page = end_page
+        self.checkpoint = checkpoint
+
+        if checkpoint is not None:
+            state = load_checkpoint(
+                checkpoint,
+                pagination='.'.join(self.PAGE_CLASS.PAGE_INDICES),
+                filters=self._filters,
+                additional_formatting=self.additional_formatting,
+            )
+            if state is not None:
+                self.start_page = state['page']
+                self.end_page = state['end_page']
 
-        pagination_filters = self._filters.copy()
-        pagination_filters['page'] = 1
-        filters = construct_filter_string(pagination_filters)
-        result = self._client.q(self.PAGE_CLASS.PAGINATION_QUERY.format(
-            filters=filters,
-            innerQuery='last_page',
-            **additional_formatting,
-        ))
-
-        self._last_page = itindex(result, self.PAGE_CLASS.PAGE_INDICES)['last_page']
+        self._cur_page = self.start_page - 1
+        self._executor = None
+        # retrieved or prefetching groups of pages, by the number of their first page
+        self._pending: dict[int, Union[Future, list[FFLogsPage]]] = {}
+        self._first_page = None
 
     def __iter__(self) -> 'FFLogsPaginationIterator':
         return self
 
     def __next__(self) -> FFLogsPage:
+        # requesting the next page means that the previous pages are done
+        if self.checkpoint is not None:
+            save_checkpoint(self.checkpoint, self.state())
+
         self._cur_page += 1
-        if self._cur_page <= self._last_page:
-            return self.PAGE_CLASS(
-                page_num=self._cur_page,
-                filters=self._filters,
-                client=self._client,
-                additional_formatting=self.additional_formatting,
-            )
-        else:
-            self._cur_page = 0
+        # a finished checkpoint starts past the end page, don't retrieve a page to find out
+        if (self.end_page is not None and self._cur_page > self.end_page) or \
+                self._cur_page > self._range_end():
+            if self.checkpoint is None:
+                self._cur_page = self.start_page - 1
+            else:
+                # keep the checkpoint finished instead of starting the iteration over
+                self._cur_page -= 1
+            self.close()
             raise StopIteration
+
+        if self.prefetch:
+            self._prefetch_after(self._cur_page)
+        if self._cur_page == self.start_page:
+            return self.first_page()
+        if not self.prefetch and self.bulk == 1:
+            return self._make_page(self._cur_page)
+        return self._pending_page(self._cur_page)
+
+    def first_page(self) -> FFLogsPage:
+        '''
+        Returns:
+            The first page of the iteration (`start_page`), which is retrieved in the same query
+            as the number of the last page.
+        '''
+        if self._first_page is None:
+            self._first_page = self._make_page(self.start_page)
+            self._first_page._query_page()
+        return self._first_page
+
+    def last_page(self) -> int:
+        '''
+        Returns:
+            The number of the last page in the pagination.
+        '''
+        return self.first_page().last_page
+
+    def state(self) -> dict[str, Any]:
+        '''
+        Get the progress of the iteration, which is what is saved to the checkpoint file.
+
+        Returns:
+            A JSON serializable description of the iteration. Its ``page`` is the first page that
+            has not been returned by the iterator yet.
+        '''
+        return pagination_state(
+            pagination='.'.join(self.PAGE_CLASS.PAGE_INDICES),
+            page=self._cur_page + 1,
+            end_page=self.end_page,
+            filters=self._filters,
+            additional_formatting=self.additional_formatting,
+        )
+
+    def page_ranges(self, parts: int) -> list[tuple[int, int]]:
+        '''
+        Split the pages of the iteration into ranges of (almost) equal size, e.g. to iterate over
+        them in separate processes with `start_page` and `end_page`.
+
+        Args:
+            parts: The amount of ranges to split the pages into.
+        Returns:
+            The first and last page of each range. Empty ranges are left out.
+        '''
+        first, last = self.start_page, self._range_end()
+        count = max(last - first + 1, 0)
+        bounds = [first + count * part // parts for part in range(parts + 1)]
+        return [(start, end - 1) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    def fetch_pages(self, first: int, last: int) -> list[FFLogsPage]:
+        '''
+        Retrieve a range of pages, merging the queries of up to `bulk` pages into each request.
+
+        Args:
+            first: The number of the first page to retrieve.
+            last: The number of the last page to retrieve.
+        Returns:
+            The retrieved pages, in page order.
+        '''
+        pages = [self._make_page(page_num) for page_num in range(first, last + 1)]
+        if len(pages) == 1:
+            pages[0]._query_page()
+            return pages
+
+        with self._client.batch(max_size=self.bulk) as batch:
+            queries = [batch.q(page._page_query()) for page in pages]
+        for page, query in zip(pages, queries):
+            page._load(query.result())
+        return pages
+
+    def iter_objects(self) -> Iterator[Any]:
+        '''
+        Iterate over the objects of all pages in the pagination, retrieving pages as needed.
+
+        Returns:
+            An iterator over the objects of all pages, in page order.
+        '''
+        for page in self:
+            yield from page
+
+    def _make_page(self, page_num: int) -> FFLogsPage:
+        '''
+        INTERNAL
+        Create a page of the pagination.
+        '''
+        return self.PAGE_CLASS(
+            page_num=page_num,
+            filters=self._filters,
+            client=self._client,
+            additional_formatting=self.additional_formatting,
+        )
+
+    def _range_end(self) -> int:
+        '''
+        INTERNAL
+        The last page of the iteration.
+        '''
+        if self.end_page is None:
+            return self.last_page()
+        return min(self.end_page, self.last_page())
+
+    def _group(self, page_num: int) -> tuple[int, int]:
+        '''
+        INTERNAL
+        Find the first and last page of the group of pages retrieved together with a page.
+        '''
+        # the first page is always retrieved on its own, so groups start from the page after it
+        offset = self.start_page + 1
+        first = offset + ((page_num - offset) // self.bulk) * self.bulk
+        return first, min(first + self.bulk - 1, self._range_end())
+
+    def _pending_page(self, page_num: int) -> FFLogsPage:
+        '''
+        INTERNAL
+        Get a page from its group of pages, retrieving the group if it is not already pending.
+        '''
+        first, last = self._group(page_num)
+        pages = self._pending.get(first)
+        if pages is None:
+            pages = self.fetch_pages(first, last)
+        elif isinstance(pages, Future):
+            pages = pages.result()
+
+        if page_num == last:
+            self._pending.pop(first, None)
+        else:
+            self._pending[first] = pages
+        return pages[page_num - first]
+
+    def _prefetch_after(self, page_num: int) -> None:
+        '''
+        INTERNAL
+        Start retrieving the pages following the given page in the background.
+        '''
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.prefetch)
+
+        last_prefetch = min(page_num + self.prefetch, self._range_end())
+        for prefetch_num in range(page_num + 1, last_prefetch + 1):
+            first, last = self._group(prefetch_num)
+            if first not in self._pending:
+                # run in a copy of the caller's context, e.g. to keep the request priority
+                self._pending[first] = self._executor.submit(
+                    copy_context().run, self.fetch_pages, first, last,
+                )
+
+    def close(self) -> None:
+        '''
+        Stop retrieving pages in the background. Only needed if the iteration is stopped early
+        while prefetching pages.
+        '''
+        for pages in self._pending.values():
+            if isinstance(pages, Future):
+                pages.cancel()
+        self._pending = {}
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,6 +1,7 @@
 # Retrieves only metadata from pages
 Q_PAGE_META = '''
 current_page
+last_page
 has_more_pages
 from
 to
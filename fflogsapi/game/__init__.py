@@ -6,6 +6,7 @@ from ..data import FFGrandCompany, FFJob
 from .pages import (FFAbility, FFItem, FFLogsAbilityPage, FFLogsAbilityPaginationIterator,
                     FFLogsItemPage, FFLogsItemPaginationIterator, FFLogsMapPage,
                     FFLogsMapPaginationIterator, FFMap,)
+from .registry import GAME_DATA, FFGameDataRegistry
 
 __all__ = [
     # dataclasses.py
@@ -22,4 +23,8 @@ __all__ = [
     'FFLogsItemPaginationIterator',
     'FFLogsMapPage',
     'FFLogsMapPaginationIterator',
+
+    # registry.py
+    'GAME_DATA',
+    'FFGameDataRegistry',
 ]
@@ -1,7 +1,10 @@
+from typing import Mapping, Optional, Union
+
 from ..data import FFAbility, FFGrandCompany, FFItem, FFJob, FFMap
 from .pages import (FFLogsAbilityPaginationIterator, FFLogsItemPaginationIterator,
                     FFLogsMapPaginationIterator,)
 from .queries import Q_ABILITY, Q_GRAND_COMPANIES, Q_ITEM, Q_JOBS, Q_MAP
+from .registry import GAME_DATA
 
 
 class GameDataMixin:
@@ -21,32 +24,95 @@ class GameDataMixin:
         icon_type = 'maps' if icon[0] == 'm' else 'abilities'
         return f'https://assets.rpglogs.com/img/ff/{icon_type}/{icon}'
 
-    def abilities(self) -> FFLogsAbilityPaginationIterator:
+    def abilities(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsAbilityPaginationIterator:
         '''
         Get a pagination of all game abilities.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over all pages of game abilities.
         '''
-        return FFLogsAbilityPaginationIterator(client=self)
+        return FFLogsAbilityPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
 
-    def items(self) -> FFLogsItemPaginationIterator:
+    def items(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsItemPaginationIterator:
         '''
         Get a pagination of all game items.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over all pages of game items.
         '''
-        return FFLogsItemPaginationIterator(client=self)
+        return FFLogsItemPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
 
-    def maps(self) -> FFLogsMapPaginationIterator:
+    def maps(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsMapPaginationIterator:
         '''
         Get a pagination of all game maps.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over all pages of game maps.
         '''
-        return FFLogsMapPaginationIterator(client=self)
+        return FFLogsMapPaginationIterator(
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
 
     def ability(self, id: int) -> FFAbility:
         '''
@@ -68,13 +134,15 @@ class GameDataMixin:
                 type=0,
             )
 
-        ability = self.q(Q_ABILITY.format(abilityID=id))['gameData']['ability']
-        return FFAbility(
-            id=id,
-            name=ability['name'],
-            description=ability['description'],
-            icon=ability['icon'],
-        )
+        if GAME_DATA.ability(id) is None:
+            ability = self.q(Q_ABILITY.format(abilityID=id))['gameData']['ability']
+            GAME_DATA.add_abilities([FFAbility(
+                id=id,
+                name=ability['name'],
+                description=ability['description'],
+                icon=ability['icon'],
+            )])
+        return GAME_DATA.ability(id)
 
     def item(self, id: int) -> FFItem:
         '''
@@ -85,8 +153,10 @@ class GameDataMixin:
         Returns:
             The game item.
         '''
-        item = self.q(Q_ITEM.format(itemID=id))['gameData']['item']
-        return FFItem(id=id, name=item['name'], icon=item['icon'])
+        if GAME_DATA.item(id) is None:
+            item = self.q(Q_ITEM.format(itemID=id))['gameData']['item']
+            GAME_DATA.add_items([FFItem(id=id, name=item['name'], icon=item['icon'])])
+        return GAME_DATA.item(id)
 
     def map(self, id: int) -> FFMap:
         '''
@@ -97,29 +167,57 @@ class GameDataMixin:
         Returns:
             The game map.
         '''
-        map = self.q(Q_MAP.format(mapID=id))['gameData']['map']
-        return FFMap(
-            id=id,
-            name=map['name'],
-            filename=map['filename'],
-            offset_x=map['offsetX'],
-            offset_y=map['offsetY'],
-            size_factor=map['sizeFactor'],
-        )
+        if GAME_DATA.map(id) is None:
+            map = self.q(Q_MAP.format(mapID=id))['gameData']['map']
+            GAME_DATA.add_maps([FFMap(
+                id=id,
+                name=map['name'],
+                filename=map['filename'],
+                offset_x=map['offsetX'],
+                offset_y=map['offsetY'],
+                size_factor=map['sizeFactor'],
+            )])
+        return GAME_DATA.map(id)
 
     def jobs(self) -> list[FFJob]:
         '''
         Get a list of all game jobs supported by FF Logs.
 
+        The jobs are only retrieved once, see :class:`fflogsapi.game.FFGameDataRegistry`.
+
         Returns:
             A list of all jobs.
         '''
-        jobs = self.q(Q_JOBS)['gameData']['class']['specs']
-        return [FFJob(
-            id=job['id'],
-            name=job['name'],
-            slug=job['slug'],
-        ) for job in jobs]
+        if GAME_DATA.jobs() is None:
+            jobs = self.q(Q_JOBS)['gameData']['class']['specs']
+            GAME_DATA.set_jobs(FFJob(
+                id=job['id'],
+                name=job['name'],
+                slug=job['slug'],
+            ) for job in jobs)
+        return GAME_DATA.jobs()
+
+    def jobs_by_slug(self) -> Mapping[str, FFJob]:
+        '''
+        Get all game jobs supported by FF Logs by their slug, e.g. ``'WhiteMage'``.
+
+        Returns:
+            A read-only mapping from job slugs to jobs.
+        '''
+        self.jobs()
+        return GAME_DATA.jobs_by_slug()
+
+    def job(self, key: Union[str, int]) -> Optional[FFJob]:
+        '''
+        Get a game job by its slug or ID.
+
+        Args:
+            key: The slug (e.g. ``'WhiteMage'``) or the ID of the job.
+        Returns:
+            The job, or None if there is no such job.
+        '''
+        self.jobs()
+        return GAME_DATA.job(key)
 
     def grand_companies(self) -> list[FFGrandCompany]:
         '''
@@ -129,5 +227,54 @@ class GameDataMixin:
         Returns:
             A list of all grand companies.
         '''
-        gcs = self.q(Q_GRAND_COMPANIES)['gameData']['factions']
-        return [FFGrandCompany(id=gc['id'], name=gc['name']) for gc in gcs]
+        if GAME_DATA.grand_companies() is None:
+            gcs = self.q(Q_GRAND_COMPANIES)['gameData']['factions']
+            GAME_DATA.set_grand_companies(
+                FFGrandCompany(id=gc['id'], name=gc['name']) for gc in gcs
+            )
+        return GAME_DATA.grand_companies()
+
+    def grand_company(self, id: int) -> Optional[FFGrandCompany]:
+        '''
+        Get a grand company by its ID.
+
+        Args:
+            id: The ID of the grand company.
+        Returns:
+            The grand company, or None if there is no such grand company.
+        '''
+        self.grand_companies()
+        return GAME_DATA.grand_company(id)
+
+    def preload_game_data(
+        self,
+        abilities: bool = True,
+        items: bool = True,
+        maps: bool = True,
+        prefetch: int = 4,
+        bulk: int = 5,
+    ) -> None:
+        '''
+        Retrieve all pages of game abilities, items and/or maps, so that :func:`ability`,
+        :func:`item` and :func:`map` no longer have to query the API.
+
+        This takes a lot of queries (there are tens of thousands of items), so only preload the
+        game data you will look up a lot of.
+
+        Args:
+            abilities: Whether to preload all game abilities.
+            items: Whether to preload all game items.
+            maps: Whether to preload all game maps.
+            prefetch: The amount of pages to retrieve ahead of the current page.
+            bulk: The amount of pages to retrieve per request.
+        '''
+        paginations = (
+            (abilities, self.abilities, GAME_DATA.add_abilities),
+            (items, self.items, GAME_DATA.add_items),
+            (maps, self.maps, GAME_DATA.add_maps),
+        )
+        for preload, pagination, add in paginations:
+            if not preload:
+                continue
+            for page in pagination(prefetch=prefetch, bulk=bulk):
+                add(page)
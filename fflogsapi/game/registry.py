@@ -0,0 +1,179 @@
+from threading import Lock
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Union
+
+from ..data import FFAbility, FFGrandCompany, FFItem, FFJob, FFMap
+
+
+class FFGameDataRegistry:
+    '''
+    Registry of static game data, such as jobs, grand companies, abilities, items and maps.
+
+    Game data does not change while a program is running, so it only has to be retrieved once.
+    The clients store the game data they retrieve in the process-wide registry :data:`GAME_DATA`
+    and look it up there before querying the API again. All lookups are dictionary lookups.
+    '''
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        '''
+        INTERNAL
+        Remove all stored game data.
+        '''
+        self._jobs: Optional[list[FFJob]] = None
+        self._jobs_by_slug: dict[str, FFJob] = {}
+        self._jobs_by_id: dict[int, FFJob] = {}
+        self._grand_companies: Optional[list[FFGrandCompany]] = None
+        self._grand_companies_by_id: dict[int, FFGrandCompany] = {}
+        self._abilities: dict[int, FFAbility] = {}
+        self._items: dict[int, FFItem] = {}
+        self._maps: dict[int, FFMap] = {}
+
+    def set_jobs(self, jobs: Iterable[FFJob]) -> None:
+        '''
+        Store all jobs supported by FF Logs.
+
+        Args:
+            jobs: The jobs.
+        '''
+        jobs = list(jobs)
+        with self._lock:
+            self._jobs_by_slug = {job.slug: job for job in jobs}
+            self._jobs_by_id = {job.id: job for job in jobs}
+            self._jobs = jobs
+
+    def jobs(self) -> Optional[list[FFJob]]:
+        '''
+        Returns:
+            All jobs, or None if they have not been stored yet.
+        '''
+        return list(self._jobs) if self._jobs is not None else None
+
+    def jobs_by_slug(self) -> Mapping[str, FFJob]:
+        '''
+        Returns:
+            A read-only mapping from job slugs (e.g. ``'WhiteMage'``) to jobs.
+        '''
+        return MappingProxyType(self._jobs_by_slug)
+
+    def job(self, key: Union[str, int]) -> Optional[FFJob]:
+        '''
+        Look up a job by its slug or ID.
+
+        Args:
+            key: The slug (e.g. ``'WhiteMage'``) or the ID of the job.
+        Returns:
+            The job, or None if there is no such job.
+        '''
+        if isinstance(key, str):
+            return self._jobs_by_slug.get(key)
+        return self._jobs_by_id.get(key)
+
+    def set_grand_companies(self, grand_companies: Iterable[FFGrandCompany]) -> None:
+        '''
+        Store all grand companies.
+
+        Args:
+            grand_companies: The grand companies.
+        '''
+        grand_companies = list(grand_companies)
+        with self._lock:
+            self._grand_companies_by_id = {gc.id: gc for gc in grand_companies}
+            self._grand_companies = grand_companies
+
+    def grand_companies(self) -> Optional[list[FFGrandCompany]]:
+        '''
+        Returns:
+            All grand companies, or None if they have not been stored yet.
+        '''
+        if self._grand_companies is None:
+            return None
+        return list(self._grand_companies)
+
+    def grand_company(self, id: int) -> Optional[FFGrandCompany]:
+        '''
+        Look up a grand company by its ID.
+
+        Args:
+            id: The ID of the grand company.
+        Returns:
+            The grand company, or None if it has not been stored.
+        '''
+        return self._grand_companies_by_id.get(id)
+
+    def add_abilities(self, abilities: Iterable[FFAbility]) -> None:
+        '''
+        Store game abilities.
+
+        Args:
+            abilities: The abilities.
+        '''
+        with self._lock:
+            self._abilities.update((ability.id, ability) for ability in abilities)
+
+    def ability(self, id: int) -> Optional[FFAbility]:
+        '''
+        Look up a game ability by its ID.
+
+        Args:
+            id: The ID of the ability.
+        Returns:
+            The ability, or None if it has not been stored.
+        '''
+        return self._abilities.get(id)
+
+    def add_items(self, items: Iterable[FFItem]) -> None:
+        '''
+        Store game items.
+
+        Args:
+            items: The items.
+        '''
+        with self._lock:
+            self._items.update((item.id, item) for item in items)
+
+    def item(self, id: int) -> Optional[FFItem]:
+        '''
+        Look up a game item by its ID.
+
+        Args:
+            id: The ID of the item.
+        Returns:
+            The item, or None if it has not been stored.
+        '''
+        return self._items.get(id)
+
+    def add_maps(self, maps: Iterable[FFMap]) -> None:
+        '''
+        Store game maps.
+
+        Args:
+            maps: The maps.
+        '''
+        with self._lock:
+            self._maps.update((map.id, map) for map in maps)
+
+    def map(self, id: int) -> Optional[FFMap]:
+        '''
+        Look up a game map by its ID.
+
+        Args:
+            id: The ID of the map.
+        Returns:
+            The map, or None if it has not been stored.
+        '''
+        return self._maps.get(id)
+
+    def clear(self) -> None:
+        '''
+        Remove all stored game data, so that it is retrieved from the API again.
+        '''
+        with self._lock:
+            self._reset()
+
+
+GAME_DATA = FFGameDataRegistry()
+''' The process-wide game data registry used by all clients '''
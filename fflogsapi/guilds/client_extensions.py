@@ -1,4 +1,4 @@
-
+from typing import Optional
 
 from .guild import FFLogsGuild
 from .pages import FFLogsGuildPaginationIterator
@@ -9,7 +9,15 @@ class GuildsMixin:
     Client extensions to support guild data exposed by the FF Logs API.
     '''
 
-    def guilds(self, filters: dict = {}) -> FFLogsGuildPaginationIterator:
+    def guilds(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsGuildPaginationIterator:
         '''
         Iterate over pages of guilds on FF Logs.
 
@@ -18,10 +26,24 @@ class GuildsMixin:
 
         Args:
             filters: Filters to find guilds by.
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over the pages of guilds that match the given filters.
         '''
-        return FFLogsGuildPaginationIterator(filters=filters, client=self)
+        return FFLogsGuildPaginationIterator(
+            filters=filters,
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
 
     def get_guild(self, filters: dict = {}, id: int = -1) -> FFLogsGuild:
         '''
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from ..constants import FightDifficulty, PartySize
 from ..data import FFGrandCompany, FFLogsGuildZoneRankings, FFLogsRank, FFLogsReportTag
@@ -38,15 +38,21 @@ class FFLogsGuild:
 
         self.id = self.filters['id']
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a guild
+        Build the query for a specific piece of information about a guild
         '''
         filters = construct_filter_string(self.filters)
-        result = self._client.q(Q_GUILD.format(
+        return Q_GUILD.format(
             filters=filters,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a guild
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -144,7 +150,15 @@ class FFLogsGuild:
         grand_company = self._query_data(query='faction{ id, name }')['faction']
         return FFGrandCompany(id=grand_company['id'], name=grand_company['name'])
 
-    def attendance(self, filters: dict = {}) -> FFLogsGuildAttendancePaginationIterator:
+    def attendance(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsGuildAttendancePaginationIterator:
         '''
         Get a pagination of attandance reports.
 
@@ -153,6 +167,12 @@ class FFLogsGuild:
 
         Args:
             filters: Zone and tag ID filters to filter attendance reports by.
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over all attendance report pages.
         '''
@@ -160,18 +180,42 @@ class FFLogsGuild:
             additional_formatting={'guildID': self.id},
             filters=filters,
             client=self._client,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
         )
 
-    def characters(self) -> FFLogsCharacterPaginationIterator:
+    def characters(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsCharacterPaginationIterator:
         '''
         Get a pagination of all characters belonging to the guild.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over all guild character pages.
         '''
         return FFLogsCharacterPaginationIterator(
             client=self._client,
-            additional_formatting={'guildID': self.id}
+            additional_formatting={'guildID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
         )
 
     def zone_rankings(
@@ -200,11 +244,14 @@ class FFLogsGuild:
             difficulty=difficulty,
         ))['zoneRanking']
 
+        # the query result may be read-only, so the rankings are collected separately
+        rankings = {}
         for key in data.keys():
             if not data[key]:
+                rankings[key] = data[key]
                 continue
 
-            data[key] = tuple([
+            rankings[key] = tuple([
                 FFLogsRank(
                     number=data[key]['worldRank']['number'],
                     color=data[key]['worldRank']['color'],
@@ -223,7 +270,7 @@ class FFLogsGuild:
             ])
 
         return FFLogsGuildZoneRankings(
-            completion_speed=data['completeRaidSpeed'],
-            progress=data['progress'],
-            speed=data['speed'],
+            completion_speed=rankings['completeRaidSpeed'],
+            progress=rankings['progress'],
+            speed=rankings['speed'],
         )
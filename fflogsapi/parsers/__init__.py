@@ -1,3 +1,32 @@
 '''
 Parsers for poorly defined JSON endpoints of the API, like graphs or event tables
 '''
+
+from .events import (EVENT_CLASSES, FFLogsAbsorbedEvent, FFLogsBeginCastEvent, FFLogsBuffEvent,
+                     FFLogsBuffStackEvent, FFLogsCalculatedDamageEvent, FFLogsCalculatedHealEvent,
+                     FFLogsCastEvent, FFLogsCombatantInfoEvent, FFLogsDamageEvent,
+                     FFLogsEncounterEndEvent, FFLogsEvent, FFLogsHeadMarkerEvent, FFLogsHealEvent,
+                     FFLogsLimitBreakUpdateEvent, FFLogsTargetabilityUpdateEvent, parse_event,
+                     parse_events,)
+
+__all__ = [
+    # events.py
+    'FFLogsEvent',
+    'FFLogsCastEvent',
+    'FFLogsBeginCastEvent',
+    'FFLogsDamageEvent',
+    'FFLogsCalculatedDamageEvent',
+    'FFLogsHealEvent',
+    'FFLogsCalculatedHealEvent',
+    'FFLogsAbsorbedEvent',
+    'FFLogsBuffEvent',
+    'FFLogsBuffStackEvent',
+    'FFLogsLimitBreakUpdateEvent',
+    'FFLogsHeadMarkerEvent',
+    'FFLogsTargetabilityUpdateEvent',
+    'FFLogsCombatantInfoEvent',
+    'FFLogsEncounterEndEvent',
+    'EVENT_CLASSES',
+    'parse_event',
+    'parse_events',
+]
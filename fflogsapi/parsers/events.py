@@ -0,0 +1,418 @@
+'''
+Compact, typed representations of fight events.
+
+The API returns events as JSON dictionaries, which are large and slow to work with when a fight
+has hundreds of thousands of events. The classes in this module store the well known fields of
+each event type in ``__slots__`` instead. Fields that are not known for an event type are kept in
+the ``extra`` dictionary of the event, so no information is lost.
+'''
+
+from sys import intern
+from typing import Any, Iterable, Optional
+
+from ..constants import EventType
+
+
+class FFLogsEvent:
+    '''
+    An event that occurred in a fight.
+
+    This is also used for events of unknown types.
+    '''
+
+    FIELDS = {
+        'timestamp': 'timestamp',
+        'type': 'type',
+        'fight': 'fight',
+        'sourceID': 'source_id',
+        'sourceInstance': 'source_instance',
+        'targetID': 'target_id',
+        'targetInstance': 'target_instance',
+        'abilityGameID': 'ability_id',
+    }
+    ''' Maps the keys of event dictionaries to the attributes they are stored in '''
+
+    __slots__ = tuple(FIELDS.values()) + ('extra',)
+
+    timestamp: int
+    ''' The time at which the event occurred, in milliseconds since the start of the report '''
+    type: str
+    ''' The type of the event, e.g. ``'damage'`` '''
+    fight: Optional[int]
+    ''' The ID of the fight the event belongs to '''
+    source_id: Optional[int]
+    ''' The ID of the actor that caused the event '''
+    source_instance: Optional[int]
+    ''' The instance of the source actor, for actors with multiple instances '''
+    target_id: Optional[int]
+    ''' The ID of the actor that was targeted by the event '''
+    target_instance: Optional[int]
+    ''' The instance of the target actor, for actors with multiple instances '''
+    ability_id: Optional[int]
+    ''' The game ID of the ability involved in the event '''
+    extra: Optional[dict[str, Any]]
+    ''' Fields of the event that are not known for its type, or None if there are none '''
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclasses only list the fields they add
+        cls.FIELDS = {**super(cls, cls).FIELDS, **cls.FIELDS}
+        cls._init_parser()
+
+    @classmethod
+    def _init_parser(cls) -> None:
+        '''
+        INTERNAL
+        Precompute the lookup tables and build the parser function for the event class.
+        '''
+        cls._KEYS = tuple(intern(key) for key in cls.FIELDS)
+        cls._ATTRIBUTES = tuple(intern(attr) for attr in cls.FIELDS.values())
+        cls._KNOWN_KEYS = frozenset(cls._KEYS)
+
+        new = object.__new__
+        fields = tuple(zip(cls._KEYS, cls._ATTRIBUTES))
+        known = cls._KNOWN_KEYS
+
+        def parse(data: dict[str, Any]) -> 'FFLogsEvent':
+            event = new(cls)
+            get = data.get
+            for key, attr in fields:
+                setattr(event, attr, get(key))
+            event.type = intern(event.type)
+            if known.issuperset(data):
+                event.extra = None
+            else:
+                event.extra = {k: v for k, v in data.items() if k not in known}
+            return event
+
+        cls._parse = staticmethod(parse)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'FFLogsEvent':
+        '''
+        Create an event from an event dictionary as returned by the API.
+
+        Args:
+            data: The event dictionary.
+        Returns:
+            The parsed event.
+        '''
+        return cls._parse(data)
+
+    def to_dict(self) -> dict[str, Any]:
+        '''
+        Convert the event back into a dictionary like the ones returned by the API.
+
+        Returns:
+            The event as a dictionary. Fields that are not set are left out.
+        '''
+        data = {}
+        for key, attr in zip(self._KEYS, self._ATTRIBUTES):
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self._ATTRIBUTES + ('extra',)
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f'{attr}={getattr(self, attr)!r}' for attr in self._ATTRIBUTES
+            if getattr(self, attr) is not None
+        )
+        return f'{type(self).__name__}({fields})'
+
+
+FFLogsEvent._init_parser()
+
+
+class FFLogsCastEvent(FFLogsEvent):
+    '''
+    An ability was used.
+    '''
+
+    FIELDS = {}
+    __slots__ = ()
+
+
+class FFLogsBeginCastEvent(FFLogsEvent):
+    '''
+    An actor started casting an ability.
+    '''
+
+    FIELDS = {
+        'duration': 'duration',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    duration: Optional[int]
+    ''' The cast time of the ability in milliseconds '''
+
+
+class FFLogsDamageEvent(FFLogsEvent):
+    '''
+    Damage was dealt.
+    '''
+
+    FIELDS = {
+        'packetID': 'packet_id',
+        'amount': 'amount',
+        'unmitigatedAmount': 'unmitigated_amount',
+        'absorbed': 'absorbed',
+        'mitigated': 'mitigated',
+        'multiplier': 'multiplier',
+        'hitType': 'hit_type',
+        'directHit': 'direct_hit',
+        'bonusPercent': 'bonus_percent',
+        'tick': 'tick',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    packet_id: Optional[int]
+    ''' Links the damage to its calculated damage event '''
+    amount: Optional[int]
+    ''' The amount of damage dealt '''
+    unmitigated_amount: Optional[int]
+    ''' The amount of damage before mitigation '''
+    absorbed: Optional[int]
+    ''' The amount of damage absorbed by shields '''
+    mitigated: Optional[int]
+    ''' The amount of damage that was mitigated '''
+    multiplier: Optional[float]
+    ''' The damage multiplier of the hit '''
+    hit_type: Optional[int]
+    ''' The type of hit, e.g. a critical hit '''
+    direct_hit: Optional[bool]
+    ''' Whether or not the hit was a direct hit '''
+    bonus_percent: Optional[int]
+    ''' Bonus damage percentage, e.g. from combos or positionals '''
+    tick: Optional[bool]
+    ''' Whether or not the damage is a damage over time tick '''
+
+
+class FFLogsCalculatedDamageEvent(FFLogsDamageEvent):
+    '''
+    The damage of a hit was calculated. Damage is dealt in a later damage event.
+    '''
+
+    FIELDS = {}
+    __slots__ = ()
+
+
+class FFLogsHealEvent(FFLogsEvent):
+    '''
+    Healing was done.
+    '''
+
+    FIELDS = {
+        'packetID': 'packet_id',
+        'amount': 'amount',
+        'overheal': 'overheal',
+        'hitType': 'hit_type',
+        'tick': 'tick',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    packet_id: Optional[int]
+    ''' Links the healing to its calculated heal event '''
+    amount: Optional[int]
+    ''' The amount of effective healing '''
+    overheal: Optional[int]
+    ''' The amount of healing that exceeded the target's missing HP '''
+    hit_type: Optional[int]
+    ''' The type of hit, e.g. a critical heal '''
+    tick: Optional[bool]
+    ''' Whether or not the healing is a healing over time tick '''
+
+
+class FFLogsCalculatedHealEvent(FFLogsHealEvent):
+    '''
+    The healing of a heal was calculated. Healing is done in a later heal event.
+    '''
+
+    FIELDS = {}
+    __slots__ = ()
+
+
+class FFLogsAbsorbedEvent(FFLogsEvent):
+    '''
+    Damage was absorbed by a shield. The ability of the event is the shield.
+    '''
+
+    FIELDS = {
+        'attackerID': 'attacker_id',
+        'extraAbilityGameID': 'extra_ability_id',
+        'amount': 'amount',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    attacker_id: Optional[int]
+    ''' The ID of the actor whose damage was absorbed '''
+    extra_ability_id: Optional[int]
+    ''' The game ID of the ability whose damage was absorbed '''
+    amount: Optional[int]
+    ''' The amount of damage absorbed '''
+
+
+class FFLogsBuffEvent(FFLogsEvent):
+    '''
+    A buff or debuff was applied, refreshed or removed. The ability of the event is the aura.
+    '''
+
+    FIELDS = {
+        'duration': 'duration',
+        'absorb': 'absorb',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    duration: Optional[int]
+    ''' The duration of the aura in milliseconds, if known '''
+    absorb: Optional[int]
+    ''' The size of the shield granted by the aura, if any '''
+
+
+class FFLogsBuffStackEvent(FFLogsEvent):
+    '''
+    Stacks of a buff or debuff were applied or removed.
+    '''
+
+    FIELDS = {
+        'stack': 'stack',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    stack: Optional[int]
+    ''' The amount of stacks after the event '''
+
+
+class FFLogsLimitBreakUpdateEvent(FFLogsEvent):
+    '''
+    The party's limit break gauge changed.
+    '''
+
+    FIELDS = {
+        'value': 'value',
+        'bars': 'bars',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    value: Optional[int]
+    ''' The value of the limit break gauge '''
+    bars: Optional[int]
+    ''' The amount of limit break bars '''
+
+
+class FFLogsHeadMarkerEvent(FFLogsEvent):
+    '''
+    A head marker was placed on an actor.
+    '''
+
+    FIELDS = {
+        'markerID': 'marker_id',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    marker_id: Optional[int]
+    ''' The ID of the head marker '''
+
+
+class FFLogsTargetabilityUpdateEvent(FFLogsEvent):
+    '''
+    An actor became targetable or untargetable.
+    '''
+
+    FIELDS = {
+        'targetable': 'targetable',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    targetable: Optional[int]
+    ''' 1 if the actor became targetable, 0 if it became untargetable '''
+
+
+class FFLogsCombatantInfoEvent(FFLogsEvent):
+    '''
+    Information about a combatant at the start of a fight.
+    '''
+
+    FIELDS = {
+        'gear': 'gear',
+        'auras': 'auras',
+    }
+    __slots__ = tuple(FIELDS.values())
+
+    gear: Optional[list[dict[str, Any]]]
+    ''' The gear of the combatant '''
+    auras: Optional[list[dict[str, Any]]]
+    ''' The auras on the combatant '''
+
+
+class FFLogsEncounterEndEvent(FFLogsEvent):
+    '''
+    The encounter ended.
+    '''
+
+    FIELDS = {}
+    __slots__ = ()
+
+
+EVENT_CLASSES: dict[str, type[FFLogsEvent]] = {
+    EventType.COMBATANT_INFO.value: FFLogsCombatantInfoEvent,
+    EventType.BEGINCAST.value: FFLogsBeginCastEvent,
+    EventType.CAST.value: FFLogsCastEvent,
+    EventType.DAMAGE.value: FFLogsDamageEvent,
+    EventType.CALCULATED_DAMAGE.value: FFLogsCalculatedDamageEvent,
+    EventType.HEAL.value: FFLogsHealEvent,
+    EventType.CALCULATED_HEAL.value: FFLogsCalculatedHealEvent,
+    EventType.ABSORBED.value: FFLogsAbsorbedEvent,
+    EventType.APPLY_BUFF.value: FFLogsBuffEvent,
+    EventType.APPLY_BUFF_STACK.value: FFLogsBuffStackEvent,
+    EventType.REFRESH_BUFF.value: FFLogsBuffEvent,
+    EventType.REMOVE_BUFF.value: FFLogsBuffEvent,
+    EventType.REMOVE_BUFF_STACK.value: FFLogsBuffStackEvent,
+    EventType.APPLY_DEBUFF.value: FFLogsBuffEvent,
+    EventType.REFRESH_DEBUFF.value: FFLogsBuffEvent,
+    EventType.REMOVE_DEBUFF.value: FFLogsBuffEvent,
+    EventType.LB_UPDATE.value: FFLogsLimitBreakUpdateEvent,
+    EventType.ENCOUNTER_END.value: FFLogsEncounterEndEvent,
+    EventType.TARGETABILITY_UPDATE.value: FFLogsTargetabilityUpdateEvent,
+    EventType.HEAD_MARKER.value: FFLogsHeadMarkerEvent,
+}
+''' The event class used for each event type '''
+
+_PARSERS = {event_type: cls._parse for event_type, cls in EVENT_CLASSES.items()}
+
+
+def parse_event(data: dict[str, Any]) -> FFLogsEvent:
+    '''
+    Parse an event dictionary into the event class of its type.
+
+    Args:
+        data: The event dictionary, as returned by :func:`fflogsapi.reports.FFLogsFight.events`.
+    Returns:
+        The parsed event. Events of unknown types are parsed as :class:`FFLogsEvent`.
+    '''
+    return _PARSERS.get(data['type'], FFLogsEvent._parse)(data)
+
+
+def parse_events(events: Iterable[dict[str, Any]]) -> list[FFLogsEvent]:
+    '''
+    Parse many event dictionaries into the event classes of their types.
+
+    Args:
+        events: The event dictionaries, e.g. as returned by
+                :func:`fflogsapi.reports.FFLogsFight.events`.
+    Returns:
+        A list of the parsed events, in the same order.
+    '''
+    parsers = _PARSERS
+    parse = FFLogsEvent._parse
+    return [parsers.get(data['type'], parse)(data) for data in events]
@@ -0,0 +1,235 @@
+'''
+Rate limit aware request scheduling, which keeps clients within their hourly point budget.
+'''
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic
+from typing import Iterator, Optional
+
+_low_priority = ContextVar('fflogsapi_low_priority', default=False)
+
+
+@contextmanager
+def low_priority() -> Iterator[None]:
+    '''
+    Mark all requests made within the ``with`` block as low priority.
+
+    Low priority requests are held back until the point budget resets when the remaining budget
+    falls below the low priority reserve of the rate limiter. See
+    :func:`fflogsapi.FFLogsClient.low_priority`.
+    '''
+    token = _low_priority.set(True)
+    try:
+        yield
+    finally:
+        _low_priority.reset(token)
+
+
+def is_low_priority() -> bool:
+    '''
+    Returns:
+        Whether requests made in the current context are low priority.
+    '''
+    return _low_priority.get()
+
+
+class FFLogsRateLimiter:
+    '''
+    Schedules requests such that a client never spends more points than its hourly allowance.
+
+    Requests take points out of a token bucket that refills at the rate of the hourly allowance,
+    i.e. ``limitPerHour / 3600`` points per second. The bucket holds at most a `burst` fraction
+    of the hourly allowance, so bursts of requests can spend that many points at once, after which
+    requests are spaced out to the refill rate. When the bucket runs dry, requests wait for as long
+    as it takes to refill the points they are missing instead of failing against the API.
+
+    The hourly allowance is also enforced as a whole: when the points the API reports as spent this
+    hour leave no room for another request, e.g. because other clients share the same credentials,
+    requests wait until the points reset.
+
+    The actual point usage is read from the API's ``rateLimitData`` every `sync_interval` requests,
+    which corrects the budget and the estimated cost of a request. Points that were spent beyond
+    the estimate are taken out of the bucket as well, so underestimated costs are paid back by
+    waiting longer rather than by overspending.
+
+    Low priority requests (see :func:`low_priority`) leave a part of the bucket and the hourly
+    allowance untouched, so that long background crawls can not starve other work of points. They
+    are queued until the points reset when only the reserve of the hourly allowance is left.
+
+    Pass a rate limiter to a client to enable scheduling:
+
+    .. code-block:: python
+
+        client = FFLogsClient(CLIENT_ID, CLIENT_SECRET, rate_limiter=FFLogsRateLimiter())
+        with client.low_priority():
+            for page in client.items():
+                ...
+
+    Args:
+        low_priority_reserve: The fraction of the bucket and the hourly allowance that low
+                              priority requests leave untouched.
+        sync_interval: The amount of requests after which the point usage is read from the API.
+        initial_cost: The estimated point cost of a request before any usage has been observed.
+        burst: The size of the bucket, as a fraction of the hourly allowance. 1 lets the entire
+               allowance be spent at once.
+    Raises:
+        ValueError if the low priority reserve is not a fraction, the sync interval is not
+        positive or the burst is not a fraction above 0.
+    '''
+
+    # seconds to wait beyond the reset time, to not race the API's own reset
+    RESET_MARGIN = 1.0
+
+    def __init__(
+        self,
+        low_priority_reserve: float = 0.2,
+        sync_interval: int = 25,
+        initial_cost: float = 1.0,
+        burst: float = 0.1,
+    ) -> None:
+        if not 0 <= low_priority_reserve < 1:
+            raise ValueError(
+                f'The low priority reserve must be a fraction (got {low_priority_reserve})'
+            )
+        if sync_interval < 1:
+            raise ValueError(f'The sync interval must be at least 1 (got {sync_interval})')
+        if not 0 < burst <= 1:
+            raise ValueError(f'The burst must be a fraction above 0 (got {burst})')
+
+        self.low_priority_reserve = low_priority_reserve
+        self.sync_interval = sync_interval
+        self.burst = burst
+        self.cost = initial_cost
+        ''' The estimated point cost of a request '''
+        self.limit_per_hour: Optional[float] = None
+        ''' The hourly point allowance, or None if it has not been read from the API yet '''
+        self.spent = 0.0
+        ''' The estimated amount of points spent this hour '''
+
+        self._lock = Lock()
+        self._reset_at = 0.0
+        self._synced_spent = 0.0
+        self._requests_since_sync = 0
+        self._tokens = 0.0
+        self._refilled_at = 0.0
+
+    def needs_sync(self) -> bool:
+        '''
+        Returns:
+            Whether the point usage should be read from the API before the next request.
+        '''
+        return self.limit_per_hour is None or \
+            self._requests_since_sync >= self.sync_interval or \
+            monotonic() >= self._reset_at
+
+    def update(self, limit_per_hour: float, spent: float, reset_in: float) -> None:
+        '''
+        Correct the budget with the point usage reported by the API.
+
+        Args:
+            limit_per_hour: The hourly point allowance (``limitPerHour``).
+            spent: The amount of points spent this hour (``pointsSpentThisHour``).
+            reset_in: The amount of seconds until the points reset (``pointsResetIn``).
+        '''
+        with self._lock:
+            now = monotonic()
+            if self.limit_per_hour is None:
+                self._tokens = limit_per_hour * self.burst
+            else:
+                self._refill(now)
+                # learn from the points spent since the last sync, unless the points have been
+                # reset in the meantime
+                if spent >= self._synced_spent:
+                    # points spent beyond the estimate (or by other clients) are owed to the bucket
+                    self._tokens -= spent - self.spent
+                    if self._requests_since_sync:
+                        observed = (spent - self._synced_spent) / self._requests_since_sync
+                        self.cost = (self.cost + observed) / 2
+            self._tokens = min(self._tokens, limit_per_hour * self.burst)
+            self._refilled_at = now
+
+            self.limit_per_hour = limit_per_hour
+            self.spent = spent
+            self._synced_spent = spent
+            self._requests_since_sync = 0
+            self._reset_at = now + reset_in
+
+    def remaining(self) -> Optional[float]:
+        '''
+        Returns:
+            The estimated amount of points left this hour, or None if the allowance has not been
+            read from the API yet.
+        '''
+        if self.limit_per_hour is None:
+            return None
+        return max(self.limit_per_hour - self.spent, 0.0)
+
+    def reset_in(self) -> float:
+        '''
+        Returns:
+            The amount of seconds until the points reset.
+        '''
+        return max(self._reset_at - monotonic(), 0.0)
+
+    def reserve(self, low_priority: bool = False) -> float:
+        '''
+        Take the estimated cost of a request out of the bucket, if there are enough points in it.
+
+        Args:
+            low_priority: Whether the request is low priority.
+        Returns:
+            0 if the request may be sent now, or else the amount of seconds to wait before
+            the budget should be read from the API and the request retried.
+        '''
+        with self._lock:
+            now = monotonic()
+            if self.limit_per_hour is None or now >= self._reset_at:
+                # nothing is known about the current hour, let the request through to find out
+                self._take()
+                return 0.0
+
+            reserve = self.low_priority_reserve if low_priority else 0.0
+            # always allow a request on a fresh budget, even if it is estimated to be too costly
+            if self.spent > 0 and \
+                    self.limit_per_hour - self.spent - self.cost < self.limit_per_hour * reserve:
+                return self._reset_at - now + self.RESET_MARGIN
+
+            self._refill(now)
+            capacity = self.limit_per_hour * self.burst
+            # a full bucket lets any request through, the points it is short of are paid back
+            # by the following requests
+            needed = min(self.cost + capacity * reserve, capacity)
+            if self._tokens < needed:
+                return (needed - self._tokens) / self._refill_rate()
+
+            self._take()
+            return 0.0
+
+    def _refill_rate(self) -> float:
+        '''
+        INTERNAL
+        The amount of points added to the bucket per second.
+        '''
+        return self.limit_per_hour / 3600
+
+    def _refill(self, now: float) -> None:
+        '''
+        INTERNAL
+        Add the points that have been refilled since the last refill to the bucket.
+        The lock must be held.
+        '''
+        capacity = self.limit_per_hour * self.burst
+        refilled = (now - self._refilled_at) * self._refill_rate()
+        self._tokens = min(self._tokens + refilled, capacity)
+        self._refilled_at = now
+
+    def _take(self) -> None:
+        '''
+        INTERNAL
+        Spend the estimated cost of a request. The lock must be held.
+        '''
+        self.spent += self.cost
+        self._tokens -= self.cost
+        self._requests_since_sync += 1
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .pages import FFLogsReportPaginationIterator
 from .report import FFLogsReport
 
@@ -7,7 +9,15 @@ class ReportsMixin:
     Client extensions to support report data exposed by the FF Logs API.
     '''
 
-    def reports(self, filters: dict = {}) -> FFLogsReportPaginationIterator:
+    def reports(
+            self,
+            filters: dict = {},
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsReportPaginationIterator:
         '''
         Iterate over pages of FF Logs reports.
 
@@ -16,10 +26,24 @@ class ReportsMixin:
 
         Args:
             filters: Filters to use when finding reports.
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             An iterator over the pages of reports that match the given filters.
         '''
-        return FFLogsReportPaginationIterator(filters=filters, client=self)
+        return FFLogsReportPaginationIterator(
+            filters=filters,
+            client=self,
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
+        )
 
     def get_report(self, code: str) -> FFLogsReport:
         '''
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
 from warnings import warn
 
 from fflogsapi.data import (FFGameZone, FFJobInvalid, FFLogsNPCData, FFLogsPhase,
@@ -8,11 +10,17 @@ from fflogsapi.data import (FFGameZone, FFJobInvalid, FFLogsNPCData, FFLogsPhase
 from ..characters.character import FFLogsCharacter
 from ..util.decorators import fetch_data
 from ..util.filters import construct_filter_string
+from ..util.gql_enums import GQLEnum
 from ..util.indexing import itindex
+from ..util.timeslicing import merge_event_streams, split_time_range, stitch_event_windows
 from ..world.encounter import FFLogsEncounter
 from .queries import Q_FIGHT_DATA
 
 if TYPE_CHECKING:
+    from ..analysis.auras import FFLogsAuraIntervals
+    from ..analysis.columnar import FFLogsEventColumns
+    from ..analysis.index import FFLogsEventIndex
+    from ..analysis.tables import FFLogsTableEngine
     from ..client import FFLogsClient
     from .report import FFLogsReport
 
@@ -24,6 +32,16 @@ class FFLogsFight:
 
     DATA_INDICES = ['reportData', 'report', 'fights', 0]
 
+    PREFETCH_FIELDS = [
+        'name', 'size', 'kill', 'hasEcho', 'standardComposition', 'inProgress', 'bossPercentage',
+        'fightPercentage', 'lastPhase', 'lastPhaseAsAbsoluteIndex', 'lastPhaseIsIntermission',
+        'difficulty', 'encounterID', 'friendlyPlayers', 'startTime', 'endTime', 'completeRaid',
+    ]
+    ''' The fields fetched by :func:`prefetch` when no fields are given '''
+
+    HOSTILITY_TYPES = ['Friendlies', 'Enemies']
+    ''' The hostility types whose events are combined for local analysis '''
+
     id: int = -1
     ''' The ID of the fight, within the report which this fight belongs to '''
 
@@ -36,18 +54,43 @@ class FFLogsFight:
         self._client = client
         self._data = {}
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information from a fight
+        Build the query for a specific piece of information from a fight
         '''
-        result = self._client.q(Q_FIGHT_DATA.format(
+        return Q_FIGHT_DATA.format(
             reportCode=self.report.code,
             fightID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information from a fight
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
+    def prefetch(self, fields: Optional[list[str]] = None) -> None:
+        '''
+        Fetch multiple fields of the fight in a single query, instead of one query per field.
+
+        Methods that use the prefetched fields will not need to query the API afterwards.
+        To prefetch fields for all fights in a report at once, use :func:`FFLogsReport.prefetch`.
+
+        Args:
+            fields: The names of the fields to fetch, e.g. ``['name', 'kill', 'startTime']``.
+                    By default, all simple fields of the fight are fetched.
+        '''
+        missing = [field for field in fields or self.PREFETCH_FIELDS if field not in self._data]
+        if not missing:
+            return
+
+        result = self._query_data(' '.join(missing))
+        for field in missing:
+            self._data[field] = result[field]
+
     @fetch_data('name')
     def name(self) -> str:
         '''
@@ -228,12 +271,30 @@ class FFLogsFight:
 
         return construct_filter_string(filters), filters
 
-    def events(self, filters: dict[str, Any] = {}) -> list[dict[str, Any]]:
+    def _events_page(self, filters: dict[str, Any]) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Retrieve a single page of events, starting at the start time of the given filters.
+        '''
+        return self.report._events_page(filters)
+
+    def _collect_events(self, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve all pages of events between the start and end time of the given filters.
+        '''
+        return self.report._collect_events(filters)
+
+    def events(self, filters: dict[str, Any] = {}, windows: int = 1) -> list[dict[str, Any]]:
         '''
         Retrieves the events of the fight.
 
         If start/end time is not specified in filters, the default is the start/end of the fight.
 
+        Pages of events can only be retrieved one after the other, which is slow for long fights.
+        Use `windows` to split the fight into multiple time windows whose events are retrieved
+        in parallel. The events are returned in timestamp order either way.
+
         This data isn't considered frozen by FF Logs and may therefore change without notice.
 
         For a full list of valid filters see the API documentation:
@@ -241,35 +302,160 @@ class FFLogsFight:
 
         Args:
             filters: Filters to use when retrieving event log data.
+            windows: The amount of time windows to retrieve in parallel.
         Returns:
             A filtered list of all events in the fight or None if the fight has zero duration
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
         '''
         if self.duration() == 0:
             return None
 
-        filter_string, filters = self._prepare_data_filters(filters.copy())
+        _, filters = self._prepare_data_filters(filters.copy())
 
-        # used for pagination
-        desired_end = filters['endTime']
+        time_windows = split_time_range(filters['startTime'], filters['endTime'], windows)
+        if len(time_windows) == 1:
+            return self._collect_events(filters)
 
-        result = self.report._query_data(f'events({filter_string}) {{ data, nextPageTimestamp }}')
-        fight_events = result['events']['data']
+        window_filters = [{**filters, 'startTime': start, 'endTime': end}
+                          for start, end in time_windows]
+        with ThreadPoolExecutor(max_workers=len(window_filters)) as executor:
+            # run in copies of the caller's context, e.g. to keep the request priority
+            futures = [
+                executor.submit(copy_context().run, self._collect_events, window)
+                for window in window_filters
+            ]
+            window_events = [future.result() for future in futures]
 
-        # Check if there are more pages to this fight.
-        # If so, retrieve all of them and merge the data.
-        next_page = result['events']['nextPageTimestamp']
-        while next_page and next_page < desired_end:
-            filters['startTime'] = next_page
+        return stitch_event_windows(window_events)
 
-            filter_string = construct_filter_string(filters)
-            result = self.report._query_data(
-                f'events({filter_string}) {{ data, nextPageTimestamp }}'
-            )
-            events = result['events']['data']
-            fight_events += events
-            next_page = result['events']['nextPageTimestamp']
+    def iter_events(
+        self,
+        filters: dict[str, Any] = {},
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        '''
+        Iterate over the events of the fight as their pages are retrieved.
+
+        Unlike :func:`events`, the events are not collected in a list. Each page of events is
+        yielded as soon as it has been retrieved, so that events can be processed in constant
+        memory while the rest of the fight is still being downloaded. By default, the next page
+        is requested in a background thread while the events of the current page are consumed.
+
+        If start/end time is not specified in filters, the default is the start/end of the fight.
+
+        For a full list of valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/warcraft/report.doc.html
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+            prefetch: Whether or not to retrieve the next page in the background.
+        Returns:
+            An iterator over the filtered events of the fight. The iterator is empty if the
+            fight has zero duration.
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
+        '''
+        if self.duration() == 0:
+            return iter(())
+
+        # validate the filters now rather than when iteration starts
+        _, filters = self._prepare_data_filters(filters.copy())
+        return self._iter_event_pages(filters, prefetch)
+
+    def events_columnar(
+        self,
+        filters: dict[str, Any] = {},
+    ) -> Optional['FFLogsEventColumns']:
+        '''
+        Retrieves the events of the fight as NumPy columns, for vectorized analysis.
 
-        return fight_events
+        The columns are built while the pages of events are retrieved, so the events are never
+        all kept in memory as dictionaries. Requires NumPy, see :mod:`fflogsapi.analysis`.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+        Returns:
+            The filtered events of the fight in columnar form, or None if the fight has zero
+            duration.
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
+        '''
+        from ..analysis.columnar import FFLogsEventColumns
+
+        if self.duration() == 0:
+            return None
+        return FFLogsEventColumns.from_events(self.iter_events(filters))
+
+    def events_indexed(
+        self,
+        filters: dict[str, Any] = {},
+        windows: int = 1,
+    ) -> Optional['FFLogsEventIndex']:
+        '''
+        Retrieves the events of the fight, indexed by source, target, ability and type.
+
+        Use this when the same events are searched many times, e.g. for all casts of an actor or
+        all damage from an ability. Requires NumPy, see :mod:`fflogsapi.analysis`.
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+            windows: The amount of time windows to retrieve in parallel, see :func:`events`.
+        Returns:
+            The indexed events of the fight, or None if the fight has zero duration.
+        Raises:
+            ValueError if the filter attempts to get events out of the fight's time bounds
+        '''
+        from ..analysis.index import FFLogsEventIndex
+
+        events = self.events(filters, windows=windows)
+        return FFLogsEventIndex(events) if events is not None else None
+
+    def _iter_event_pages(
+        self,
+        filters: dict[str, Any],
+        prefetch: bool,
+    ) -> Iterator[dict[str, Any]]:
+        '''
+        INTERNAL
+        Generator behind :func:`iter_events`.
+        '''
+        desired_end = filters['endTime']
+
+        def page_from(start: float) -> dict[str, Any]:
+            return self._events_page({**filters, 'startTime': start})
+
+        page = page_from(filters['startTime'])
+        if not prefetch:
+            while True:
+                yield from page['data']
+                next_page = page['nextPageTimestamp']
+                if not next_page or next_page >= desired_end:
+                    return
+                page = page_from(next_page)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        stopped_early = False
+        try:
+            while True:
+                next_page = page['nextPageTimestamp']
+                future = None
+                if next_page and next_page < desired_end:
+                    future = executor.submit(copy_context().run, page_from, next_page)
+
+                try:
+                    yield from page['data']
+                except GeneratorExit:
+                    stopped_early = True
+                    raise
+
+                if future is None:
+                    return
+                page = future.result()
+        finally:
+            # if the consumer stopped early, don't wait for a page nobody will read. a request
+            # that is already running finishes in the background and is discarded
+            executor.shutdown(wait=not stopped_early, cancel_futures=True)
 
     def graph(self, filters: dict[str, Any] = {}) -> dict[Any, Any]:
         '''
@@ -321,6 +507,62 @@ class FFLogsFight:
         result = self.report._query_data(f'table({table_filters})')
         return result['table']['data']
 
+    def _all_events(self) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve the events of both friendly and enemy actors, in timestamp order.
+        The API only returns the events of friendly actors unless told otherwise.
+        '''
+        return merge_event_streams([
+            self.events({'hostilityType': GQLEnum(hostility)}) or []
+            for hostility in self.HOSTILITY_TYPES
+        ])
+
+    def table_engine(self) -> 'FFLogsTableEngine':
+        '''
+        Retrieves all events of the fight for computing tables locally.
+
+        Events of friendly and enemy actors are both retrieved, so damage taken and enemy casts
+        are included.
+
+        The returned engine computes tables like :func:`table` for any combination of the
+        supported filters without querying the API again. Requires NumPy, see
+        :mod:`fflogsapi.analysis`.
+
+        Returns:
+            A table engine for the fight.
+        '''
+        from ..analysis.tables import FFLogsTableEngine
+
+        return FFLogsTableEngine(
+            events=self._all_events(),
+            actors=self.report.actors(),
+            abilities=self.report.abilities(),
+            start_time=self.start_time(),
+            end_time=self.end_time(),
+        )
+
+    def aura_intervals(self) -> 'FFLogsAuraIntervals':
+        '''
+        Retrieves the buff and debuff intervals of the fight.
+
+        The intervals answer questions like "was this buff active when this damage was dealt?"
+        or "what was the uptime of this debuff?" without any further queries. Requires NumPy,
+        see :mod:`fflogsapi.analysis`.
+
+        Auras applied by friendly and enemy actors are both included.
+
+        Returns:
+            The aura intervals of the fight.
+        '''
+        from ..analysis.auras import FFLogsAuraIntervals
+
+        return FFLogsAuraIntervals.from_events(
+            self._all_events(),
+            start_time=self.start_time(),
+            end_time=self.end_time(),
+        )
+
     def rankings(
         self,
         metric: str = 'default',
@@ -353,17 +595,17 @@ class FFLogsFight:
                 return None
             ranks = ranks[0]
 
-            jobs = self._client.jobs()
+            jobs = self._client.jobs_by_slug()
             character_rankings = []
             combo_rankings = []
             for role, data in ranks['roles'].items():
                 for ranking in data['characters']:
                     character = FFLogsCharacter(id=ranking['id'], client=self._client)
-                    job = list(filter(lambda j: j.slug == ranking['class'], jobs))[0]
+                    job = jobs[ranking['class']]
 
                     if 'id_2' in ranking:
                         # this is a tank/healer combination ranking
-                        job_b = list(filter(lambda j: j.slug == ranking['class_2'], jobs))[0]
+                        job_b = jobs[ranking['class_2']]
                         combo_rankings.append(FFLogsReportComboRanking(
                             type=role,
                             character_a=character,
@@ -412,18 +654,16 @@ class FFLogsFight:
             details = self.report._query_data(
                 f'playerDetails(fightIDs: {self.id})'
             )['playerDetails']['data']['playerDetails']
-            jobs = self._client.jobs()
+            jobs = self._client.jobs_by_slug()
 
             self._data['playerDetails'] = []
             for role, players in details.items():
                 for data in players:
                     job_slug = data['type']
-                    try:
-                        job = [j for j in jobs if j.slug == job_slug][0]
-                    except IndexError:
-                        invalid_job = FFJobInvalid()
-                        invalid_job.slug = job_slug
-                        job = invalid_job
+                    job = jobs.get(job_slug)
+                    if job is None:
+                        job = FFJobInvalid()
+                        job.slug = job_slug
 
                     details = FFLogsPlayerDetails(
                         id=data['id'],
@@ -1,11 +1,13 @@
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 from ..characters.character import FFLogsCharacter
 from ..data import (FFLogsActor, FFLogsArchivalData, FFLogsPhase, FFLogsReportAbility,
                     FFLogsReportTag,)
 from ..user.user import FFLogsUser
 from ..util.decorators import fetch_data
+from ..util.filters import construct_filter_string
 from ..util.indexing import itindex
+from ..util.timeslicing import partition_events
 from ..world.region import FFLogsRegion
 from ..world.zone import FFLogsZone
 from .fight import FFLogsFight
@@ -36,18 +38,59 @@ class FFLogsReport:
     def __iter__(self) -> Iterator:
         return iter(self.fights())
 
+    def _format_query(self, query: str) -> str:
+        '''
+        INTERNAL
+        Build the query for a specific piece of information from a report.
+        '''
+        return Q_REPORT_DATA.format(
+            reportCode=self.code,
+            innerQuery=query,
+        )
+
     def _query_data(self, query: str, ignore_cache: bool = False) -> None:
         '''
         INTERNAL
         Query for a specific piece of information from a report.
         '''
-        result = self._client.q(Q_REPORT_DATA.format(
-            reportCode=self.code,
-            innerQuery=query
-        ), ignore_cache=ignore_cache)
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
+    def _events_page(self, filters: dict[str, Any]) -> dict[str, Any]:
+        '''
+        INTERNAL
+        Retrieve a single page of events, starting at the start time of the given filters.
+        '''
+        filter_string = construct_filter_string(filters)
+        result = self._query_data(f'events({filter_string}) {{ data, nextPageTimestamp }}')
+        return result['events']
+
+    def _collect_events(self, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        '''
+        INTERNAL
+        Retrieve all pages of events between the start and end time of the given filters.
+        '''
+        filters = filters.copy()
+
+        # used for pagination
+        desired_end = filters['endTime']
+
+        page = self._events_page(filters)
+        # the page data may be read-only, collect the events in a new list
+        events = list(page['data'])
+
+        # Check if there are more pages to this fight.
+        # If so, retrieve all of them and merge the data.
+        next_page = page['nextPageTimestamp']
+        while next_page and next_page < desired_end:
+            filters['startTime'] = next_page
+            page = self._events_page(filters)
+            events.extend(page['data'])
+            next_page = page['nextPageTimestamp']
+
+        return events
+
     def _query_phases(self) -> dict[int, list[FFLogsPhase]]:
         '''
         INTERNAL
@@ -82,10 +125,9 @@ class FFLogsReport:
             actors = self._query_data(IQ_REPORT_ACTORS)['masterData']['actors']
             actors = sorted(actors, key=lambda a: a['id'])
 
+            jobs = self._client.jobs_by_slug()
             all_actors = {}
             for actor in actors:
-                jobs = self._client.jobs()
-                actor_job = list(filter(lambda j: j.slug == actor['subType'], jobs))
                 actor = FFLogsActor(
                     report=self,
                     id=actor['id'],
@@ -94,18 +136,22 @@ class FFLogsReport:
                     sub_type=actor['subType'],
                     server=actor['server'],
                     game_id=actor['gameID'],
-                    job=actor_job[0] if len(actor_job) else None,
+                    job=jobs.get(actor['subType']),
                     pet_owner=None,
                 )
                 all_actors[actor.id] = actor
 
             # 2nd pass to fill pet owner fields with actual FFLogsActors instead of just IDs
+            pets = {}
             for actor in actors:
                 if actor['petOwner'] is None:
                     continue
                 all_actors[actor['id']].pet_owner = all_actors[actor['petOwner']]
+                pets.setdefault(actor['petOwner'], []).append(all_actors[actor['id']])
 
             self._data['masterActors'] = list(all_actors.values())
+            self._data['masterActorsByID'] = all_actors
+            self._data['masterPets'] = pets
 
         return self._data['masterActors']
 
@@ -119,9 +165,20 @@ class FFLogsReport:
             An actor or None if there is no actor with the given ID.
         '''
         # side effect to get actor data
-        actors = self.actors()
-        actors = list(filter(lambda a: a.id == id, actors))
-        return (actors[0] if len(actors) else None)
+        self.actors()
+        return self._data['masterActorsByID'].get(id)
+
+    def pets(self, owner_id: int) -> list[FFLogsActor]:
+        '''
+        Get the pets of an actor.
+
+        Args:
+            owner_id: The report ID of the pet owner.
+        Returns:
+            The pets owned by the actor.
+        '''
+        self.actors()
+        return list(self._data['masterPets'].get(owner_id, []))
 
     def abilities(self) -> list[FFLogsReportAbility]:
         '''
@@ -142,9 +199,25 @@ class FFLogsReport:
                 all_abilities.append(ability)
 
             self._data['masterAbilities'] = all_abilities
+            self._data['masterAbilitiesByID'] = {
+                ability.game_id: ability for ability in all_abilities
+            }
 
         return self._data['masterAbilities']
 
+    def ability(self, game_id: int) -> Optional[FFLogsReportAbility]:
+        '''
+        Get a specific ability by its game ID.
+
+        Args:
+            game_id: The game ID of the ability.
+        Returns:
+            An ability or None if the ability is not in the report.
+        '''
+        # side effect to get ability data
+        self.abilities()
+        return self._data['masterAbilitiesByID'].get(game_id)
+
     def log_version(self) -> int:
         '''
         Returns:
@@ -318,6 +391,39 @@ class FFLogsReport:
 
         return self._fights[id]
 
+    def prefetch(self, fields: Optional[list[str]] = None) -> None:
+        '''
+        Fetch multiple fields of every fight in the report with a single query.
+
+        This is much faster than letting each fight query its fields one by one when iterating
+        over the fights of a report:
+
+        .. code-block:: python
+
+            report.prefetch(fields=['name', 'kill', 'fightPercentage'])
+            for fight in report:
+                # no queries are sent here
+                print(fight.name(), fight.is_kill(), fight.fight_percentage())
+
+        Args:
+            fields: The names of the fight fields to fetch. By default, the fields listed in
+                    :attr:`FFLogsFight.PREFETCH_FIELDS` are fetched.
+        '''
+        fields = [field for field in fields or FFLogsFight.PREFETCH_FIELDS if field != 'id']
+        fights = self._query_data(f'fights {{ id {" ".join(fields)} }}')['fights']
+
+        for data in fights:
+            if data['id'] not in self._fights:
+                self._fights[data['id']] = FFLogsFight(
+                    report=self,
+                    fight_id=data['id'],
+                    client=self._client,
+                )
+
+            fight = self._fights[data['id']]
+            for field in fields:
+                fight._data[field] = data[field]
+
     def fights(self) -> list[FFLogsFight]:
         '''
         Returns:
@@ -329,6 +435,40 @@ class FFLogsReport:
                 self.fight(id=id)
         return self._fights.values()
 
+    def events_by_fight(self, filters: dict[str, Any] = {}) -> dict[int, list[dict[str, Any]]]:
+        '''
+        Retrieves the events of all fights in the report at once.
+
+        Instead of paginating through the events of each fight separately, the events of the
+        whole report are paginated through once and then split into fights locally. This needs
+        far fewer requests for reports with many short fights.
+
+        Use the ``fightIDs`` filter to only retrieve the events of some of the fights. Events that
+        are not within any of the fights are left out.
+
+        For a full list of valid filters see the API documentation:
+        https://www.fflogs.com/v2-api-docs/warcraft/report.doc.html
+
+        Args:
+            filters: Filters to use when retrieving event log data.
+        Returns:
+            The events of each fight, by fight ID.
+        '''
+        self.prefetch(fields=['startTime', 'endTime'])
+        fights = [
+            (fight.id, fight.start_time(), fight.end_time()) for fight in self.fights()
+            if 'fightIDs' not in filters or fight.id in filters['fightIDs']
+        ]
+        if not fights:
+            return {}
+
+        filters = filters.copy()
+        filters['fightIDs'] = [fight_id for fight_id, _, _ in fights]
+        filters.setdefault('startTime', min(start for _, start, _ in fights))
+        filters.setdefault('endTime', max(end for _, _, end in fights))
+
+        return partition_events(self._collect_events(filters), fights)
+
     def ranked_characters(self) -> list[FFLogsCharacter]:
         '''
         Get all the characters that ranked on kills in this report.
@@ -28,14 +28,20 @@ class FFLogsUser:
         self._encounters = {}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a user
+        Build the query for a specific piece of information about a user
         '''
-        result = self._client.q(Q_USER.format(
+        return Q_USER.format(
             userID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a user
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
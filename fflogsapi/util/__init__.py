@@ -1,6 +1,13 @@
+from .frozen import FrozenDict, FrozenList, freeze, thaw
 from .gql_enums import GQLEnum
 
 __all__ = [
     # gql_enums.py
     'GQLEnum',
+
+    # frozen.py
+    'FrozenDict',
+    'FrozenList',
+    'freeze',
+    'thaw',
 ]
@@ -0,0 +1,71 @@
+from typing import Any
+
+from graphql import FieldNode, NameNode, OperationDefinitionNode, OperationType, parse, print_ast
+
+
+def alias_prefix(idx: int) -> str:
+    '''
+    The alias prefix given to the root fields of the `idx`-th query in a batch.
+    '''
+    return f'q{idx}_'
+
+
+def merge_queries(queries: list[str]) -> str:
+    '''
+    Merge multiple GraphQL queries into a single query document.
+
+    The root fields of each query are aliased with a prefix unique to the query, such that the
+    result of the merged query can be split back into the results of the individual queries with
+    :func:`split_result`.
+
+    Args:
+        queries: The queries to merge. Each query must consist of a single query operation without
+                 variables or fragments.
+    Returns:
+        A single query document containing the selections of all queries.
+    Raises:
+        ValueError if any of the queries can not be merged.
+    '''
+    selections = []
+    for idx, query in enumerate(queries):
+        document = parse(query)
+        if len(document.definitions) != 1:
+            raise ValueError('Only queries consisting of a single operation can be batched')
+
+        operation = document.definitions[0]
+        if not isinstance(operation, OperationDefinitionNode) or \
+                operation.operation != OperationType.QUERY:
+            raise ValueError('Only query operations can be batched')
+        if operation.variable_definitions:
+            raise ValueError('Queries with variables can not be batched')
+
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                raise ValueError('Queries with fragments can not be batched')
+
+            response_key = (selection.alias or selection.name).value
+            selection.alias = NameNode(value=alias_prefix(idx) + response_key)
+            selections.append(selection)
+
+    operation.selection_set.selections = tuple(selections)
+    operation.name = None
+    document.definitions = (operation,)
+    return print_ast(document)
+
+
+def split_result(result: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    '''
+    Split the result of a query merged by :func:`merge_queries` into the results of
+    the individual queries.
+
+    Args:
+        result: The result of the merged query.
+        count: The amount of queries that were merged.
+    Returns:
+        A list with the result of each individual query, in the order they were merged.
+    '''
+    results = [{} for _ in range(count)]
+    for key, value in result.items():
+        idx, response_key = key[1:].split('_', 1)
+        results[int(idx)][response_key] = value
+    return results
@@ -0,0 +1,86 @@
+import json
+import os
+from typing import Any, Optional
+
+CHECKPOINT_VERSION = 1
+''' The version of the pagination checkpoint file format '''
+
+
+def pagination_state(
+    pagination: str,
+    page: int,
+    end_page: Optional[int],
+    filters: dict[str, Any],
+    additional_formatting: dict[str, Any],
+) -> dict[str, Any]:
+    '''
+    Describe the progress of a pagination, such that it can be resumed later.
+
+    Args:
+        pagination: The name of the paginated data, e.g. ``'reportData.reports'``.
+        page: The page to resume from.
+        end_page: The last page to iterate over, or None to iterate until the last page.
+        filters: The filters of the pagination.
+        additional_formatting: The additional query formatting of the pagination.
+    Returns:
+        A JSON serializable description of the pagination's progress.
+    '''
+    return {
+        'version': CHECKPOINT_VERSION,
+        'pagination': pagination,
+        'page': page,
+        'end_page': end_page,
+        'filters': filters,
+        'additional_formatting': additional_formatting,
+    }
+
+
+def save_checkpoint(path: str, state: dict[str, Any]) -> None:
+    '''
+    Write the state of a pagination to a checkpoint file.
+
+    The file is replaced atomically, so a crash while saving never leaves a broken checkpoint.
+
+    Args:
+        path: The path of the checkpoint file.
+        state: The state of the pagination, see :func:`pagination_state`.
+    '''
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(state, file, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(
+    path: str,
+    pagination: str,
+    filters: dict[str, Any],
+    additional_formatting: dict[str, Any],
+) -> Optional[dict[str, Any]]:
+    '''
+    Read the state of a pagination from a checkpoint file, if it exists.
+
+    Args:
+        path: The path of the checkpoint file.
+        pagination: The name of the paginated data of the pagination being resumed.
+        filters: The filters of the pagination being resumed.
+        additional_formatting: The additional query formatting of the pagination being resumed.
+    Returns:
+        The saved state of the pagination, or None if there is no checkpoint file.
+    Raises:
+        ValueError if the checkpoint belongs to a different pagination.
+    '''
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r', encoding='utf-8') as file:
+        state = json.load(file)
+
+    # compare through JSON so that e.g. tuples in the filters match the saved lists
+    expected = json.loads(json.dumps(
+        pagination_state(pagination, 0, None, filters, additional_formatting),
+    ))
+    for key in ('version', 'pagination', 'filters', 'additional_formatting'):
+        if state.get(key) != expected[key]:
+            raise ValueError(f'The checkpoint {path} belongs to a different pagination ({key})')
+    return state
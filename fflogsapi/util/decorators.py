@@ -25,6 +25,29 @@ def fetch_data(*keys):
     return decorator
 
 
+def async_fetch_data(*keys):
+    '''
+    Asynchronous version of :func:`fetch_data` for coroutine methods.
+
+    The class must have a `_data` dictionary field and a `_query_data` coroutine which
+    queries for the data specified by the `key`.
+
+    Args:
+        `key`: The key to query and store.
+    '''
+    def decorator(func):
+        @wraps(func)
+        async def ensured(*args, **kwargs):
+            self = args[0]
+            for key in keys:
+                if key not in self._data:
+                    result = await self._query_data(key)
+                    self._data[key] = result[key]
+            return await func(*args, **kwargs)
+        return ensured
+    return decorator
+
+
 def default_instantiation(_class):
     '''
     Class decorator which instantiates the class with dunder defaults when no args are given on
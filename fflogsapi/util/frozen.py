@@ -0,0 +1,101 @@
+from typing import Any, NoReturn
+
+
+def _read_only(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(
+        f'{type(self).__name__} is read-only. Use fflogsapi.util.thaw to get a mutable copy.'
+    )
+
+
+class FrozenDict(dict):
+    '''
+    A read-only dictionary.
+
+    Query results are returned as frozen containers when the client does not copy results.
+    Reading works exactly like a regular dictionary, but any attempt to modify it raises a
+    TypeError. Use :func:`thaw` to get a mutable copy.
+    '''
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self) -> tuple:
+        return (FrozenDict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f'FrozenDict({dict.__repr__(self)})'
+
+
+class FrozenList(list):
+    '''
+    A read-only list.
+
+    Query results are returned as frozen containers when the client does not copy results.
+    Reading works exactly like a regular list, but any attempt to modify it raises a TypeError.
+    Use :func:`thaw` to get a mutable copy.
+    '''
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __reduce__(self) -> tuple:
+        return (FrozenList, (list(self),))
+
+    def __repr__(self) -> str:
+        return f'FrozenList({list.__repr__(self)})'
+
+
+def freeze(obj: Any) -> Any:
+    '''
+    Recursively convert the dictionaries and lists of a query result into read-only containers.
+
+    Already frozen containers are returned as-is.
+
+    Args:
+        obj: The query result to freeze.
+    Returns:
+        A read-only version of the query result.
+    '''
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return FrozenList([freeze(value) for value in obj])
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    '''
+    Recursively copy a (possibly frozen) query result into regular, mutable containers.
+
+    Args:
+        obj: The query result to copy.
+    Returns:
+        A mutable deep copy of the query result.
+    '''
+    if isinstance(obj, dict):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(value) for value in obj]
+    return obj
@@ -0,0 +1,122 @@
+import heapq
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Any
+
+
+def split_time_range(start: float, end: float, count: int) -> list[tuple[float, float]]:
+    '''
+    Split a time range into consecutive windows of (roughly) equal length.
+
+    The end of each window is the start of the next one. No window is shorter than a millisecond,
+    so fewer than `count` windows are returned for very short time ranges.
+
+    Args:
+        start: The start of the time range.
+        end: The end of the time range.
+        count: The desired amount of windows.
+    Returns:
+        A list of (start, end) tuples, one for each window.
+    Raises:
+        ValueError if the amount of windows is less than 1.
+    '''
+    if count < 1:
+        raise ValueError(f'The time range must be split into at least 1 window (got {count})')
+
+    count = max(1, min(count, int(end - start)))
+    length = (end - start) / count
+
+    bounds = [start] + [int(start + i * length) for i in range(1, count)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def stitch_event_windows(windows: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    '''
+    Join events fetched in consecutive time windows into a single list in timestamp order.
+
+    Events exactly on the boundary between two windows may be returned for both windows.
+    Such duplicates are only kept once.
+
+    Args:
+        windows: The events of each window, in the order of the windows.
+    Returns:
+        A list of all unique events, sorted by timestamp.
+    '''
+    events = []
+    for window in windows:
+        if not window:
+            continue
+
+        if events:
+            boundary = events[-1]['timestamp']
+            # the events of the previous windows that might have been fetched again
+            overlap = []
+            for event in reversed(events):
+                if event['timestamp'] < window[0]['timestamp']:
+                    break
+                overlap.append(event)
+
+            kept = []
+            idx = 0
+            while idx < len(window) and window[idx]['timestamp'] <= boundary:
+                if window[idx] in overlap:
+                    overlap.remove(window[idx])
+                else:
+                    kept.append(window[idx])
+                idx += 1
+            window = kept + window[idx:]
+
+        events.extend(window)
+
+    # windows don't overlap beyond their boundaries, so this is (close to) a linear pass
+    events.sort(key=itemgetter('timestamp'))
+    return events
+
+
+def merge_event_streams(streams: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    '''
+    Merge events fetched with different filters over the same time range, e.g. the events of
+    friendly and enemy actors, into a single list in timestamp order.
+
+    Events with the same timestamp are kept in the order of the streams.
+
+    Args:
+        streams: The events of each stream, each in timestamp order.
+    Returns:
+        A list of all events, sorted by timestamp.
+    '''
+    return list(heapq.merge(*streams, key=itemgetter('timestamp')))
+
+
+def partition_events(
+    events: list[dict[str, Any]],
+    fights: list[tuple[int, float, float]],
+) -> dict[int, list[dict[str, Any]]]:
+    '''
+    Split the events of a report into the fights they belong to.
+
+    Events that state the ID of their fight are put in that fight. Other events are put in the
+    fight whose time range contains them, and dropped if they are not within any fight.
+
+    Args:
+        events: The events of the report, in timestamp order.
+        fights: (fight ID, start time, end time) tuples of the fights.
+    Returns:
+        The events of each fight, by fight ID.
+    '''
+    fights = sorted(fights, key=itemgetter(1))
+    starts = [start for _, start, _ in fights]
+    partitions = {fight_id: [] for fight_id, _, _ in fights}
+
+    for event in events:
+        fight_id = event.get('fight')
+        if fight_id is None:
+            idx = bisect_right(starts, event['timestamp']) - 1
+            if idx < 0 or event['timestamp'] > fights[idx][2]:
+                continue
+            fight_id = fights[idx][0]
+        elif fight_id not in partitions:
+            continue
+        partitions[fight_id].append(event)
+
+    return partitions
@@ -9,6 +9,7 @@ from .pages import (FFLogsRegionServerPage, FFLogsRegionServerPaginationIterator
                     FFLogsSubregionServerPage, FFLogsSubregionServerPaginationIterator,)
 from .region import FFLogsRegion, FFLogsSubregion
 from .server import FFLogsServer
+from .snapshot import FFLogsWorldSnapshot
 from .zone import FFLogsZone
 
 __all__ = [
@@ -25,6 +26,9 @@ __all__ = [
     # server.py
     'FFLogsServer',
 
+    # snapshot.py
+    'FFLogsWorldSnapshot',
+
     # zone.py
     'FFLogsZone',
 
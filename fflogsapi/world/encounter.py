@@ -25,14 +25,20 @@ class FFLogsEncounter:
         self._data = {'id': id}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about an encounter
+        Build the query for a specific piece of information about an encounter
         '''
-        result = self._client.q(Q_ENCOUNTER.format(
+        return Q_ENCOUNTER.format(
             encounterID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about an encounter
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -25,14 +25,20 @@ class FFLogsExpansion:
         self._encounters = {}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a expansion
+        Build the query for a specific piece of information about a expansion
         '''
-        result = self._client.q(Q_EXPANSION.format(
+        return Q_EXPANSION.format(
             expansionID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a expansion
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..util.decorators import fetch_data
 from ..util.indexing import itindex
@@ -27,14 +27,20 @@ class FFLogsRegion:
         self._encounters = {}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a region
+        Build the query for a specific piece of information about a region
         '''
-        result = self._client.q(Q_REGION.format(
+        return Q_REGION.format(
             regionID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a region
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -68,17 +74,36 @@ class FFLogsRegion:
         '''
         return self._data['slug']
 
-    def servers(self) -> 'FFLogsRegionServerPaginationIterator':
+    def servers(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> 'FFLogsRegionServerPaginationIterator':
         '''
         Get a pagination of all servers in the region.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             A pagination iterator of the region's servers.
         '''
         from .pages import FFLogsRegionServerPaginationIterator
         return FFLogsRegionServerPaginationIterator(
             client=self._client,
-            additional_formatting={'regionID': self.id}
+            additional_formatting={'regionID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
         )
 
     def subregions(self) -> list['FFLogsSubregion']:
@@ -113,14 +138,20 @@ class FFLogsSubregion:
         self._encounters = {}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a subregion
+        Build the query for a specific piece of information about a subregion
         '''
-        result = self._client.q(Q_SUBREGION.format(
+        return Q_SUBREGION.format(
             subregionID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a subregion
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -148,15 +179,34 @@ class FFLogsSubregion:
 
         return self._data['region']
 
-    def servers(self) -> 'FFLogsSubregionServerPaginationIterator':
+    def servers(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> 'FFLogsSubregionServerPaginationIterator':
         '''
         Get a list of all servers within this subregion/data center.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             A list of the subregion's servers.
         '''
         from .pages import FFLogsSubregionServerPaginationIterator
         return FFLogsSubregionServerPaginationIterator(
             client=self._client,
-            additional_formatting={'subregionID': self.id}
+            additional_formatting={'subregionID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
         )
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..util.decorators import fetch_data
 from ..util.filters import construct_filter_string
@@ -36,15 +36,21 @@ class FFLogsServer:
 
         self.id = self.filters['id']
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a server
+        Build the query for a specific piece of information about a server
         '''
         filters = construct_filter_string(self.filters)
-        result = self._client.q(Q_SERVER.format(
+        return Q_SERVER.format(
             filters=filters,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a server
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -109,14 +115,33 @@ class FFLogsServer:
 
         return self._data['subregion']
 
-    def characters(self) -> FFLogsServerCharacterPaginationIterator:
+    def characters(
+            self,
+            prefetch: int = 0,
+            bulk: int = 1,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            checkpoint: Optional[str] = None,
+    ) -> FFLogsServerCharacterPaginationIterator:
         '''
         Get a pagination of all characters found on the server.
 
+        Args:
+            prefetch: The amount of pages to retrieve ahead of the current page in the background.
+            bulk: The amount of pages to retrieve per request.
+            start_page: The first page to iterate over.
+            end_page: The last page to iterate over, or None to iterate until the last page.
+            checkpoint: The path of a file to save the progress of the iteration to, and to
+                        resume it from.
         Returns:
             A pagination iterator over all pages of characters belonging to the server.
         '''
         return FFLogsServerCharacterPaginationIterator(
             client=self._client,
-            additional_formatting={'serverID': self.id}
+            additional_formatting={'serverID': self.id},
+            prefetch=prefetch,
+            bulk=bulk,
+            start_page=start_page,
+            end_page=end_page,
+            checkpoint=checkpoint,
         )
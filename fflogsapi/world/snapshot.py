@@ -0,0 +1,165 @@
+import gzip
+import json
+from time import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..util.frozen import freeze, thaw
+
+if TYPE_CHECKING:
+    from ..client import FFLogsClient
+
+SNAPSHOT_VERSION = 1
+''' The version of the world snapshot file format '''
+
+
+class FFLogsWorldSnapshot:
+    '''
+    A snapshot of FF Logs world data: expansions, zones, encounters, partitions, brackets,
+    difficulties, regions, subregions and servers.
+
+    World data rarely changes, so it can be retrieved once with :func:`generate`, saved to a file
+    and loaded by clients with the ``world_snapshot`` argument. Clients then answer world data
+    lookups from the snapshot without sending any requests to the API:
+
+    .. code-block:: python
+
+        snapshot = FFLogsWorldSnapshot.generate(client)
+        snapshot.save('world.json.gz')
+
+        client = FFLogsClient(CLIENT_ID, CLIENT_SECRET, world_snapshot='world.json.gz')
+        # no requests are sent here
+        zone = client.get_zone(id=54)
+        print(zone.name(), zone.partitions())
+
+    The snapshot stores the results of the queries made by the world data objects, so any
+    lookup that is not in the snapshot is simply sent to the API as usual.
+
+    Args:
+        results: The query results of the snapshot, by query.
+        created: The unix timestamp of when the snapshot was generated.
+    '''
+
+    def __init__(
+        self,
+        results: Optional[dict[str, Any]] = None,
+        created: Optional[float] = None,
+    ) -> None:
+        self._results = {query: freeze(result) for query, result in (results or {}).items()}
+        self.created = created if created is not None else time()
+        ''' The unix timestamp of when the snapshot was generated '''
+        self.recording = False
+        ''' Whether the results of queries executed by clients are added to the snapshot '''
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, query: str) -> bool:
+        return query in self._results
+
+    def get(self, query: str) -> Optional[Any]:
+        '''
+        Get the stored result of a query.
+
+        Args:
+            query: The query.
+        Returns:
+            The read-only result of the query, or None if the query is not in the snapshot.
+        '''
+        return self._results.get(query)
+
+    def record(self, query: str, result: Any) -> None:
+        '''
+        Add the result of a query to the snapshot.
+
+        Args:
+            query: The query.
+            result: The result of the query.
+        '''
+        self._results[query] = freeze(result)
+
+    def save(self, path: str) -> None:
+        '''
+        Save the snapshot to a gzipped JSON file.
+
+        Args:
+            path: The path of the file.
+        '''
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump({
+                'version': SNAPSHOT_VERSION,
+                'created': self.created,
+                'results': {query: thaw(result) for query, result in self._results.items()},
+            }, file, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'FFLogsWorldSnapshot':
+        '''
+        Load a snapshot saved with :func:`save`.
+
+        Args:
+            path: The path of the file.
+        Returns:
+            The snapshot.
+        Raises:
+            ValueError if the file is not a world snapshot of a supported version.
+        '''
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            data = json.load(file)
+
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} is not a supported world snapshot')
+        return cls(results=data['results'], created=data['created'])
+
+    @classmethod
+    def generate(cls, client: 'FFLogsClient', servers: bool = True) -> 'FFLogsWorldSnapshot':
+        '''
+        Retrieve all world data from the API into a new snapshot.
+
+        Args:
+            client: The client to retrieve the world data with.
+            servers: Whether to include servers, which take one query per server and field.
+        Returns:
+            The snapshot.
+        '''
+        snapshot = cls()
+        previous_snapshot = client.world_snapshot
+        client.world_snapshot = snapshot
+        snapshot.recording = True
+        try:
+            for expansion in client.all_expansions():
+                expansion.name()
+                client.all_zones(expansion_id=expansion.id)
+                for zone in expansion.zones():
+                    zone.name()
+                    zone.frozen()
+                    zone.brackets()
+                    zone.partitions()
+                    zone.difficulties()
+                    zone.expansion()
+                    for encounter in zone.encounters():
+                        encounter.name()
+                        encounter.zone()
+
+            for region in client.all_regions():
+                region.name()
+                region.compact_name()
+                region.slug()
+                for subregion in region.subregions():
+                    subregion.name()
+                    subregion.region()
+
+                if not servers:
+                    continue
+                for page in region.servers():
+                    for server in page:
+                        server.name()
+                        server.normalized_name()
+                        server.region()
+                        server.subregion()
+                        # servers are commonly looked up by slug and region
+                        client.get_server(filters={'slug': server.slug(), 'region': region.slug()})
+        finally:
+            snapshot.recording = False
+            client.world_snapshot = previous_snapshot
+
+        return snapshot
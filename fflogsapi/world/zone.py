@@ -27,14 +27,20 @@ class FFLogsZone:
         self._encounters = {}
         self._client = client
 
-    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+    def _format_query(self, query: str) -> str:
         '''
-        Query for a specific piece of information about a zone
+        Build the query for a specific piece of information about a zone
         '''
-        result = self._client.q(Q_ZONE.format(
+        return Q_ZONE.format(
             zoneID=self.id,
             innerQuery=query,
-        ), ignore_cache=ignore_cache)
+        )
+
+    def _query_data(self, query: str, ignore_cache: bool = False) -> dict[Any, Any]:
+        '''
+        Query for a specific piece of information about a zone
+        '''
+        result = self._client.q(self._format_query(query), ignore_cache=ignore_cache)
 
         return itindex(result, self.DATA_INDICES)
 
@@ -89,15 +95,16 @@ class FFLogsZone:
         Returns:
             The zone's partition information.
         '''
-        partition_info = self._query_data('partitions{ id, name, compactName, default }')
-        partition_info = partition_info['partitions']
+        if 'partitions' not in self._data:
+            partition_info = self._query_data('partitions{ id, name, compactName, default }')
+            self._data['partitions'] = [FFLogsPartition(
+                id=partition['id'],
+                name=partition['name'],
+                compact_name=partition['compactName'],
+                default=partition['default'],
+            ) for partition in partition_info['partitions']]
 
-        return [FFLogsPartition(
-            id=partition['id'],
-            name=partition['name'],
-            compact_name=partition['compactName'],
-            default=partition['default'],
-        ) for partition in partition_info]
+        return list(self._data['partitions'])
 
     def difficulties(self) -> dict:
         '''
@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from graphql import ExecutionResult, build_schema, introspection_from_schema
+
+from fflogsapi import GQLEnum
+from fflogsapi.aio import AsyncFFLogsClient, AsyncFFLogsFight, AsyncFFLogsReport
+from fflogsapi.aio.pages import AsyncFFLogsReportPage
+
+from ..config import CACHE_EXPIRY, CLIENT_ID, CLIENT_SECRET
+
+
+class AsyncClientTest(unittest.IsolatedAsyncioTestCase):
+    '''
+    Test cases for the asynchronous FF Logs client.
+
+    This test case makes assumptions on the availability of a specific report.
+    If the tests break, it may be because visibility settings
+    were changed or the report was deleted.
+    '''
+
+    SPECIFIC_REPORT_CODE = '2Kf9y6wzanWkBJ41'
+
+    async def asyncSetUp(self) -> None:
+        self.client = AsyncFFLogsClient(CLIENT_ID, CLIENT_SECRET, cache_expiry=CACHE_EXPIRY)
+        await self.client.connect()
+        self.report = self.client.get_report(code=self.SPECIFIC_REPORT_CODE)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        self.client.save_cache()
+
+    async def test_report(self) -> None:
+        '''
+        The client should be able to fetch report data asynchronously.
+        '''
+        self.assertIsInstance(self.report, AsyncFFLogsReport)
+        self.assertEqual(await self.report.title(), 'Abyssos')
+        self.assertEqual(await self.report.log_version(), 53)
+
+    async def test_concurrent_fights(self) -> None:
+        '''
+        The client should be able to fetch data for many fights concurrently.
+        '''
+        fights = await self.report.fights()
+        self.assertGreater(len(fights), 0)
+        self.assertIsInstance(fights[0], AsyncFFLogsFight)
+
+        names = await asyncio.gather(*[fight.name() for fight in fights])
+        self.assertEqual(len(names), len(fights))
+        self.assertTrue(all(names))
+
+    async def test_concurrent_identical_queries(self) -> None:
+        '''
+        Identical concurrent queries should give identical results that are not shared objects.
+        '''
+        fight = await self.report.fight(id=1)
+        events = await asyncio.gather(*[
+            fight.events({'dataType': GQLEnum('Deaths')}) for _ in range(4)
+        ])
+
+        for result in events[1:]:
+            self.assertEqual(result, events[0])
+            self.assertIsNot(result, events[0])
+
+    async def test_iter_events(self) -> None:
+        '''
+        Streaming the events of a fight should give the same events as retrieving them all at once.
+        '''
+        fight = await self.report.fight(id=1)
+        filters = {'dataType': GQLEnum('Casts')}
+        events = await fight.events(filters)
+
+        streamed = [event async for event in fight.iter_events(filters)]
+        self.assertEqual(streamed, events)
+
+    async def test_pagination(self) -> None:
+        '''
+        The client should be able to iterate over pages asynchronously.
+        '''
+        pages = self.client.reports(filters={'guildID': 80551})
+        async for page in pages:
+            self.assertIsInstance(page, AsyncFFLogsReportPage)
+            self.assertGreater(page.count(), 0)
+            report = page.object(0)
+            self.assertIsInstance(report, AsyncFFLogsReport)
+            self.assertTrue(await report.title())
+            break
+
+    async def test_prefetch_pagination(self) -> None:
+        '''
+        Prefetching pages should give the same pages in the same order.
+        '''
+        filters = {'guildID': 80551}
+        codes = [[report.code for report in page] async for page in self.client.reports(filters)]
+        prefetched = [
+            [report.code for report in page]
+            async for page in self.client.reports(filters, prefetch=2)
+        ]
+        self.assertEqual(prefetched, codes)
+
+    async def test_iter_objects(self) -> None:
+        '''
+        The client should be able to iterate over the objects of all pages directly.
+        '''
+        pages = self.client.reports(filters={'guildID': 80551})
+        reports = [report async for report in pages.iter_objects()]
+        self.assertEqual(len(reports), sum([page.count() async for page in pages]))
+        self.assertTrue(all(isinstance(report, AsyncFFLogsReport) for report in reports))
+
+    async def test_game_data(self) -> None:
+        '''
+        The client should be able to fetch game data asynchronously.
+        '''
+        jobs = await self.client.jobs()
+        self.assertIn('Reaper', [job.name for job in jobs])
+
+
+class AsyncConnectTest(unittest.IsolatedAsyncioTestCase):
+    '''
+    Test cases for connecting the asynchronous client to the API.
+    '''
+
+    async def test_authorized_schema_fetch(self) -> None:
+        '''
+        The schema request sent when connecting should be authorized
+        '''
+        client = AsyncFFLogsClient('id', 'secret', enable_caching=False)
+        schema = introspection_from_schema(build_schema('type Query { a: Int }'))
+        sent_headers = []
+
+        def refresh_token() -> None:
+            client.token = {'access_token': 'token'}
+
+        async def execute(*args, **kwargs) -> ExecutionResult:
+            sent_headers.append(dict(client._transport.headers or {}))
+            return ExecutionResult(data=schema)
+
+        transport = client._transport
+        with mock.patch.object(client, '_refresh_token', side_effect=refresh_token), \
+                mock.patch.object(transport, 'connect', mock.AsyncMock()), \
+                mock.patch.object(transport, 'close', mock.AsyncMock()), \
+                mock.patch.object(transport, 'execute', side_effect=execute):
+            await client.connect()
+            await client.close()
+
+        self.assertEqual(sent_headers, [{'Authorization': 'Bearer token'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
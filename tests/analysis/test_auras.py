@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from fflogsapi.analysis import FFLogsAuraBands, FFLogsAuraIntervals
+
+EVENTS = [
+    {'timestamp': 0, 'type': 'removebuff', 'sourceID': 1, 'targetID': 1, 'abilityGameID': 5},
+    {'timestamp': 100, 'type': 'applybuff', 'sourceID': 1, 'targetID': 1, 'abilityGameID': 7},
+    {'timestamp': 150, 'type': 'applybuff', 'sourceID': 2, 'targetID': 1, 'abilityGameID': 7},
+    {'timestamp': 200, 'type': 'removebuff', 'sourceID': 1, 'targetID': 1, 'abilityGameID': 7},
+    {'timestamp': 250, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 9},
+    {'timestamp': 300, 'type': 'removebuff', 'sourceID': 2, 'targetID': 1, 'abilityGameID': 7},
+    {'timestamp': 400, 'type': 'applydebuff', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 8},
+    {'timestamp': 500, 'type': 'applybuff', 'sourceID': 1, 'targetID': 1, 'abilityGameID': 7},
+    {'timestamp': 600, 'type': 'refreshdebuff', 'sourceID': 2, 'targetID': 10,
+     'abilityGameID': 8},
+]
+
+
+class AuraIntervalTest(unittest.TestCase):
+    '''
+    Test cases for aura intervals.
+    '''
+
+    def setUp(self) -> None:
+        self.auras = FFLogsAuraIntervals.from_events(EVENTS, start_time=-50, end_time=1000)
+
+    def test_intervals(self) -> None:
+        '''
+        Aura events should be paired into intervals per source, target and aura
+        '''
+        self.assertEqual(len(self.auras), 6)
+        self.assertEqual(sorted(self.auras.keys()), [(1, 5), (1, 7), (10, 8)])
+        np.testing.assert_array_equal(self.auras.select(ability_id=7).starts, [100, 150, 500])
+        np.testing.assert_array_equal(self.auras.select(ability_id=7).ends, [200, 300, 1000])
+
+        # removed or refreshed without being applied, so applied before logging started
+        self.assertEqual(list(self.auras.bands(1, 5)), [(-50, 0)])
+        self.assertEqual(list(self.auras.bands(10, 8, source_id=2)), [(-50, 1000)])
+        self.assertEqual(self.auras.select(kind='Debuffs').applications(), 1)
+        self.assertEqual(self.auras.applications(start_time=100, end_time=150), 2)
+
+    def test_queries(self) -> None:
+        '''
+        Overlapping intervals should be merged into bands that support time queries
+        '''
+        bands = self.auras.bands(1, 7)
+        self.assertEqual(list(bands), [(100, 300), (500, 1000)])
+
+        self.assertTrue(self.auras.active_at(100, 1, 7))
+        self.assertTrue(self.auras.active_at(250, 1, 7))
+        self.assertFalse(self.auras.active_at(300, 1, 7))
+        self.assertFalse(self.auras.active_at(50, 1, 7))
+        self.assertFalse(self.auras.active_at(250, 2, 7))
+        np.testing.assert_array_equal(
+            bands.active_mask(np.array([0, 100, 299, 300, 999, 1000])),
+            [False, True, True, False, True, False],
+        )
+
+        self.assertEqual(self.auras.uptime(1, 7), 700)
+        self.assertEqual(self.auras.uptime(1, 7, start_time=200, end_time=600), 200)
+        self.assertEqual(self.auras.uptime(1, 7, start_time=300, end_time=500), 0)
+        self.assertEqual(list(bands.overlap(250, 600)), [(250, 300), (500, 600)])
+
+    def test_merge(self) -> None:
+        '''
+        Touching and nested intervals should be merged
+        '''
+        bands = FFLogsAuraBands.merge(np.array([30, 0, 10, 60]), np.array([40, 10, 50, 70]))
+        self.assertEqual(list(bands), [(0, 50), (60, 70)])
+        self.assertEqual(bands.uptime(), 60)
@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from fflogsapi.analysis import EVENT_TYPE_CODES, FFLogsEventColumns
+from fflogsapi.constants import EventType
+
+EVENTS = [
+    {'timestamp': 100, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {
+        'timestamp': 150, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7,
+        'amount': 5000, 'hitType': 2, 'directHit': True, 'multiplier': 1.1, 'packetID': 4,
+    },
+    {'timestamp': 200, 'type': 'applybuffstack', 'sourceID': 2, 'targetID': 1, 'stack': 2},
+    {'timestamp': 250, 'type': 'heal', 'sourceID': 2, 'targetID': 1, 'amount': 300, 'overheal': 50},
+    {'timestamp': 300, 'type': 'newthing', 'sourceID': 3, 'gear': [{'id': 1}]},
+]
+
+
+class EventColumnsTest(unittest.TestCase):
+    '''
+    Test cases for columnar event storage.
+    '''
+
+    def setUp(self) -> None:
+        self.columns = FFLogsEventColumns.from_events(iter(EVENTS))
+
+    def test_dense_columns(self) -> None:
+        '''
+        Common fields should be stored in dense columns with placeholders for missing values
+        '''
+        self.assertEqual(len(self.columns), 5)
+        np.testing.assert_array_equal(self.columns['timestamp'], [100, 150, 200, 250, 300])
+        np.testing.assert_array_equal(self.columns['amount'], [0, 5000, 0, 300, 0])
+        np.testing.assert_array_equal(self.columns['target_id'], [10, 10, 1, 1, -1])
+        self.assertTrue(self.columns['direct_hit'][1])
+        self.assertTrue(np.isnan(self.columns['multiplier'][0]))
+
+    def test_types(self) -> None:
+        '''
+        Event types should be stored as codes, including unknown types
+        '''
+        damage = self.columns.of_type(EventType.DAMAGE, 'heal')
+        np.testing.assert_array_equal(damage, [False, True, False, True, False])
+        self.assertEqual(self.columns.type_code('newthing'), self.columns['type'][4])
+        self.assertEqual(
+            self.columns.type_code(EventType.HEAD_MARKER),
+            EVENT_TYPE_CODES[EventType.HEAD_MARKER.value],
+        )
+        self.assertEqual(self.columns.type_code('missing'), -1)
+
+    def test_sparse_fields(self) -> None:
+        '''
+        Rare fields should be stored in side tables
+        '''
+        self.assertNotIn('stack', self.columns.columns)
+        np.testing.assert_array_equal(self.columns.sparse('stack', fill=0), [0, 0, 2, 0, 0])
+        gear = self.columns.sparse('gear')
+        self.assertIsNone(gear[0])
+        self.assertEqual(gear[4], [{'id': 1}])
+
+    def test_select(self) -> None:
+        '''
+        Selecting events should keep the sparse fields of the selected events
+        '''
+        selected = self.columns.select(self.columns['source_id'] == 2)
+        self.assertEqual(len(selected), 2)
+        np.testing.assert_array_equal(selected.sparse('stack', fill=0), [2, 0])
+        self.assertNotIn('gear', selected.sparse_fields)
+
+    def test_to_events(self) -> None:
+        '''
+        Columns should convert back into the original events
+        '''
+        self.assertEqual(self.columns.to_events(), EVENTS)
+
+    def test_present_values(self) -> None:
+        '''
+        Real values equal to a placeholder and None values should survive a round trip
+        '''
+        events = [
+            {'timestamp': 0, 'type': 'damage', 'sourceID': 1, 'targetID': None, 'amount': 0},
+            {'timestamp': 10, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'amount': 20},
+            {'timestamp': 20, 'type': 'cast', 'sourceID': -1},
+        ]
+        columns = FFLogsEventColumns.from_events(events)
+
+        np.testing.assert_array_equal(columns['target_id'], [-1, 10, -1])
+        np.testing.assert_array_equal(columns.has('amount'), [True, True, False])
+        np.testing.assert_array_equal(columns.has('target_id'), [False, True, False])
+        np.testing.assert_array_equal(columns.has('source_id'), [True, True, True])
+        self.assertEqual(columns.to_events(), events)
+
+        selected = columns.select(np.array([0, 2]))
+        np.testing.assert_array_equal(selected.has('amount'), [True, False])
+        self.assertEqual(selected.to_events(), [events[0], events[2]])
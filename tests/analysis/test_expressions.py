@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from fflogsapi.analysis import FFLogsEventColumns, compile_expression
+from fflogsapi.data import FFLogsActor, FFLogsReportAbility
+
+ACTORS = [
+    FFLogsActor(None, 1, 'Tank', 'Player', 'Paladin', 'Server', 101, None, None),
+    FFLogsActor(None, 2, 'Healer', 'Player', 'WhiteMage', 'Server', 102, None, None),
+    FFLogsActor(None, 10, 'Boss', 'NPC', 'Boss', None, 9000, None, None),
+]
+
+ABILITIES = [
+    FFLogsReportAbility(game_id=7, name='Fast Blade', type=128),
+    FFLogsReportAbility(game_id=8, name='Cure', type=8),
+    FFLogsReportAbility(game_id=50, name='Auto Attack', type=128),
+]
+
+EVENTS = [
+    {'timestamp': 0, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {'timestamp': 10, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7,
+     'amount': 100},
+    {'timestamp': 20, 'type': 'applybuffstack', 'sourceID': 2, 'targetID': 1,
+     'abilityGameID': 99, 'stack': 2},
+    {'timestamp': 50, 'type': 'damage', 'sourceID': 10, 'targetID': 1, 'abilityGameID': 50,
+     'amount': 400},
+    {'timestamp': 60, 'type': 'heal', 'sourceID': 2, 'targetID': 1, 'abilityGameID': 8,
+     'amount': 250},
+]
+
+
+class FilterExpressionTest(unittest.TestCase):
+    '''
+    Test cases for compiling filter expressions.
+    '''
+
+    def setUp(self) -> None:
+        self.columns = FFLogsEventColumns.from_events(EVENTS)
+
+    def assertMatches(self, expression: str, expected: list[int]) -> None:
+        '''
+        Check that the expression matches the events at the expected indices, both as a predicate
+        and as a mask.
+        '''
+        compiled = compile_expression(expression, actors=ACTORS, abilities=ABILITIES)
+        matched = [idx for idx, event in enumerate(EVENTS) if compiled(event)]
+        self.assertEqual(matched, expected, expression)
+        self.assertEqual(list(compiled.filter(EVENTS)), [EVENTS[idx] for idx in expected])
+        self.assertEqual(np.flatnonzero(compiled.mask(self.columns)).tolist(), expected, expression)
+
+    def test_comparisons(self) -> None:
+        '''
+        Fields should be comparable to values
+        '''
+        self.assertMatches('type = "damage"', [1, 3])
+        self.assertMatches("type != 'damage'", [0, 2, 4])
+        self.assertMatches('amount > 100', [3, 4])
+        self.assertMatches('ability.id = 7', [0, 1])
+        self.assertMatches('stack >= 2', [2])
+        self.assertMatches('stack != 2', [0, 1, 3, 4])
+        # events without an amount must not match its placeholder
+        self.assertMatches('amount < 200', [1])
+        self.assertMatches('amount != 100', [0, 2, 3, 4])
+        self.assertMatches('amount in (0, 100)', [1])
+
+    def test_lists_and_windows(self) -> None:
+        '''
+        IN lists and BETWEEN time windows should be supported
+        '''
+        self.assertMatches('type in ("damage", "heal")', [1, 3, 4])
+        self.assertMatches('source.id not in (1, 2)', [3])
+        self.assertMatches('timestamp between 10 and 50', [1, 2, 3])
+
+    def test_boolean_operators(self) -> None:
+        '''
+        Boolean operators should combine comparisons with the usual precedence
+        '''
+        self.assertMatches('type = "damage" and source.id = 1 or type = "heal"', [1, 4])
+        self.assertMatches('type = "damage" AND (source.id = 1 OR source.id = 10)', [1, 3])
+        self.assertMatches('not type = "cast" && timestamp < 50', [1, 2])
+        self.assertMatches('!(type = "cast") || amount = 400', [1, 2, 3, 4])
+
+    def test_actor_and_ability_fields(self) -> None:
+        '''
+        Actor and ability fields should be looked up by name and type
+        '''
+        self.assertMatches('source.name = "tank"', [0, 1])
+        self.assertMatches('target.type = "NPC"', [0, 1])
+        self.assertMatches('source.subType in ("WhiteMage", "Boss")', [2, 3, 4])
+        self.assertMatches('ability.name = "Cure"', [4])
+        self.assertMatches('ability.name != "Cure" and type = "damage"', [1, 3])
+
+    def test_invalid(self) -> None:
+        '''
+        Invalid expressions should raise an error
+        '''
+        for expression in ('type =', 'type = "damage" and', '(type = "cast"', 'type ~ 1',
+                           'source.name > "a"', 'type not = "cast"'):
+            with self.assertRaises(ValueError, msg=expression):
+                compile_expression(expression)
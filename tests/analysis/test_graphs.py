@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from fflogsapi.analysis import FFLogsEventColumns, build_graph
+
+EVENTS = [
+    {'timestamp': 0, 'type': 'damage', 'sourceID': 1, 'abilityGameID': 7, 'amount': 1000},
+    {'timestamp': 500, 'type': 'damage', 'sourceID': 2, 'abilityGameID': 8, 'amount': 2000},
+    {'timestamp': 1500, 'type': 'damage', 'sourceID': 1, 'abilityGameID': 7, 'amount': 500,
+     'absorbed': 500},
+    {'timestamp': 1800, 'type': 'heal', 'sourceID': 2, 'abilityGameID': 9, 'amount': 300},
+    {'timestamp': 3000, 'type': 'damage', 'sourceID': 2, 'abilityGameID': 8, 'amount': 4000},
+]
+
+
+class GraphTest(unittest.TestCase):
+    '''
+    Test cases for computing graphs locally.
+    '''
+
+    def setUp(self) -> None:
+        self.columns = FFLogsEventColumns.from_events(EVENTS)
+
+    def test_damage_done(self) -> None:
+        '''
+        Damage should be binned per source
+        '''
+        graph = build_graph(self.columns, interval=1000)
+        np.testing.assert_array_equal(graph.timestamps, [0, 1000, 2000])
+        np.testing.assert_array_equal(graph.keys, [1, 2])
+        np.testing.assert_array_equal(graph.series(1), [1000, 1000, 0])
+        # the last event is on the end of the graph and lands in the last bin
+        np.testing.assert_array_equal(graph.series(2), [2000, 0, 4000])
+        np.testing.assert_array_equal(graph.total(), [3000, 1000, 4000])
+        np.testing.assert_array_equal(graph.cumulative()[0], [1000, 1000, 2000 / 3])
+
+        with self.assertRaises(KeyError):
+            graph.series(3)
+
+    def test_resolution(self) -> None:
+        '''
+        Graphs should support different resolutions, resampling and a single series
+        '''
+        graph = build_graph(self.columns, interval=500, group_by=None)
+        np.testing.assert_array_equal(graph.total(), [2000, 4000, 0, 2000, 0, 8000])
+
+        resampled = graph.resample(4)
+        self.assertEqual(resampled.interval, 2000)
+        np.testing.assert_array_equal(resampled.totals[0], [4000, 4000])
+
+    def test_group_by_ability(self) -> None:
+        '''
+        Graphs should be able to split series by ability, and graph healing
+        '''
+        graph = build_graph(self.columns, data_type='Healing', group_by='ability_id')
+        np.testing.assert_array_equal(graph.keys, [9])
+        np.testing.assert_array_equal(graph.series(9), [0, 300, 0])
+
+        with self.assertRaises(ValueError):
+            build_graph(self.columns, data_type='Threat')
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from fflogsapi.analysis import FFLogsEventIndex
+from fflogsapi.constants import EventType
+
+EVENTS = [
+    {'timestamp': 0, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {'timestamp': 100, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {'timestamp': 200, 'type': 'cast', 'sourceID': 2, 'targetID': 10, 'abilityGameID': 8},
+    {'timestamp': 300, 'type': 'cast', 'sourceID': 1, 'targetID': 11, 'abilityGameID': 9},
+    {'timestamp': 300, 'type': 'damage', 'sourceID': 2, 'targetID': 10, 'abilityGameID': 8},
+    {'timestamp': 400, 'type': 'encounterend'},
+    {'timestamp': 500, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+]
+
+
+class EventIndexTest(unittest.TestCase):
+    '''
+    Test cases for indexed fight events.
+    '''
+
+    def setUp(self) -> None:
+        self.index = FFLogsEventIndex(EVENTS)
+
+    def test_lookup(self) -> None:
+        '''
+        Events should be found by any combination of the indexed fields
+        '''
+        self.assertEqual(len(self.index), len(EVENTS))
+        np.testing.assert_array_equal(self.index.offsets(source_id=1), [0, 1, 3, 6])
+        np.testing.assert_array_equal(
+            self.index.offsets(source_id=1, type=EventType.CAST), [0, 3, 6],
+        )
+        self.assertEqual(
+            self.index.find(source_id=1, target_id=10, ability_id=7, type='cast'),
+            [EVENTS[0], EVENTS[6]],
+        )
+        self.assertEqual(self.index.count(type='encounterend'), 1)
+        self.assertEqual(self.index.count(source_id=3), 0)
+        self.assertEqual(self.index.count(source_id=2, ability_id=7), 0)
+        self.assertEqual(sorted(self.index.values('source_id')), [1, 2])
+
+    def test_time_window(self) -> None:
+        '''
+        Time windows should include events on both of their bounds
+        '''
+        np.testing.assert_array_equal(self.index.offsets(start_time=300), [3, 4, 5, 6])
+        np.testing.assert_array_equal(
+            self.index.offsets(start_time=100, end_time=300), [1, 2, 3, 4],
+        )
+        np.testing.assert_array_equal(
+            self.index.offsets(source_id=1, type='cast', end_time=300), [0, 3],
+        )
+        self.assertEqual(self.index.count(start_time=600), 0)
+        self.assertEqual(self.index.count(), len(EVENTS))
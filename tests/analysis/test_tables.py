@@ -0,0 +1,114 @@
+import unittest
+
+from fflogsapi.analysis import FFLogsTableEngine
+from fflogsapi.data import FFLogsActor, FFLogsReportAbility
+from fflogsapi.util.gql_enums import GQLEnum
+
+ACTORS = [
+    FFLogsActor(None, 1, 'Tank', 'Player', 'Paladin', 'Server', 101, None, None),
+    FFLogsActor(None, 2, 'Healer', 'Player', 'WhiteMage', 'Server', 102, None, None),
+    FFLogsActor(None, 10, 'Boss', 'NPC', 'Boss', None, 9000, None, None),
+]
+
+ABILITIES = [
+    FFLogsReportAbility(game_id=7, name='Fast Blade', type=128),
+    FFLogsReportAbility(game_id=8, name='Cure', type=8),
+    FFLogsReportAbility(game_id=1000049, name='Medicated', type=1),
+    FFLogsReportAbility(game_id=50, name='Auto Attack', type=128),
+]
+
+EVENTS = [
+    {'timestamp': 0, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {'timestamp': 10, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7,
+     'amount': 100},
+    {'timestamp': 20, 'type': 'applybuff', 'sourceID': 1, 'targetID': 1,
+     'abilityGameID': 1000049},
+    {'timestamp': 30, 'type': 'cast', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7},
+    {'timestamp': 40, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7,
+     'amount': 300},
+    {'timestamp': 50, 'type': 'damage', 'sourceID': 10, 'targetID': 1, 'abilityGameID': 50,
+     'amount': 400, 'absorbed': 100},
+    {'timestamp': 60, 'type': 'heal', 'sourceID': 2, 'targetID': 1, 'abilityGameID': 8,
+     'amount': 250, 'overheal': 50},
+    {'timestamp': 70, 'type': 'removebuff', 'sourceID': 1, 'targetID': 1,
+     'abilityGameID': 1000049},
+    {'timestamp': 80, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'abilityGameID': 7,
+     'amount': 50},
+]
+
+
+class TableEngineTest(unittest.TestCase):
+    '''
+    Test cases for computing tables locally.
+    '''
+
+    def setUp(self) -> None:
+        self.engine = FFLogsTableEngine(
+            EVENTS, actors=ACTORS, abilities=ABILITIES, start_time=0, end_time=100,
+        )
+
+    def test_damage_done(self) -> None:
+        '''
+        Damage done should be totalled per source, ability and target
+        '''
+        table = self.engine.table({'dataType': GQLEnum('DamageDone')})
+        self.assertEqual(table['totalTime'], 100)
+
+        boss, tank = table['entries']
+        self.assertEqual(tank['name'], 'Tank')
+        self.assertEqual(tank['type'], 'Paladin')
+        self.assertEqual(tank['total'], 450)
+        self.assertEqual(tank['hitCount'], 3)
+        self.assertEqual(tank['abilities'][0]['name'], 'Fast Blade')
+        self.assertEqual(tank['targets'][0]['id'], 10)
+        # absorbed damage counts as damage done
+        self.assertEqual(boss['total'], 500)
+
+    def test_summary_with_auras(self) -> None:
+        '''
+        Aura filters should only count events while the aura is active
+        '''
+        table = self.engine.table({'sourceAurasPresent': 'Medicated'})
+        self.assertEqual(table['damageDone'], [
+            {'name': 'Tank', 'id': 1, 'guid': 101, 'type': 'Paladin', 'icon': 'Paladin',
+             'total': 300},
+        ])
+
+        table = self.engine.table({'sourceAurasAbsent': '1000049', 'sourceID': 1})
+        self.assertEqual(table['damageDone'][0]['total'], 150)
+
+    def test_filters(self) -> None:
+        '''
+        Time, actor and ability filters should limit the events used in tables
+        '''
+        casts = self.engine.table({'dataType': 'Casts', 'startTime': 20})
+        self.assertEqual(casts['totalTime'], 80)
+        self.assertEqual(casts['entries'][0]['total'], 1)
+
+        taken = self.engine.table({'dataType': 'DamageTaken', 'targetID': 1})
+        self.assertEqual(len(taken['entries']), 1)
+        self.assertEqual(taken['entries'][0]['sources'][0]['name'], 'Boss')
+
+        healing = self.engine.table({'dataType': 'Healing', 'abilityID': 8})
+        self.assertEqual(healing['entries'][0]['total'], 250)
+
+    def test_buffs(self) -> None:
+        '''
+        Buff tables should contain the uptime of each aura
+        '''
+        buffs = self.engine.table({'dataType': 'Buffs', 'startTime': 30})
+        self.assertEqual(len(buffs['auras']), 1)
+        medicated = buffs['auras'][0]
+        self.assertEqual(medicated['name'], 'Medicated')
+        self.assertEqual(medicated['totalUptime'], 40)
+        self.assertEqual(medicated['totalUses'], 0)
+        self.assertEqual(medicated['bands'], [{'startTime': 30, 'endTime': 70}])
+
+    def test_unsupported(self) -> None:
+        '''
+        Unsupported filters and data types should raise an error
+        '''
+        with self.assertRaises(ValueError):
+            self.engine.table({'hostilityType': GQLEnum('Enemies')})
+        with self.assertRaises(ValueError):
+            self.engine.table({'dataType': 'Threat'})
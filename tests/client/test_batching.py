@@ -0,0 +1,147 @@
+import unittest
+from unittest import mock
+
+from gql.transport.exceptions import TransportQueryError
+
+from fflogsapi.client import FFLogsClient
+from fflogsapi.reports.queries import Q_FIGHT_DATA, Q_REPORT_DATA
+from fflogsapi.util.batching import merge_queries, split_result
+
+from ..config import CACHE_EXPIRY, CLIENT_ID, CLIENT_SECRET
+
+
+class QueryMergeTest(unittest.TestCase):
+    '''
+    Test cases for merging multiple queries into a single aliased query document.
+    '''
+
+    def test_merge_and_split(self) -> None:
+        '''
+        Merged queries should alias each root field uniquely, and results should split back
+        into the results of the individual queries.
+        '''
+        merged = merge_queries([
+            Q_REPORT_DATA.format(reportCode='abc', innerQuery='title'),
+            Q_FIGHT_DATA.format(reportCode='abc', fightID=1, innerQuery='name'),
+        ])
+
+        self.assertIn('q0_reportData: reportData', merged)
+        self.assertIn('q1_reportData: reportData', merged)
+
+        results = split_result({
+            'q0_reportData': {'report': {'title': 'A'}},
+            'q1_reportData': {'report': {'fights': [{'name': 'B'}]}},
+        }, 2)
+        self.assertEqual(results[0], {'reportData': {'report': {'title': 'A'}}})
+        self.assertEqual(results[1], {'reportData': {'report': {'fights': [{'name': 'B'}]}}})
+
+    def test_unmergeable(self) -> None:
+        '''
+        Queries that can not be merged safely should be rejected.
+        '''
+        with self.assertRaises(ValueError):
+            merge_queries(['mutation { doThing { id } }'])
+        with self.assertRaises(ValueError):
+            merge_queries(['query ($code: String) { reportData { report(code: $code) { id } } }'])
+
+
+class BatchFallbackTest(unittest.TestCase):
+    '''
+    Test cases for failing merged batch requests.
+    '''
+
+    QUERIES = [
+        Q_REPORT_DATA.format(reportCode='abc', innerQuery='title'),
+        Q_REPORT_DATA.format(reportCode='def', innerQuery='title'),
+    ]
+
+    def setUp(self) -> None:
+        self.client = FFLogsClient('id', 'secret', enable_caching=False)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_query_error(self) -> None:
+        '''
+        A GraphQL error in a merged request should retry the queries one by one
+        '''
+        def execute(query: str) -> dict:
+            if 'q0_reportData' in query:
+                raise TransportQueryError('invalid query')
+            return {'reportData': {'report': {'title': 'A'}}}
+
+        with mock.patch.object(self.client, '_execute', side_effect=execute) as executed:
+            with self.client.batch() as batch:
+                handles = [batch.q(query) for query in self.QUERIES]
+
+        self.assertEqual(executed.call_count, 3)
+        for handle in handles:
+            self.assertEqual(handle.result()['reportData']['report']['title'], 'A')
+
+    def test_transport_error(self) -> None:
+        '''
+        Other errors of a merged request should be raised without retrying the queries
+        '''
+        error = ConnectionError('no connection')
+        with mock.patch.object(self.client, '_execute', side_effect=error) as executed:
+            with self.assertRaises(ConnectionError):
+                with self.client.batch() as batch:
+                    for query in self.QUERIES:
+                        batch.q(query)
+
+        self.assertEqual(executed.call_count, 1)
+
+
+class BatchTest(unittest.TestCase):
+    '''
+    Test cases for batched query execution.
+
+    This test case makes assumptions on the availability of a specific report.
+    If the tests break, it may be because visibility settings
+    were changed or the report was deleted.
+    '''
+
+    SPECIFIC_REPORT_CODE = '2Kf9y6wzanWkBJ41'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = FFLogsClient(CLIENT_ID, CLIENT_SECRET, cache_expiry=CACHE_EXPIRY)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.close()
+        cls.client.save_cache()
+
+    def test_batch_fetch(self) -> None:
+        '''
+        Fields fetched in a batch should be available on the objects without further queries.
+        '''
+        report = self.client.get_report(code=self.SPECIFIC_REPORT_CODE)
+        fights = report.fights()
+
+        with self.client.batch(ignore_cache=True) as batch:
+            batch.fetch(report, 'title')
+            for fight in fights:
+                batch.fetch(fight, 'name', 'kill')
+
+        self.assertEqual(report._data['title'], 'Abyssos')
+        for fight in fights:
+            self.assertIn('name', fight._data)
+            self.assertIn('kill', fight._data)
+
+    def test_batch_results(self) -> None:
+        '''
+        Raw queries added to a batch should give the same result as executing them directly.
+        '''
+        query = Q_REPORT_DATA.format(reportCode=self.SPECIFIC_REPORT_CODE, innerQuery='title')
+        with self.client.batch() as batch:
+            handle = batch.q(query)
+            self.assertFalse(handle.done)
+            with self.assertRaises(RuntimeError):
+                handle.result()
+
+        self.assertEqual(handle.result(), self.client.q(query))
+
+
+if __name__ == '__main__':
+    unittest.main()
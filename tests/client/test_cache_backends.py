@@ -0,0 +1,215 @@
+import os
+import tempfile
+import unittest
+from time import time
+from unittest import mock
+
+from fflogsapi.cache import (BoundedMemoryCacheBackend, MemoryCacheBackend, SQLiteCacheBackend,
+                             TieredCacheBackend,)
+
+
+class MemoryCacheBackendTest(unittest.TestCase):
+    '''
+    Test cases for the in-memory query cache backend.
+    '''
+
+    def make_backend(self):
+        return MemoryCacheBackend()
+
+    def setUp(self) -> None:
+        self.backend = self.make_backend()
+
+    def tearDown(self) -> None:
+        self.backend.close()
+
+    def test_set_get_delete(self) -> None:
+        '''
+        The backend should store, return and delete entries.
+        '''
+        result = {'reportData': {'report': {'title': 'Abyssos'}}}
+        self.backend.set('query', result, time() + 10)
+
+        self.assertEqual(len(self.backend), 1)
+        self.assertIn('query', self.backend)
+        self.assertEqual(self.backend.get('query')[1], result)
+
+        self.backend.delete('query')
+        self.assertIsNone(self.backend.get('query'))
+        self.assertEqual(len(self.backend), 0)
+
+    def test_expire(self) -> None:
+        '''
+        The backend should keep expired entries until they are explicitly expired.
+        '''
+        now = time()
+        self.backend.set('expired', 1, now - 10)
+        self.backend.set('fresh', 2, now + 10)
+
+        self.assertIsNotNone(self.backend.get('expired'))
+        self.assertEqual(self.backend.expire(now), 1)
+        self.assertIsNone(self.backend.get('expired'))
+        self.assertEqual(self.backend.get('fresh')[1], 2)
+
+    def test_extend_and_iterate(self) -> None:
+        '''
+        The backend should be able to extend the lifetime of all entries.
+        '''
+        now = time()
+        self.backend.set('a', 1, now + 100)
+        self.backend.set('b', 2, now + 200)
+        self.backend.extend(5)
+
+        entries = sorted(self.backend.iterate())
+        self.assertEqual(entries, [('a', now + 105, 1), ('b', now + 205, 2)])
+
+
+class SQLiteCacheBackendTest(MemoryCacheBackendTest):
+    '''
+    Test cases for the SQLite query cache backend.
+    '''
+
+    def make_backend(self):
+        self.directory = tempfile.TemporaryDirectory()
+        return SQLiteCacheBackend(os.path.join(self.directory.name, 'cache.sqlite3'))
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_persistence(self) -> None:
+        '''
+        Entries should be available to other backends using the same database without saving.
+        '''
+        self.backend.set('query', {'a': [1, 2]}, time() + 10)
+
+        other = SQLiteCacheBackend(self.backend.path)
+        self.assertEqual(other.get('query')[1], {'a': [1, 2]})
+        other.close()
+
+
+class BoundedMemoryCacheBackendTest(MemoryCacheBackendTest):
+    '''
+    Test cases for the bounded in-memory query cache backend.
+    '''
+
+    def make_backend(self):
+        return BoundedMemoryCacheBackend()
+
+    def test_lru_eviction(self) -> None:
+        '''
+        The least recently used entries should be evicted when the entry budget is exceeded.
+        '''
+        backend = BoundedMemoryCacheBackend(max_entries=2, policy='lru')
+        expiry = time() + 10
+        backend.set('a', 1, expiry)
+        backend.set('b', 2, expiry)
+        backend.get('a')
+        backend.set('c', 3, expiry)
+
+        self.assertEqual(len(backend), 2)
+        self.assertIsNone(backend.get('b'))
+        self.assertIsNotNone(backend.get('a'))
+        self.assertIsNotNone(backend.get('c'))
+
+    def test_lfu_eviction(self) -> None:
+        '''
+        The least frequently used entries should be evicted when the entry budget is exceeded.
+        '''
+        backend = BoundedMemoryCacheBackend(max_entries=2, policy='lfu')
+        expiry = time() + 10
+        backend.set('a', 1, expiry)
+        backend.set('b', 2, expiry)
+        for _ in range(3):
+            backend.get('a')
+        backend.get('b')
+        backend.set('c', 3, expiry)
+        backend.get('c')
+        backend.get('c')
+        backend.set('d', 4, expiry)
+
+        self.assertIsNotNone(backend.get('a'))
+        self.assertIsNone(backend.get('b'))
+
+    def test_byte_budget(self) -> None:
+        '''
+        The cache should never hold more bytes than its budget.
+        '''
+        backend = BoundedMemoryCacheBackend(max_bytes=2048)
+        expiry = time() + 10
+        for i in range(100):
+            backend.set(str(i), 'x' * 100, expiry)
+            self.assertLessEqual(backend.size_bytes, 2048)
+
+        self.assertGreater(len(backend), 0)
+        self.assertLess(len(backend), 100)
+
+        # results larger than the budget are not stored at all
+        backend.set('huge', 'x' * 4096, expiry)
+        self.assertIsNone(backend.get('huge'))
+
+    def test_no_byte_budget(self) -> None:
+        '''
+        Results should not be measured without a byte budget.
+        '''
+        backend = BoundedMemoryCacheBackend(max_entries=2)
+        with mock.patch('fflogsapi.cache.bounded.pickle.dumps') as dumps:
+            backend.set('a', 'x' * 4096, time() + 10)
+
+        dumps.assert_not_called()
+        self.assertEqual(backend.size_bytes, 0)
+        self.assertIsNotNone(backend.get('a'))
+
+    def test_proactive_expiry(self) -> None:
+        '''
+        Expired entries should be evicted when any entry is accessed.
+        '''
+        backend = BoundedMemoryCacheBackend()
+        backend.set('expired', 1, time() - 1)
+        backend.set('fresh', 2, time() + 10)
+        backend.get('fresh')
+        self.assertEqual(len(backend), 1)
+
+    def test_invalid_policy(self) -> None:
+        '''
+        Invalid eviction policies should be rejected.
+        '''
+        with self.assertRaises(ValueError):
+            BoundedMemoryCacheBackend(policy='fifo')
+
+    def test_expire(self) -> None:
+        '''
+        The bounded backend evicts expired entries as soon as it is accessed.
+        '''
+        now = time()
+        self.backend.set('expired', 1, now - 10)
+        self.backend.set('fresh', 2, now + 10)
+
+        self.assertIsNone(self.backend.get('expired'))
+        self.assertEqual(self.backend.expire(now), 0)
+        self.assertEqual(self.backend.get('fresh')[1], 2)
+
+
+class TieredCacheBackendTest(MemoryCacheBackendTest):
+    '''
+    Test cases for the two-level query cache backend.
+    '''
+
+    def make_backend(self):
+        return TieredCacheBackend(BoundedMemoryCacheBackend(max_entries=1), MemoryCacheBackend())
+
+    def test_promotion(self) -> None:
+        '''
+        Entries evicted from the first level should still be served by the second level,
+        and be promoted back into the first level.
+        '''
+        expiry = time() + 10
+        self.backend.set('a', 1, expiry)
+        self.backend.set('b', 2, expiry)
+
+        self.assertIsNone(self.backend.l1.get('a'))
+        self.assertEqual(self.backend.get('a')[1], 1)
+        self.assertEqual(self.backend.l1.get('a')[1], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
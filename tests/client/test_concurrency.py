@@ -0,0 +1,81 @@
+import threading
+import unittest
+from time import sleep
+from unittest import mock
+
+from fflogsapi.client import FFLogsClient
+from fflogsapi.reports.queries import Q_REPORT_DATA
+
+from ..config import CACHE_EXPIRY, CLIENT_ID, CLIENT_SECRET
+
+
+class TokenRefreshTest(unittest.TestCase):
+    '''
+    Test cases for sharing a client between threads.
+    '''
+
+    def test_single_refresh(self) -> None:
+        '''
+        Threads failing with the same stale token should only refresh it once
+        '''
+        client = FFLogsClient('id', 'secret', enable_caching=False)
+        refreshes = []
+
+        def refresh_token() -> None:
+            sleep(0.05)
+            refreshes.append(threading.get_ident())
+            client.token = {'access_token': f'token{len(refreshes)}'}
+
+        session = mock.Mock()
+        session.execute.side_effect = lambda document, extra_args: extra_args['headers']
+        try:
+            with mock.patch.object(client, '_refresh_token', side_effect=refresh_token), \
+                    mock.patch.object(client._gql_client, 'connect_sync', return_value=session):
+                results = client.execute_many(
+                    [f'query {{ a{i} }}' for i in range(8)],
+                    max_workers=8,
+                )
+        finally:
+            client.close()
+
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(results, [{'Authorization': 'Bearer token1'}] * 8)
+
+
+class ExecuteManyTest(unittest.TestCase):
+    '''
+    Test cases for executing queries in parallel.
+
+    This test case makes assumptions on the availability of a specific report.
+    If the tests break, it may be because visibility settings
+    were changed or the report was deleted.
+    '''
+
+    SPECIFIC_REPORT_CODE = '2Kf9y6wzanWkBJ41'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = FFLogsClient(CLIENT_ID, CLIENT_SECRET, cache_expiry=CACHE_EXPIRY)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.close()
+        cls.client.save_cache()
+
+    def test_execute_many(self) -> None:
+        '''
+        Queries executed in parallel should give the same results as executing them directly,
+        in order.
+        '''
+        queries = [
+            Q_REPORT_DATA.format(reportCode=self.SPECIFIC_REPORT_CODE, innerQuery=field)
+            for field in ('title', 'startTime', 'endTime', 'code')
+        ]
+        results = self.client.execute_many(queries, max_workers=4, ignore_cache=True)
+
+        self.assertEqual(results, [self.client.q(query) for query in queries])
+        self.assertEqual(results[0]['reportData']['report']['title'], 'Abyssos')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+from unittest import mock
+
+from fflogsapi.client import FFLogsClient
+from fflogsapi.ratelimit import FFLogsRateLimiter, is_low_priority
+
+
+class RateLimiterTest(unittest.TestCase):
+    '''
+    Test cases for rate limit aware request scheduling.
+    '''
+
+    def test_validation(self) -> None:
+        '''
+        The rate limiter should reject invalid settings
+        '''
+        with self.assertRaises(ValueError):
+            FFLogsRateLimiter(low_priority_reserve=1.0)
+        with self.assertRaises(ValueError):
+            FFLogsRateLimiter(sync_interval=0)
+        with self.assertRaises(ValueError):
+            FFLogsRateLimiter(burst=0)
+
+    def test_reserve(self) -> None:
+        '''
+        Requests should be let through until the hourly budget runs out
+        '''
+        limiter = FFLogsRateLimiter(initial_cost=4.0, burst=1.0)
+        self.assertTrue(limiter.needs_sync())
+        self.assertIsNone(limiter.remaining())
+
+        limiter.update(limit_per_hour=10, spent=0, reset_in=60)
+        self.assertFalse(limiter.needs_sync())
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.remaining(), 2)
+
+        delay = limiter.reserve()
+        self.assertGreater(delay, 59)
+        self.assertLessEqual(delay, 60 + limiter.RESET_MARGIN)
+
+    def test_low_priority_reserve(self) -> None:
+        '''
+        Low priority requests should leave the reserve untouched
+        '''
+        limiter = FFLogsRateLimiter(low_priority_reserve=0.5, initial_cost=1.0, burst=1.0)
+        limiter.update(limit_per_hour=10, spent=4, reset_in=60)
+
+        self.assertEqual(limiter.reserve(low_priority=True), 0)
+        self.assertGreater(limiter.reserve(low_priority=True), 0)
+        self.assertEqual(limiter.reserve(), 0)
+
+    @mock.patch('fflogsapi.ratelimit.monotonic', return_value=0.0)
+    def test_refill(self, clock: mock.Mock) -> None:
+        '''
+        Requests should be spaced out to the refill rate once the burst has been spent
+        '''
+        limiter = FFLogsRateLimiter(initial_cost=4.0, burst=0.01)
+        limiter.update(limit_per_hour=3600, spent=0, reset_in=3600)
+
+        for _ in range(9):
+            self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 4)
+
+        clock.return_value = 2.0
+        self.assertEqual(limiter.reserve(), 2)
+        clock.return_value = 4.0
+        self.assertEqual(limiter.reserve(), 0)
+
+    @mock.patch('fflogsapi.ratelimit.monotonic', return_value=0.0)
+    def test_underestimated_cost(self, clock: mock.Mock) -> None:
+        '''
+        Points spent beyond the estimated cost should be paid back by waiting, not overspent
+        '''
+        limiter = FFLogsRateLimiter(initial_cost=1.0, burst=0.01, sync_interval=5)
+        limiter.update(limit_per_hour=3600, spent=0, reset_in=3600)
+        actual_cost = 4
+        spent = 0
+
+        for request in range(1, 201):
+            while (delay := limiter.reserve()) > 0:
+                clock.return_value += delay
+            spent += actual_cost
+            if request % limiter.sync_interval == 0:
+                limiter.update(
+                    limit_per_hour=3600, spent=spent, reset_in=3600 - clock.return_value,
+                )
+
+            # the burst, the refill of 1 point per second and the requests made before the
+            # underestimate is noticed in the next sync
+            allowance = 36 + clock.return_value + limiter.sync_interval * actual_cost
+            self.assertLessEqual(spent, allowance)
+
+        self.assertGreater(limiter.cost, 3)
+
+    def test_cost_estimate(self) -> None:
+        '''
+        The estimated cost of a request should follow the observed point usage
+        '''
+        limiter = FFLogsRateLimiter(initial_cost=1.0)
+        limiter.update(limit_per_hour=100, spent=0, reset_in=60)
+        for _ in range(2):
+            limiter.reserve()
+
+        limiter.update(limit_per_hour=100, spent=6, reset_in=50)
+        self.assertEqual(limiter.cost, 2.0)
+        self.assertEqual(limiter.spent, 6)
+
+    def test_client(self) -> None:
+        '''
+        Clients should read the point usage before their first request and pass on the priority
+        '''
+        usage = {'rateLimitData': {
+            'limitPerHour': 3600, 'pointsSpentThisHour': 0, 'pointsResetIn': 60,
+        }}
+        priorities = []
+
+        def send(query: str) -> dict:
+            if query == FFLogsClient.Q_RATE_LIMIT_USAGE:
+                return usage
+            priorities.append(is_low_priority())
+            return {'a': 1}
+
+        client = FFLogsClient(
+            'id', 'secret', enable_caching=False, rate_limiter=FFLogsRateLimiter(),
+        )
+        try:
+            with mock.patch.object(client, '_send', side_effect=send) as sent:
+                client.q('query { a }')
+                with client.low_priority():
+                    client.q('query { a }')
+
+            self.assertEqual(sent.call_args_list[0].args, (FFLogsClient.Q_RATE_LIMIT_USAGE,))
+            self.assertEqual(sent.call_count, 3)
+            self.assertEqual(priorities, [False, True])
+            self.assertEqual(client.rate_limit_remaining(), 3598)
+        finally:
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import pickle
+import unittest
+
+from fflogsapi.client import FFLogsClient
+from fflogsapi.util import FrozenDict, FrozenList, freeze, thaw
+
+from ..config import CACHE_EXPIRY, CLIENT_ID, CLIENT_SECRET
+
+
+class FrozenResultTest(unittest.TestCase):
+    '''
+    Test cases for read-only query results.
+    '''
+
+    RESULT = {'reportData': {'report': {'events': {'data': [{'type': 'cast', 'amount': 1}]}}}}
+
+    def test_read_only(self) -> None:
+        '''
+        Frozen results should be readable like regular results, but not modifiable.
+        '''
+        frozen = freeze(self.RESULT)
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertEqual(frozen, self.RESULT)
+
+        events = frozen['reportData']['report']['events']['data']
+        self.assertIsInstance(events, FrozenList)
+        self.assertEqual(events[0]['type'], 'cast')
+
+        with self.assertRaises(TypeError):
+            frozen['reportData'] = None
+        with self.assertRaises(TypeError):
+            events.append({})
+        with self.assertRaises(TypeError):
+            events[0]['amount'] += 1
+
+    def test_thaw(self) -> None:
+        '''
+        Thawing a frozen result should give a mutable deep copy.
+        '''
+        frozen = freeze(self.RESULT)
+        thawed = thaw(frozen)
+        self.assertNotIsInstance(thawed, FrozenDict)
+        self.assertEqual(thawed, self.RESULT)
+
+        thawed['reportData']['report']['events']['data'].append({})
+        self.assertEqual(len(frozen['reportData']['report']['events']['data']), 1)
+
+    def test_pickle(self) -> None:
+        '''
+        Frozen results should survive being pickled, e.g. when saving the query cache.
+        '''
+        frozen = freeze(self.RESULT)
+        unpickled = pickle.loads(pickle.dumps(frozen))
+        self.assertIsInstance(unpickled, FrozenDict)
+        self.assertIsInstance(unpickled['reportData']['report']['events']['data'], FrozenList)
+        self.assertEqual(unpickled, self.RESULT)
+
+
+class ZeroCopyTest(unittest.TestCase):
+    '''
+    Test cases for the client's zero-copy mode.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = FFLogsClient(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            cache_expiry=CACHE_EXPIRY,
+            copy_results=False,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.close()
+        cls.client.save_cache()
+
+    def test_shared_results(self) -> None:
+        '''
+        Repeated queries should return the same read-only result without copying it.
+        '''
+        query = 'query { worldData { expansion(id: 1) { name } } }'
+        first = self.client.q(query)
+        second = self.client.q(query)
+
+        self.assertIs(first, second)
+        self.assertIsInstance(first, FrozenDict)
+        with self.assertRaises(TypeError):
+            first['worldData'] = None
+
+
+if __name__ == '__main__':
+    unittest.main()
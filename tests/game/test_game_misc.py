@@ -63,6 +63,11 @@ class GameItemTest(unittest.TestCase):
         job_names = [job.name for job in jobs]
         self.assertListEqual(sorted(job_names), sorted(all_jobs))
 
+        self.assertEqual(self.client.job('RedMage'), rdm)
+        self.assertEqual(self.client.job(14), rdm)
+        self.assertEqual(self.client.jobs_by_slug()['RedMage'], rdm)
+        self.assertIsNone(self.client.job('Gladiator'))
+
     def test_grand_companies(self) -> None:
         '''
         The client should be able to get a list of all grand companies.
@@ -71,6 +76,7 @@ class GameItemTest(unittest.TestCase):
         all_gcs = ['Order of the Twin Adder', 'The Immortal Flames', 'The Maelstrom']
         gc_names = [gc.name for gc in gcs]
         self.assertListEqual(sorted(all_gcs), sorted(gc_names))
+        self.assertEqual(self.client.grand_company(gcs[0].id), gcs[0])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,47 @@
+import unittest
+
+from fflogsapi.data import FFGrandCompany, FFItem, FFJob
+from fflogsapi.game import FFGameDataRegistry
+
+
+class GameDataRegistryTest(unittest.TestCase):
+    '''
+    Test cases for the game data registry.
+    '''
+
+    def setUp(self) -> None:
+        self.registry = FFGameDataRegistry()
+
+    def test_jobs(self) -> None:
+        '''
+        Jobs should be looked up by slug and ID once they are stored
+        '''
+        self.assertIsNone(self.registry.jobs())
+        self.assertIsNone(self.registry.job('RedMage'))
+
+        rdm = FFJob(id=14, name='Red Mage', slug='RedMage')
+        sge = FFJob(id=20, name='Sage', slug='Sage')
+        self.registry.set_jobs([rdm, sge])
+
+        self.assertEqual(self.registry.jobs(), [rdm, sge])
+        self.assertIs(self.registry.job('RedMage'), rdm)
+        self.assertIs(self.registry.job(20), sge)
+        self.assertEqual(dict(self.registry.jobs_by_slug()), {'RedMage': rdm, 'Sage': sge})
+        with self.assertRaises(TypeError):
+            self.registry.jobs_by_slug()['Viper'] = rdm
+
+    def test_objects(self) -> None:
+        '''
+        Stored game objects should be looked up by ID until the registry is cleared
+        '''
+        item = FFItem(id=2134, name='Item', icon='033000-033017.png')
+        self.registry.add_items([item])
+        self.registry.set_grand_companies([FFGrandCompany(id=1, name='The Maelstrom')])
+
+        self.assertIs(self.registry.item(2134), item)
+        self.assertIsNone(self.registry.item(1))
+        self.assertEqual(self.registry.grand_company(1).name, 'The Maelstrom')
+
+        self.registry.clear()
+        self.assertIsNone(self.registry.item(2134))
+        self.assertIsNone(self.registry.grand_companies())
@@ -0,0 +1,71 @@
+import unittest
+
+from fflogsapi.parsers import (FFLogsBuffStackEvent, FFLogsCalculatedDamageEvent, FFLogsDamageEvent,
+                               FFLogsEvent, parse_event, parse_events,)
+from fflogsapi.util import freeze
+
+
+class EventParserTest(unittest.TestCase):
+    '''
+    Test cases for parsing fight events into event classes.
+    '''
+
+    DAMAGE_EVENT = {
+        'timestamp': 1234,
+        'type': 'damage',
+        'sourceID': 1,
+        'targetID': 12,
+        'abilityGameID': 7,
+        'fight': 3,
+        'packetID': 55,
+        'amount': 4000,
+        'unmitigatedAmount': 4000,
+        'multiplier': 1.0,
+        'hitType': 2,
+        'directHit': True,
+        'sourceResources': {'hitPoints': 100},
+    }
+
+    def test_parse_event(self) -> None:
+        '''
+        Events should be parsed into the class of their type with their fields as attributes
+        '''
+        event = parse_event(self.DAMAGE_EVENT)
+        self.assertIsInstance(event, FFLogsDamageEvent)
+        self.assertEqual(event.timestamp, 1234)
+        self.assertEqual(event.source_id, 1)
+        self.assertEqual(event.target_id, 12)
+        self.assertEqual(event.ability_id, 7)
+        self.assertEqual(event.amount, 4000)
+        self.assertTrue(event.direct_hit)
+        self.assertIsNone(event.tick)
+        self.assertEqual(event.extra, {'sourceResources': {'hitPoints': 100}})
+
+        # no per-instance dictionary
+        self.assertFalse(hasattr(event, '__dict__'))
+
+    def test_round_trip(self) -> None:
+        '''
+        Converting a parsed event back to a dictionary should give the original event
+        '''
+        self.assertEqual(parse_event(self.DAMAGE_EVENT).to_dict(), self.DAMAGE_EVENT)
+        self.assertEqual(parse_event(freeze(self.DAMAGE_EVENT)), parse_event(self.DAMAGE_EVENT))
+
+    def test_parse_events(self) -> None:
+        '''
+        Events of different and unknown types should be parsed in order
+        '''
+        events = parse_events([
+            self.DAMAGE_EVENT,
+            {'timestamp': 1, 'type': 'calculateddamage', 'amount': 10},
+            {'timestamp': 2, 'type': 'applybuffstack', 'stack': 3},
+            {'timestamp': 3, 'type': 'somethingnew', 'value': 1},
+        ])
+        self.assertEqual(
+            [type(event) for event in events],
+            [FFLogsDamageEvent, FFLogsCalculatedDamageEvent, FFLogsBuffStackEvent, FFLogsEvent],
+        )
+        self.assertEqual(events[1].amount, 10)
+        self.assertEqual(events[2].stack, 3)
+        self.assertEqual(events[3].type, 'somethingnew')
+        self.assertEqual(events[3].extra, {'value': 1})
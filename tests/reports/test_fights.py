@@ -1,10 +1,16 @@
+import threading
 import unittest
+from time import monotonic
+from unittest import mock
 
 from fflogsapi.client import FFLogsClient
 from fflogsapi.constants import FightDifficulty, PartySize
-from fflogsapi.data import (FFLogsActor, FFLogsReportCharacterRanking, FFLogsReportComboRanking,
-                            FFLogsReportRanking,)
+from fflogsapi.data import (FFJob, FFLogsActor, FFLogsReportCharacterRanking,
+                            FFLogsReportComboRanking, FFLogsReportRanking,)
+from fflogsapi.reports.fight import FFLogsFight
 from fflogsapi.util.gql_enums import GQLEnum
+from fflogsapi.util.timeslicing import (merge_event_streams, partition_events, split_time_range,
+                                        stitch_event_windows,)
 from fflogsapi.world.encounter import FFLogsEncounter
 
 from ..config import CACHE_EXPIRY, CLIENT_ID, CLIENT_SECRET
@@ -107,6 +113,50 @@ class FightTest(unittest.TestCase):
         self.assertEqual(len(table['entries']), 2)
         self.assertEqual(table['entries'][0]['hitCount'], 2)
 
+    def test_table_engine(self) -> None:
+        '''
+        Tables computed locally should match the tables of the API
+        '''
+        filters = {
+            'dataType': GQLEnum('Casts'),
+            'abilityID': 7535,
+        }
+        table = self.fight.table(filters)
+        local_table = self.fight.table_engine().table(filters)
+
+        self.assertEqual(
+            sorted(entry['id'] for entry in local_table['entries']),
+            sorted(entry['id'] for entry in table['entries']),
+        )
+
+    def test_events_indexed(self) -> None:
+        '''
+        Indexed events should contain the same events as the event list
+        '''
+        events = self.fight.events()
+        index = self.fight.events_indexed()
+
+        self.assertEqual(index.events, events)
+        self.assertEqual(
+            index.find(type='cast'),
+            [event for event in events if event['type'] == 'cast'],
+        )
+
+    def test_aura_intervals(self) -> None:
+        '''
+        Aura uptimes computed locally should match the buffs table of the API
+        '''
+        table = self.fight.table({'dataType': GQLEnum('Buffs')})
+        auras = self.fight.aura_intervals().select(kind='Buffs')
+
+        for aura in table['auras'][:5]:
+            bands = auras.bands(ability_id=aura['guid'])
+            self.assertAlmostEqual(
+                bands.uptime(self.fight.start_time(), self.fight.end_time()),
+                aura['totalUptime'],
+                delta=1,
+            )
+
     def test_invalid_times(self) -> None:
         '''
         A fight should not allow you to fetch events before the fight has started
@@ -171,6 +221,51 @@ class FightTest(unittest.TestCase):
         self.assertIsInstance(events[0], dict)
         self.assertEqual(events[0]['type'], 'cast')
 
+    def test_iter_events(self) -> None:
+        '''
+        Streaming the events of a fight should give the same events as retrieving them all at once
+        '''
+        report = self.client.get_report('tgFNX14HGLBfWaCk')
+        kill_fight = report.fight(id=2)
+        filters = {
+            'dataType': GQLEnum('Casts'),
+            'useAbilityIDs': True,
+        }
+        events = kill_fight.events(filters=filters)
+
+        self.assertEqual(list(kill_fight.iter_events(filters=filters)), events)
+        self.assertEqual(list(kill_fight.iter_events(filters=filters, prefetch=False)), events)
+
+        # stopping early should not be a problem
+        stream = kill_fight.iter_events(filters=filters)
+        self.assertEqual(next(stream), events[0])
+        stream.close()
+
+    def test_event_windows(self) -> None:
+        '''
+        Fetching time windows of events in parallel should give the same events as paginating
+        '''
+        report = self.client.get_report('tgFNX14HGLBfWaCk')
+        kill_fight = report.fight(id=2)
+        filters = {
+            'dataType': GQLEnum('Casts'),
+            'useAbilityIDs': True,
+        }
+        events = kill_fight.events(filters=filters)
+        self.assertEqual(kill_fight.events(filters=filters, windows=4), events)
+
+    def test_events_columnar(self) -> None:
+        '''
+        The columnar events of a fight should match its events
+        '''
+        filters = {'dataType': GQLEnum('Casts')}
+        events = self.fight.events(filters=filters)
+        columns = self.fight.events_columnar(filters=filters)
+
+        self.assertEqual(len(columns), len(events))
+        self.assertEqual(columns['timestamp'].tolist(), [e['timestamp'] for e in events])
+        self.assertEqual(columns['source_id'].tolist(), [e['sourceID'] for e in events])
+
     def test_player_details(self) -> None:
         '''
         The client should be able to fetch player details for a fight
@@ -291,5 +386,234 @@ class FightTest(unittest.TestCase):
         self.assertEqual(ucob_phases[2].name, 'P3: Bahamut Prime')
 
 
+class EventWindowTest(unittest.TestCase):
+    '''
+    Test cases for splitting fights into time windows and joining their events.
+    '''
+
+    def test_split_time_range(self) -> None:
+        '''
+        Time windows should cover the whole time range without gaps
+        '''
+        windows = split_time_range(1000, 2000, 3)
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0][0], 1000)
+        self.assertEqual(windows[-1][1], 2000)
+        for (_, end), (start, _) in zip(windows[:-1], windows[1:]):
+            self.assertEqual(end, start)
+
+        self.assertEqual(split_time_range(1000, 1002, 8), [(1000, 1001), (1001, 1002)])
+        self.assertEqual(split_time_range(1000, 1000, 8), [(1000, 1000)])
+        with self.assertRaises(ValueError):
+            split_time_range(1000, 2000, 0)
+
+    def test_stitch_event_windows(self) -> None:
+        '''
+        Events on window boundaries should only be kept once
+        '''
+        first = [
+            {'timestamp': 1, 'type': 'cast'},
+            {'timestamp': 5, 'type': 'cast'},
+            {'timestamp': 5, 'type': 'damage'},
+        ]
+        second = [
+            {'timestamp': 5, 'type': 'damage'},
+            {'timestamp': 5, 'type': 'heal'},
+            {'timestamp': 5, 'type': 'cast'},
+            {'timestamp': 9, 'type': 'cast'},
+        ]
+
+        events = stitch_event_windows([first, [], second])
+        self.assertEqual(events, [
+            {'timestamp': 1, 'type': 'cast'},
+            {'timestamp': 5, 'type': 'cast'},
+            {'timestamp': 5, 'type': 'damage'},
+            {'timestamp': 5, 'type': 'heal'},
+            {'timestamp': 9, 'type': 'cast'},
+        ])
+
+    def test_merge_event_streams(self) -> None:
+        '''
+        Events fetched with different filters should be merged in timestamp order
+        '''
+        friendlies = [{'timestamp': 1, 'type': 'cast'}, {'timestamp': 5, 'type': 'damage'}]
+        enemies = [{'timestamp': 3, 'type': 'cast'}, {'timestamp': 5, 'type': 'cast'}]
+
+        self.assertEqual(merge_event_streams([friendlies, [], enemies]), [
+            friendlies[0], enemies[0], friendlies[1], enemies[1],
+        ])
+
+    def test_partition_events(self) -> None:
+        '''
+        Report events should be split into fights by their fight ID or timestamp
+        '''
+        events = [
+            {'timestamp': 5, 'type': 'cast'},
+            {'timestamp': 10, 'type': 'cast'},
+            {'timestamp': 15, 'type': 'cast', 'fight': 2},
+            {'timestamp': 25, 'type': 'cast'},
+            {'timestamp': 30, 'type': 'cast'},
+            {'timestamp': 40, 'type': 'cast', 'fight': 3},
+        ]
+
+        partitions = partition_events(events, [(2, 30, 50), (1, 10, 20)])
+        self.assertEqual(partitions, {
+            1: [events[1]],
+            2: [events[2], events[4]],
+        })
+
+
+class FightJobLookupTest(unittest.TestCase):
+    '''
+    Test cases for looking up the jobs of players in a fight.
+    '''
+
+    SAMURAI = FFJob(id=34, name='Samurai', slug='Samurai')
+    WHITE_MAGE = FFJob(id=24, name='White Mage', slug='WhiteMage')
+
+    def setUp(self) -> None:
+        self.report = mock.Mock()
+        self.client = mock.Mock()
+        self.client.jobs_by_slug.return_value = {
+            job.slug: job for job in (self.SAMURAI, self.WHITE_MAGE)
+        }
+        self.fight = FFLogsFight(report=self.report, fight_id=1, client=self.client)
+
+    def test_player_details(self) -> None:
+        '''
+        Player jobs should be looked up by slug, with unknown jobs marked as invalid
+        '''
+        self.report._query_data.return_value = {'playerDetails': {'data': {'playerDetails': {
+            'dps': [
+                {'id': 1, 'guid': 10, 'name': 'A', 'server': 'S', 'type': 'Samurai'},
+                {'id': 2, 'guid': 20, 'name': 'B', 'server': 'S', 'type': 'LimitBreak'},
+            ],
+        }}}}
+
+        details = self.fight.player_details()
+        self.assertEqual(details[0].job, self.SAMURAI)
+        self.assertEqual(details[1].job.slug, 'LimitBreak')
+
+    def test_rankings(self) -> None:
+        '''
+        Ranked jobs should be looked up by slug
+        '''
+        ranking = {
+            'amount': 1.0, 'rank': 1, 'best': 1, 'totalParses': 1, 'rankPercent': 100,
+        }
+        self.report._query_data.return_value = {'rankings': {'data': [{
+            'bracketData': 7.1, 'bracket': 1, 'deaths': 0, 'damageTakenExcludingTanks': 0,
+            'roles': {
+                'dps': {'characters': [{'id': 1, 'class': 'Samurai', **ranking}]},
+                'healers': {'characters': [{
+                    'id': 2, 'class': 'WhiteMage', 'id_2': 3, 'class_2': 'Samurai', **ranking,
+                }]},
+            },
+        }]}}
+
+        rankings = self.fight.rankings()
+        self.assertEqual(rankings.character_rankings[0].job, self.SAMURAI)
+        self.assertEqual(rankings.combo_rankings[0].job_a, self.WHITE_MAGE)
+        self.assertEqual(rankings.combo_rankings[0].job_b, self.SAMURAI)
+
+
+class FightAnalysisTest(unittest.TestCase):
+    '''
+    Test cases for analyzing the events of a fight locally.
+    '''
+
+    FRIENDLY_EVENTS = [
+        {'timestamp': 10, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'amount': 500},
+        {'timestamp': 30, 'type': 'damage', 'sourceID': 1, 'targetID': 10, 'amount': 700},
+    ]
+    ENEMY_EVENTS = [
+        {'timestamp': 20, 'type': 'damage', 'sourceID': 10, 'targetID': 1, 'amount': 300},
+    ]
+
+    def setUp(self) -> None:
+        self.report = mock.Mock()
+        self.report.actors.return_value = []
+        self.report.abilities.return_value = []
+        self.fight = FFLogsFight(report=self.report, fight_id=1, client=mock.Mock())
+        self.hostilities = []
+
+        def events(filters: dict) -> list[dict]:
+            hostility = repr(filters['hostilityType'])
+            self.hostilities.append(hostility)
+            return self.FRIENDLY_EVENTS if hostility == 'Friendlies' else self.ENEMY_EVENTS
+
+        for patch in (
+            mock.patch.object(self.fight, 'events', side_effect=events),
+            mock.patch.object(self.fight, 'start_time', return_value=0),
+            mock.patch.object(self.fight, 'end_time', return_value=40),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_table_engine(self) -> None:
+        '''
+        The table engine should include the events of enemies, in timestamp order
+        '''
+        engine = self.fight.table_engine()
+        self.assertEqual(sorted(self.hostilities), ['Enemies', 'Friendlies'])
+        self.assertEqual([event['timestamp'] for event in engine.events], [10, 20, 30])
+
+        taken = engine.table({'dataType': GQLEnum('DamageTaken')})['entries']
+        self.assertEqual([(entry['id'], entry['total']) for entry in taken], [(10, 1200), (1, 300)])
+        summary = engine.table()
+        self.assertEqual(
+            [(entry['id'], entry['total']) for entry in summary['damageTaken']],
+            [(10, 1200), (1, 300)],
+        )
+
+    def test_aura_intervals(self) -> None:
+        '''
+        Debuffs applied by enemies should have intervals
+        '''
+        self.ENEMY_EVENTS = [
+            {'timestamp': 15, 'type': 'applydebuff', 'sourceID': 10, 'targetID': 1,
+             'abilityGameID': 8},
+            {'timestamp': 25, 'type': 'removedebuff', 'sourceID': 10, 'targetID': 1,
+             'abilityGameID': 8},
+        ]
+
+        intervals = self.fight.aura_intervals()
+        self.assertEqual(sorted(self.hostilities), ['Enemies', 'Friendlies'])
+        self.assertEqual(list(intervals.bands(target_id=1, ability_id=8)), [(15, 25)])
+
+
+class EventIterationTest(unittest.TestCase):
+    '''
+    Test cases for iterating over fight events with background page prefetching.
+    '''
+
+    def test_close_pending(self) -> None:
+        '''
+        Closing the iterator should not wait for the page being fetched in the background
+        '''
+        fight = FFLogsFight(report=mock.Mock(), fight_id=1, client=mock.Mock())
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def events_page(filters: dict) -> dict:
+            if filters['startTime'] == 0:
+                return {'data': [{'timestamp': 0}], 'nextPageTimestamp': 10}
+            fetching.set()
+            release.wait(5)
+            return {'data': [{'timestamp': 10}], 'nextPageTimestamp': None}
+
+        try:
+            with mock.patch.object(fight, '_events_page', side_effect=events_page):
+                events = fight._iter_event_pages({'startTime': 0, 'endTime': 20}, prefetch=True)
+                self.assertEqual(next(events), {'timestamp': 0})
+                self.assertTrue(fetching.wait(5))
+
+                start = monotonic()
+                events.close()
+                self.assertLess(monotonic() - start, 1)
+        finally:
+            release.set()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,15 @@
+import json
+import os
+import re
+import tempfile
 import unittest
+from unittest import mock
 
 from fflogsapi.characters.character import FFLogsCharacter
 from fflogsapi.client import FFLogsClient
 from fflogsapi.data import FFLogsReportTag
 from fflogsapi.reports.fight import FFLogsFight
-from fflogsapi.reports.pages import FFLogsReportPage
+from fflogsapi.reports.pages import FFLogsReportPage, FFLogsReportPaginationIterator
 from fflogsapi.reports.report import FFLogsReport
 from fflogsapi.world.region import FFLogsRegion
 from fflogsapi.world.zone import FFLogsZone
@@ -64,6 +69,13 @@ class ReportTest(unittest.TestCase):
         self.assertGreater(len(abilities), 0)
         ability_ids = [ability.game_id for ability in abilities]
         self.assertIn(0, ability_ids)
+        self.assertIs(self.report.ability(game_id=abilities[0].game_id), abilities[0])
+        self.assertIsNone(self.report.ability(game_id=-1))
+        self.assertIsNone(self.report.actor(id=-1))
+
+        for actor in actors:
+            if actor.pet_owner is not None:
+                self.assertIn(actor, self.report.pets(owner_id=actor.pet_owner.id))
 
     def test_archivation_data(self) -> None:
         '''
@@ -108,6 +120,38 @@ class ReportTest(unittest.TestCase):
         for fight in self.report:
             self.assertIsInstance(last_fight, FFLogsFight)
 
+    def test_prefetch(self) -> None:
+        '''
+        Prefetching fight fields from a report should populate all fights in a single query.
+        '''
+        report = self.client.get_report(code=self.SPECIFIC_REPORT_CODE)
+        report.prefetch(fields=['name', 'kill', 'startTime'])
+
+        fights = list(report.fights())
+        self.assertEqual(len(fights), report.fight_count())
+        for fight in fights:
+            self.assertIn('name', fight._data)
+            self.assertIn('kill', fight._data)
+            self.assertIn('startTime', fight._data)
+            self.assertNotIn('endTime', fight._data)
+            self.assertEqual(fight.name(), fight._query_data('name')['name'])
+
+        fights[0].prefetch()
+        for field in fights[0].PREFETCH_FIELDS:
+            self.assertIn(field, fights[0]._data)
+
+    def test_events_by_fight(self) -> None:
+        '''
+        Events retrieved for the whole report should be the same as the events of each fight.
+        '''
+        report = self.client.get_report(code=self.SPECIFIC_REPORT_CODE)
+        fight_ids = [1, 2]
+        events = report.events_by_fight({'fightIDs': fight_ids})
+
+        self.assertEqual(sorted(events), fight_ids)
+        for fight_id in fight_ids:
+            self.assertEqual(events[fight_id], report.fight(fight_id).events())
+
     def test_nonexistent_fight(self) -> None:
         '''
         The client should return None when requesting a fight that does not exist.
@@ -210,6 +254,130 @@ class ReportPageTest(unittest.TestCase):
         report_one = page_one.__iter__().__next__()
         self.assertIsInstance(report_one, FFLogsReport)
 
+    def test_prefetch_pagination(self) -> None:
+        '''
+        Prefetching pages should give the same pages in the same order
+        '''
+        filters = {'guildID': self.GUILD_ID}
+        codes = [[report.code for report in page] for page in self.client.reports(filters)]
+        prefetched = [
+            [report.code for report in page]
+            for page in self.client.reports(filters, prefetch=2)
+        ]
+        self.assertEqual(prefetched, codes)
+
+    def test_bulk_pagination(self) -> None:
+        '''
+        Retrieving multiple pages per request should give the same pages in the same order
+        '''
+        filters = {'guildID': self.GUILD_ID}
+        codes = [[report.code for report in page] for page in self.client.reports(filters)]
+        bulk = [
+            [report.code for report in page]
+            for page in self.client.reports(filters, bulk=3)
+        ]
+        self.assertEqual(bulk, codes)
+
+    def test_page_range(self) -> None:
+        '''
+        The client should be able to iterate over a range of pages, and split pages into ranges
+        '''
+        report_pages = self.client.reports({'guildID': self.GUILD_ID})
+        ranges = report_pages.page_ranges(2)
+        self.assertEqual(ranges[0][0], 1)
+        self.assertEqual(ranges[-1][1], report_pages.last_page())
+
+        start, end = ranges[-1]
+        ranged = self.client.reports({'guildID': self.GUILD_ID}, start_page=start, end_page=end)
+        self.assertEqual([page.page_num for page in ranged], list(range(start, end + 1)))
+
+    def test_checkpoint(self) -> None:
+        '''
+        A checkpointed pagination should resume from the first unfinished page
+        '''
+        filters = {'guildID': self.GUILD_ID}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = os.path.join(tmp_dir, 'reports.json')
+            for page in self.client.reports(filters, checkpoint=checkpoint):
+                break
+
+            self.assertEqual(self.client.reports(filters, checkpoint=checkpoint).state()['page'], 2)
+            resumed = self.client.reports(filters, checkpoint=checkpoint)
+            resumed = [page.page_num for page in resumed]
+            self.assertEqual(resumed, list(range(2, self.client.reports(filters).last_page() + 1)))
+
+            with self.assertRaises(ValueError):
+                self.client.reports({'guildID': self.GUILD_ID + 1}, checkpoint=checkpoint)
+
+    def test_iter_objects(self) -> None:
+        '''
+        The client should be able to iterate over the reports of all pages directly
+        '''
+        report_pages = self.client.reports({'guildID': self.GUILD_ID})
+        reports = list(report_pages.iter_objects())
+
+        self.assertEqual(len(reports), sum(page.count() for page in report_pages))
+        self.assertTrue(all(isinstance(report, FFLogsReport) for report in reports))
+        self.assertEqual(report_pages.first_page().last_page, report_pages.last_page())
+
+
+class ReportPaginationCheckpointTest(unittest.TestCase):
+    '''
+    Test cases for checkpointed report paginations.
+    '''
+
+    LAST_PAGE = 3
+
+    def setUp(self) -> None:
+        self.client = mock.Mock()
+        self.client.q.side_effect = self.answer
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.tmp_dir.name, 'reports.json')
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def answer(self, query: str, ignore_cache: bool = False) -> dict:
+        page = int(re.search(r'page: (\d+)', query).group(1))
+        return {'reportData': {'reports': {
+            'from': page, 'to': page, 'last_page': self.LAST_PAGE,
+            'has_more_pages': page < self.LAST_PAGE, 'data': [{'code': str(page)}],
+        }}}
+
+    def saved_page(self) -> int:
+        with open(self.checkpoint, 'r', encoding='utf-8') as file:
+            return json.load(file)['page']
+
+    def test_finished_checkpoint(self) -> None:
+        '''
+        Iterating over a finished checkpointed pagination again should keep the checkpoint
+        '''
+        pages = FFLogsReportPaginationIterator(client=self.client, checkpoint=self.checkpoint)
+        self.assertEqual([page.page_num for page in pages], [1, 2, 3])
+        self.assertEqual(self.saved_page(), 4)
+
+        self.assertEqual(list(pages), [])
+        self.assertEqual(self.saved_page(), 4)
+
+        resumed = FFLogsReportPaginationIterator(client=self.client, checkpoint=self.checkpoint)
+        self.assertEqual(list(resumed), [])
+        self.assertEqual(self.saved_page(), 4)
+
+    def test_finished_range(self) -> None:
+        '''
+        A finished checkpointed page range should not retrieve pages past its end
+        '''
+        pages = FFLogsReportPaginationIterator(
+            client=self.client, end_page=2, checkpoint=self.checkpoint,
+        )
+        self.assertEqual([page.page_num for page in pages], [1, 2])
+
+        self.client.q.reset_mock()
+        resumed = FFLogsReportPaginationIterator(client=self.client, checkpoint=self.checkpoint)
+        self.assertEqual(list(resumed), [])
+        self.client.q.assert_not_called()
+        self.assertEqual(self.saved_page(), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from fflogsapi.client import FFLogsClient
+from fflogsapi.data import FFLogsPartition
+from fflogsapi.world.snapshot import FFLogsWorldSnapshot
+from fflogsapi.world.zone import FFLogsZone
+
+
+class WorldSnapshotTest(unittest.TestCase):
+    '''
+    Test cases for offline world data snapshots.
+    '''
+
+    ZONE_ID = 49
+
+    def setUp(self) -> None:
+        zone = FFLogsZone(id=self.ZONE_ID)
+        self.name_query = zone._format_query('name')
+        self.partitions_query = zone._format_query('partitions{ id, name, compactName, default }')
+        self.snapshot = FFLogsWorldSnapshot(results={
+            self.name_query: {'worldData': {'zone': {'name': 'Abyssos'}}},
+            self.partitions_query: {'worldData': {'zone': {'partitions': [
+                {'id': 1, 'name': 'Standard', 'compactName': 'S', 'default': True},
+            ]}}},
+        }, created=1700000000)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'world.json.gz')
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_lookup(self) -> None:
+        '''
+        Query results should be looked up by query
+        '''
+        self.assertEqual(len(self.snapshot), 2)
+        self.assertIn(self.name_query, self.snapshot)
+        self.assertEqual(self.snapshot.get(self.name_query)['worldData']['zone']['name'], 'Abyssos')
+        self.assertIsNone(self.snapshot.get('query { rateLimitData { pointsSpentThisHour } }'))
+
+        self.snapshot.record('query { a }', {'a': 1})
+        self.assertEqual(self.snapshot.get('query { a }'), {'a': 1})
+
+    def test_save_load(self) -> None:
+        '''
+        A saved snapshot should be loaded with the same results
+        '''
+        self.snapshot.save(self.path)
+        loaded = FFLogsWorldSnapshot.load(self.path)
+
+        self.assertEqual(loaded.created, 1700000000)
+        self.assertEqual(len(loaded), len(self.snapshot))
+        for query in (self.name_query, self.partitions_query):
+            self.assertEqual(loaded.get(query), self.snapshot.get(query))
+
+    def test_load_unsupported(self) -> None:
+        '''
+        Loading a file that is not a supported snapshot should raise an error
+        '''
+        with gzip.open(self.path, 'wt', encoding='utf-8') as file:
+            json.dump({'version': -1, 'created': 0, 'results': {}}, file)
+
+        with self.assertRaises(ValueError):
+            FFLogsWorldSnapshot.load(self.path)
+
+    def test_client(self) -> None:
+        '''
+        Clients should answer lookups in the snapshot without querying the API
+        '''
+        self.snapshot.save(self.path)
+        client = FFLogsClient('id', 'secret', enable_caching=False, world_snapshot=self.path)
+        try:
+            with mock.patch.object(client, '_execute', side_effect=AssertionError):
+                zone = client.get_zone(id=self.ZONE_ID)
+                self.assertEqual(zone.name(), 'Abyssos')
+                self.assertEqual(zone.partitions(), [
+                    FFLogsPartition(id=1, name='Standard', compact_name='S', default=True),
+                ])
+        finally:
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()